@@ -0,0 +1,74 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+"""
+Benchmark of the time codec against the regex and format functions.
+
+Run the benchmark (numpy required for the batch functions):
+    $ python benchmark_time_codec.py -n 100000
+
+"""
+
+import random
+import re
+import timeit
+from pynairus.helpers import time_codec
+
+# regex of the former parse_time_string.
+TIME_PARSING_REGEX = re.compile(
+    r"((?P<hour>[\d]+)h)?((?P<minute>[\d]+)m)?(?P<second>[\d]+)s")
+
+
+def reference_format(timestamp):
+    """Format the time like the former convert_seconds_to_time."""
+    secs = timestamp % 60
+    tmp_mins = timestamp // 60 % 60
+    mins = f"{tmp_mins:02d}m" if tmp_mins > 0 else ""
+    tmp_hours = timestamp // 60 // 60
+    hours = f"{tmp_hours}h" if tmp_hours > 0 else ""
+
+    return f"{hours}{mins}{secs:02d}s"
+
+
+def reference_parse(time):
+    """Parse the time like the former parse_time_string."""
+    result = TIME_PARSING_REGEX.fullmatch(time)
+    hour = int(result.group("hour")) if result.group("hour") is not None else 0
+    minute = int(result.group("minute")) if result.group(
+        "minute") is not None else 0
+    second = int(result.group("second"))
+
+    return (hour, minute, second)
+
+
+def measure(label, reference, codec):
+    """Print the best times of the reference and the codec."""
+    reference_time = min(timeit.repeat(reference, number=1, repeat=5))
+    codec_time = min(timeit.repeat(codec, number=1, repeat=5))
+    print(f"{label:<14} reference: {reference_time:8.4f}s  "
+          f"codec: {codec_time:8.4f}s  "
+          f"speedup: x{reference_time / codec_time:.1f}")
+
+
+if __name__ == "__main__":
+    import argparse
+    PARSER = argparse.ArgumentParser()
+    PARSER.add_argument("-n", "--number", type=int, default=100000,
+                        help="Number of times to convert")
+    ARGS = PARSER.parse_args()
+
+    TIMESTAMPS = [random.randint(1, time_codec.DAY_SECONDS)
+                  for _ in range(ARGS.number)]
+    TIMES = [reference_format(timestamp) for timestamp in TIMESTAMPS]
+
+    # build the lookup tables before measuring
+    time_codec.format_times([1])
+
+    measure("format", lambda: [reference_format(t) for t in TIMESTAMPS],
+            lambda: [time_codec.format_time(t) for t in TIMESTAMPS])
+    measure("parse", lambda: [reference_parse(t) for t in TIMES],
+            lambda: [time_codec.parse_time(t) for t in TIMES])
+    measure("format batch", lambda: [reference_format(t) for t in TIMESTAMPS],
+            lambda: time_codec.format_times(TIMESTAMPS))
+    measure("parse batch", lambda: [reference_parse(t) for t in TIMES],
+            lambda: time_codec.parse_times(TIMES))
@@ -0,0 +1,295 @@
+# coding: utf-8
+
+"""Bulk generation module of exercise banks.
+
+The numpy module is required to use it.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from .errors.app_error import BadArgumentError
+from .pymath import get_quotas
+from .strategies import operator_strategy as ns_os
+from .strategies.operation_batch import OperationBatch, OPERATOR_KEYS
+
+# numpy draws hypergeometric counts only from populations below this size.
+HYPERGEOMETRIC_LIMIT = 10 ** 9
+
+
+def swap_operands(operator, start, end, firsts, seconds, rng):
+    """Swap at random the operands of commutative operations.
+
+    The canonical spaces put the larger operand first: like in
+    UniqueSampler, each operation is swapped with a chance of one in two,
+    if the swapped operation is in the range.
+
+    :param operator: the key of the operator
+    :param start:    start range
+    :param end:      end range
+    :param firsts:   the first operands
+    :param seconds:  the second operands
+    :param rng:      the random generator of the swaps
+
+    :type operator: str
+    :type start:    int
+    :type end:      int
+    :type firsts:   numpy.ndarray
+    :type seconds:  numpy.ndarray
+    :type rng:      numpy.random.Generator
+
+    :return: tuple of numpy arrays (firsts, seconds)
+    """
+    strategy = ns_os.STRATEGIES[operator]
+    if not strategy.validator.commutative:
+        return firsts, seconds
+
+    layout = strategy.get_layout(start, end)
+    swapped = ((rng.random(len(firsts)) < 0.5) & (firsts != seconds)
+               & layout.contains_array(seconds, firsts))
+    firsts, seconds = firsts.copy(), seconds.copy()
+    firsts[swapped], seconds[swapped] = seconds[swapped], firsts[swapped]
+    return firsts, seconds
+
+
+def generate_shard(operator, start, end, shard, count, seed):
+    """Draw distinct operations from a shard of an operation space.
+
+    Executed in the worker processes.
+    The operands of the commutative operations are swapped at random
+    (see swap_operands).
+
+    :param operator: the key of the operator
+    :param start:    start range
+    :param end:      end range
+    :param shard:    the (first index, last index) of the shard in the space
+    :param count:    the number of operations to draw
+    :param seed:     the seed of the random stream of the shard
+
+    :type operator: str
+    :type start:    int
+    :type end:      int
+    :type shard:    tuple
+    :type count:    int
+    :type seed:     numpy.random.SeedSequence
+
+    :return: tuple of numpy arrays (firsts, seconds)
+    """
+    import numpy
+    space = ns_os.get_operation_space(operator, start, end,
+                                      canonical=True)[slice(*shard)]
+    rng = numpy.random.default_rng(seed)
+
+    firsts, seconds = space.get_operands_array(rng.choice(len(space), count,
+                                                          replace=False))
+    return swap_operands(operator, start, end, firsts, seconds, rng)
+
+
+def split_quota(sizes, quota, rng):
+    """Split a quota of distinct operations between the shards of a space.
+
+    The count of each shard is drawn one after another,
+    like the counts of `quota` distinct indexes drawn from the whole space.
+    Once the populations are too large for numpy's hypergeometric
+    draws, the indexes of the other shards are drawn and counted.
+
+    :param sizes: the number of operations of each shard
+    :param quota: the number of operations to draw
+    :param rng:   the random generator of the split
+
+    :type sizes: list
+    :type quota: int
+    :type rng:   numpy.random.Generator
+
+    :return: list of int
+    """
+    import numpy
+
+    counts = []
+    remaining = sum(sizes)
+    for position, size in enumerate(sizes):
+        remaining -= size
+        if max(size, remaining) >= HYPERGEOMETRIC_LIMIT:
+            # draw the indexes of the other shards and count them by shard
+            sizes = sizes[position:]
+            indexes = rng.choice(sum(sizes), quota, replace=False)
+            bounds = numpy.cumsum(sizes)
+            return counts + numpy.bincount(
+                numpy.searchsorted(bounds, indexes, side="right"),
+                minlength=len(sizes)).tolist()
+
+        count = int(rng.hypergeometric(size, remaining, quota)) \
+            if quota and size else 0
+        counts.append(count)
+        quota -= count
+
+    return counts
+
+
+def get_answer_key(operator, first, second):
+    """Return the answer key of the operation of an operator.
+
+    :param operator: the key of the operator
+    :param first:    the first operand
+    :param second:   the second operand
+
+    :type operator: str
+    :type first:    int
+    :type second:   int
+
+    :return: int (see pack_operation)
+    """
+    return ns_os.pack_operation(
+        ns_os.STRATEGIES[operator].build_operation(first, second))
+
+
+def deduplicate_bank(bank, start, end, rng):
+    """Redraw the questions asked by many operators of a bank.
+
+    The operators sharing a validator (like × and n×) ask the same
+    questions: the operations of a question already in the bank
+    are redrawn from the space of their operator,
+    then their operands are swapped at random (see swap_operands).
+
+    :param bank:  the bank of operations, distinct by operator
+    :param start: start range
+    :param end:   end range
+    :param rng:   the random generator of the redraws
+
+    :type bank:  OperationBatch
+    :type start: int
+    :type end:   int
+    :type rng:   numpy.random.Generator
+
+    :return: OperationBatch
+
+    :raise: BadArgumentError if there are not enough distinct questions
+    """
+    import numpy
+
+    # group the operators of the bank by question
+    groups = {}
+    for code in numpy.unique(bank.codes).tolist():
+        operator = OPERATOR_KEYS[code]
+        validator = ns_os.STRATEGIES[operator].get_validator()
+        groups.setdefault(ns_os.get_validator_code(validator),
+                          []).append(code)
+
+    for codes in groups.values():
+        if len(codes) < 2:
+            continue
+
+        seen = set()
+        duplicates = []
+        for index in numpy.flatnonzero(numpy.isin(bank.codes, codes)):
+            operator = OPERATOR_KEYS[bank.codes[index]]
+            answer_key = get_answer_key(operator, int(bank.firsts[index]),
+                                        int(bank.seconds[index]))
+            if answer_key in seen:
+                duplicates.append((index, operator))
+            else:
+                seen.add(answer_key)
+
+        # the spaces are visited in a random order, once
+        candidates = {}
+        for index, operator in duplicates:
+            if operator not in candidates:
+                space = ns_os.get_operation_space(operator, start, end,
+                                                  canonical=True)
+                candidates[operator] = (space, iter(
+                    rng.permutation(len(space)).tolist()))
+
+            space, order = candidates[operator]
+            for candidate in order:
+                first, second = space.get_operands(candidate)
+                answer_key = get_answer_key(operator, first, second)
+                if answer_key not in seen:
+                    seen.add(answer_key)
+                    bank.firsts[index], bank.seconds[index] = first, second
+                    break
+            else:
+                raise BadArgumentError(
+                    f"not enough distinct questions with the operators \
+{', '.join(OPERATOR_KEYS[code] for code in codes)}")
+
+        # the redrawn operations are canonical too
+        for operator in candidates:
+            indexes = [index for index, duplicate_operator in duplicates
+                       if duplicate_operator == operator]
+            bank.firsts[indexes], bank.seconds[indexes] = swap_operands(
+                operator, start, end, bank.firsts[indexes],
+                bank.seconds[indexes], rng)
+
+    return bank
+
+
+def generate_bank(start, end, limit, operators=None, workers=None,
+                  seed=None):
+    """Generate a bank of distinct questions over a pool of processes.
+
+    The operations are split between the operators like in pymath,
+    then the space of each operator is split in disjoint shards,
+    so the operations drawn by the workers never overlap.
+    The questions asked by many operators are redrawn after the merge
+    (see deduplicate_bank).
+
+    :param start:     start range
+    :param end:       end range
+    :param limit:     the number of operations to generate
+    :param operators: the operators to alternate (default: ('+', '-'))
+    :param workers:   the number of processes (default: number of cpus)
+    :param seed:      the seed of the bank
+
+    :type start:     int
+    :type end:       int
+    :type limit:     int
+    :type operators: tuple
+    :type workers:   int
+    :type seed:      int
+
+    :return: OperationBatch
+
+    :raise: BadArgumentError if there are not enough distinct operations
+    """
+    import numpy
+
+    if operators is None:
+        operators = (ns_os.ADD_OPERATOR_KEY, ns_os.SUB_OPERATOR_KEY)
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    seed_sequence = numpy.random.SeedSequence(seed)
+    rng = numpy.random.default_rng(seed_sequence.spawn(1)[0])
+
+    # split the quota of each operator between the shards of its space
+    tasks = []
+    quotas = get_quotas(operators, limit)
+    for operator, quota in quotas.items():
+        size = len(ns_os.get_operation_space(operator, start, end,
+                                             canonical=True))
+        if quota > size:
+            raise BadArgumentError(
+                f"{quota} distinct operations requested with the operator \
+{operator}: only {size} available")
+
+        bounds = [size * shard // workers for shard in range(workers + 1)]
+        counts = split_quota(
+            [high - low for low, high in zip(bounds, bounds[1:])], quota, rng)
+        for low, high, count in zip(bounds, bounds[1:], counts):
+            if count > 0:
+                tasks.append((operator, start, end, (low, high), count))
+
+    seeds = seed_sequence.spawn(len(tasks))
+    if workers > 1 and len(tasks) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(generate_shard, *zip(*tasks), seeds))
+    else:
+        results = [generate_shard(*task, task_seed)
+                   for task, task_seed in zip(tasks, seeds)]
+
+    # merge the shards in a random order
+    bank = OperationBatch.concatenate(
+        OperationBatch.from_operands(task[0], *result)
+        for task, result in zip(tasks, results))
+    bank = deduplicate_bank(bank, start, end, rng)
+    return bank[rng.permutation(len(bank))]
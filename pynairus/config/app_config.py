@@ -2,27 +2,120 @@
 
 """Application config module"""
 
+import atexit
 import os
+import queue
 from pathlib import Path
 import logging
 import logging.config
+import logging.handlers
 from ..helpers.file_helper import get_file_path
 from ..helpers.string_helper import get_bool_from_str
 from ..errors.app_error import BadArgumentError
 from ..config import CONFIG_FOLDER
+from .log_loader import configure_logger, read_log_config
+from .log_rotation import RotatingLogHandler, install_rotation, read_rotation
+from .log_sampling import LogSampler, get_message_key, read_sampling
+
+# max number of records written by batch in the queued logging.
+QUEUE_BATCH_SIZE = 100
+
+# emit methods of the handlers writing the batches in their stream at once,
+# the handlers overriding emit (like the rotating ones) write record by record.
+BATCH_EMITS = (logging.StreamHandler.emit, logging.FileHandler.emit)
+
+
+class BatchQueueListener(logging.handlers.QueueListener):
+    """Queue listener writing the records by batches.
+
+    The records waiting in the queue are written together,
+    then the stream and file handlers are flushed once by batch.
+    """
+
+    def __init__(self, queue, *handlers, batch_size=QUEUE_BATCH_SIZE):
+        """Init the listener.
+
+        :param queue:      the queue of the records
+        :param handlers:   the handlers of the records
+        :param batch_size: the max number of records by batch
+
+        :type queue:      queue.SimpleQueue
+        :type handlers:   logging.Handler
+        :type batch_size: int
+        """
+        super().__init__(queue, *handlers, respect_handler_level=True)
+        self.batch_size = batch_size
+
+    def _monitor(self):
+        """Write the records of the queue until the sentinel."""
+        while True:
+            # wait for a record, then take the other records waiting
+            records = [self.dequeue(True)]
+            while len(records) < self.batch_size:
+                try:
+                    records.append(self.dequeue(False))
+                except queue.Empty:
+                    break
+
+            stop = records[-1] is self._sentinel
+            if stop:
+                records.pop()
+
+            self.handle_batch([self.prepare(record) for record in records])
+            if stop:
+                break
+
+    def handle_batch(self, records):
+        """Write a batch of records with each handler.
+
+        :param records: the records prepared
+
+        :type records: list
+        """
+        for handler in self.handlers:
+            records_handled = [record for record in records
+                               if record.levelno >= handler.level
+                               and handler.filter(record)]
+            if not records_handled:
+                continue
+
+            stream = getattr(handler, "stream", None)
+            if type(handler).emit not in BATCH_EMITS or stream is None:
+                # the other handlers write the records one by one
+                for record in records_handled:
+                    handler.handle(record)
+                continue
+
+            handler.acquire()
+            try:
+                stream.write("".join(
+                    handler.format(record) + handler.terminator
+                    for record in records_handled))
+                handler.flush()
+            except Exception:
+                handler.handleError(records_handled[0])
+            finally:
+                handler.release()
 
 
 class LoggerWrapper():
     """Wrapper for logger."""
 
-    def __init__(self, logger, log_enabled):
+    def __init__(self, logger, log_enabled, queue_enabled=False,
+                 rotation=None, sampling=None):
         """Init the attributes.
 
-        :param log_enabled: Activate the logging and raising exception
-        :param logger: The app logger instance
-
-        :type log_enabled: bool
-        :type logger: logging.Logger
+        :param log_enabled:   Activate the logging and raising exception
+        :param logger:        The app logger instance
+        :param queue_enabled: Write the records in a background thread
+        :param rotation:      Rotate the log files (see read_rotation)
+        :param sampling:      Sample the messages (see read_sampling)
+
+        :type log_enabled:   bool
+        :type logger:        logging.Logger
+        :type queue_enabled: bool
+        :type rotation:      dict
+        :type sampling:      dict
         """
         if not isinstance(logger, logging.Logger):
             raise BadArgumentError(f"logger must be an instance of Logger class: \
@@ -30,23 +123,104 @@ class LoggerWrapper():
 
         self.logger = logger
         self.log_enabled = log_enabled
+        self.queue_enabled = queue_enabled
+        self.listener = None
+        self.sampler = None if sampling is None else LogSampler(**sampling)
         logging.raiseExceptions = log_enabled
+        if rotation is not None:
+            install_rotation(logger, rotation)
 
-    def log(self, level, *args, **kwargs):
-        if self.log_enabled:
-            self.logger.log(level, *args, **kwargs)
+        if queue_enabled:
+            self.start_queue()
 
-    def debug(self, *args, **kwargs):
-        if self.log_enabled:
-            self.logger.debug(*args, **kwargs)
+    def start_queue(self):
+        """Route the records of the logger through a queue.
 
-    def info(self, *args, **kwargs):
-        if self.log_enabled:
-            self.logger.info(*args, **kwargs)
+        The handlers of the logger are moved to a listener,
+        which writes the records by batches in a background thread,
+        so the logging calls never wait for the file I/O.
+        """
+        if self.listener is not None:
+            return
 
-    def warning(self, *args, **kwargs):
-        if self.log_enabled:
-            self.logger.warning(*args, **kwargs)
+        records = queue.SimpleQueue()
+        handlers = list(self.logger.handlers)
+        self.listener = BatchQueueListener(records, *handlers)
+        for handler in handlers:
+            self.logger.removeHandler(handler)
+
+        self.logger.addHandler(logging.handlers.QueueHandler(records))
+        self.listener.start()
+        atexit.register(self.stop_queue)
+
+    def stop_queue(self):
+        """Write the records queued and give the handlers back to the logger.
+        """
+        if self.listener is None:
+            return
+
+        listener = self.listener
+        self.listener = None
+        listener.stop()
+        atexit.unregister(self.stop_queue)
+        for handler in list(self.logger.handlers):
+            if isinstance(handler, logging.handlers.QueueHandler):
+                self.logger.removeHandler(handler)
+
+        for handler in listener.handlers:
+            self.logger.addHandler(handler)
+
+    def is_enabled_for(self, level):
+        """Check if the records of a level are logged.
+
+        :param level: the level of the records
+
+        :type level: int
+
+        :return: bool
+        """
+        return self.log_enabled and self.logger.isEnabledFor(level)
+
+    def log(self, level, msg, *args, **kwargs):
+        """Log a message if its level is enabled.
+
+        The message is formatted only if it is logged:
+        pass the values in the %-style args,
+        or a callable returning the message.
+        With sampling, the debug messages (up to the sample level)
+        are suppressed by message key (see LogSampler).
+
+        :param level: the level of the message
+        :param msg:   the message or a callable returning it
+        :param args:  the args of the %-style message
+
+        :type level: int
+        :type msg:   str|callable
+        :type args:  tuple
+        """
+        if not (self.log_enabled and self.logger.isEnabledFor(level)):
+            return
+
+        if self.sampler is not None and self.sampler.samples(level):
+            if self.sampler.summary_due():
+                self.log_summary()
+
+            if not self.sampler.allow(get_message_key(msg)):
+                return
+
+        if callable(msg):
+            msg = msg()
+
+        self.logger.log(level, msg, *args, **kwargs)
+
+    def debug(self, msg, *args, **kwargs):
+        self.log(logging.DEBUG, msg, *args, **kwargs)
+
+    def info(self, msg, *args, **kwargs):
+        self.log(logging.INFO, msg, *args, **kwargs)
+
+    def warning(self, msg, *args, **kwargs):
+        self.log(logging.WARNING, msg, *args, **kwargs)
 
     def error(self, *args, **kwargs):
         if self.log_enabled:
@@ -62,26 +236,49 @@ class LoggerWrapper():
             self.logger.critical(msg, exc_info=exception, **kwargs)
             raise exception
 
+    def log_summary(self):
+        """Log the counts of the messages suppressed since the last summary.
+        """
+        if self.sampler is None:
+            return
+
+        summary = self.sampler.pop_summary()
+        if summary and self.log_enabled:
+            self.logger.info(
+                "%d log messages suppressed: %s", sum(summary.values()),
+                ", ".join(f"{key!r} x{count}"
+                          for key, count in summary.items()))
+
     def close(self):
-        """Close the handlers of the logger."""
+        """Log the last summary, stop the queue and close the handlers."""
+        self.log_summary()
+        self.stop_queue()
         for handler in self.logger.handlers:
             handler.close()
 
     def clear(self):
-        """Clear the log file content."""
+        """Clear the log file content.
+
+        A rotating log file is rotated instead of truncated.
+        """
         # free the resourse
         self.close()
 
-        log_file = None
+        log_handler = None
         for handler in self.logger.handlers:
             if isinstance(handler, logging.FileHandler):
-                log_file = handler.baseFilename
+                log_handler = handler
                 break
 
-        if log_file is not None:
-            with open(log_file, mode="w") as f:
+        if isinstance(log_handler, RotatingLogHandler):
+            log_handler.doRollover()
+        elif log_handler is not None:
+            with open(log_handler.baseFilename, mode="w") as f:
                 f.truncate()
 
+        if self.queue_enabled:
+            self.start_queue()
+
 
 class AppLogger():
     """Descriptor for the app logger."""
@@ -103,17 +300,25 @@ class AppLogger():
 class AppConfig():
     """Application config class."""
 
-    def __init__(self, logger, log_enabled=False, clear_onstart=False):
+    def __init__(self, logger, log_enabled=False, clear_onstart=False,
+                 queue_enabled=False, rotation=None, sampling=None):
         """Constructor.
 
-        :param log_enabled: Activate the logging and raising exception
-        :param logger: The app logger instance
-
-        :type log_enabled: bool
-        :type logger: logging.Logger
+        :param log_enabled:   Activate the logging and raising exception
+        :param logger:        The app logger instance
+        :param queue_enabled: Write the log in a background thread
+        :param rotation:      Rotate the log files (see read_rotation)
+        :param sampling:      Sample the log messages (see read_sampling)
+
+        :type log_enabled:   bool
+        :type logger:        logging.Logger
+        :type queue_enabled: bool
+        :type rotation:      dict
+        :type sampling:      dict
         """
         self.log_enabled = log_enabled
-        self.logger = LoggerWrapper(logger, log_enabled)
+        self.logger = LoggerWrapper(logger, log_enabled, queue_enabled,
+                                    rotation, sampling)
         self.clear_onstart = clear_onstart
 
     @property
@@ -176,14 +381,13 @@ def parse_yml(filepath=None):
     log_config_name = log_config.get("config_name")
     log_config_path = get_file_path(Path(CONFIG_FOLDER, log_config_name))
 
-    with open(log_config_path, "r") as log_config_file:
-        yml_log_config = yaml.load(log_config_file)
-
-        logging.config.dictConfig(yml_log_config)
-        logger = logging.getLogger(logger_name)
-        return AppConfig(logger,
-                         log_enabled=log_enabled,
-                         clear_onstart=clear_onstart)
+    logger = configure_logger(read_log_config(log_config_path), logger_name)
+    return AppConfig(logger,
+                     log_enabled=log_enabled,
+                     clear_onstart=clear_onstart,
+                     queue_enabled=log_config.get("queue", False),
+                     rotation=read_rotation(log_config),
+                     sampling=read_sampling(log_config))
 
 
 def parse_ini(filepath=None):
@@ -218,9 +422,14 @@ def parse_ini(filepath=None):
         clear_onstart = config_parser.getboolean("log", "clear_onstart")
         config_name = config_parser.get("log", "config_name")
         logger_name = config_parser.get("log", "logger_name")
+        queue_enabled = config_parser.getboolean("log", "queue",
+                                                 fallback=False)
+        rotation = read_rotation(config_parser["log"])
+        sampling = read_sampling(config_parser["log"])
 
         return AppConfig(__init_logger(config_name, logger_name),
-                         log_enabled, clear_onstart)
+                         log_enabled, clear_onstart, queue_enabled, rotation,
+                         sampling)
 
 
 def parse_json(filepath=None):
@@ -247,11 +456,18 @@ def parse_json(filepath=None):
         if "log" not in config_datas:
             raise KeyError("[log] section is missing")
 
-        log_enabled, config_name, logger_name, \
-            clear_onstart = config_datas.get("log").values()
+        log_config = config_datas.get("log")
+        log_enabled = log_config.get("enabled")
+        config_name = log_config.get("config_name")
+        logger_name = log_config.get("logger_name")
+        clear_onstart = log_config.get("clear_onstart")
+        queue_enabled = log_config.get("queue", False)
+        rotation = read_rotation(log_config)
+        sampling = read_sampling(log_config)
 
         return AppConfig(__init_logger(config_name, logger_name),
-                         log_enabled, clear_onstart)
+                         log_enabled, clear_onstart, queue_enabled, rotation,
+                         sampling)
 
 
 def parse_xml(filepath=None):
@@ -282,15 +498,25 @@ def parse_xml(filepath=None):
         logger_name = xml_app_config.log.logger_name.string
         clear_onstart = get_bool_from_str(
             xml_app_config.log.clear_onstart.string)
+        queue_enabled = xml_app_config.log.queue is not None \
+            and get_bool_from_str(xml_app_config.log.queue.string)
+        log_values = {tag.name: tag.string for tag
+                      in xml_app_config.log.find_all(recursive=False)}
+        rotation = read_rotation(log_values)
+        sampling = read_sampling(log_values)
 
         return AppConfig(__init_logger(config_name, logger_name),
-                         log_enabled, clear_onstart)
+                         log_enabled, clear_onstart, queue_enabled, rotation,
+                         sampling)
 
 
 def __init_logger(config_name, logger_name):
-    """Init the app logger with ini config.
+    """Init the app logger with its ini or yaml log config.
     Internal function, do not call !
 
+    Only the app logger is configured, so the loggers
+    of the other app configs keep working.
+
     :param config_name:   the name of the config file
     :param logger_name:   the name of the app logger
 
@@ -300,5 +526,5 @@ def __init_logger(config_name, logger_name):
 
     :return: logging.Logger
     """
-    logging.config.fileConfig(Path(CONFIG_FOLDER, config_name))
-    return logging.getLogger(logger_name)
+    log_config = read_log_config(Path(CONFIG_FOLDER, config_name))
+    return configure_logger(log_config, logger_name)
@@ -2,11 +2,14 @@
 
 """Application context module."""
 
+import collections
+import contextvars
 import re
+import threading
 from pathlib import Path
 from .. import config
 from . import app_config as af
-from ..errors.app_error import ConfigError
+from ..errors.app_error import BadArgumentError, ConfigError
 
 
 # regex for detecting the type of config to load
@@ -22,47 +25,54 @@ CONFIG_PARSER_DICT = {
 }
 
 
-class AppContext():
-    """Application context holder class."""
-
-    # singleton of the class
-    __singleton = None
+# default max number of configs kept in the registry.
+DEFAULT_REGISTRY_SIZE = 32
 
-    def __new__(cls, *args, **kwargs):
-        """Return the singleton of application context."""
-        # if there is no singleton, we create one.
-        if cls.__singleton is None:
-            instance = object.__new__(cls)
+# application context of the current thread or asyncio task.
+CURRENT_APP_CONTEXT = contextvars.ContextVar("app_context", default=None)
 
-            # store the positional args.
-            instance.app_config, *_ = args
-            instance.start = kwargs.get("start")
-            instance.end = kwargs.get("end")
-            instance.limit = kwargs.get("limit")
 
-            # clean the positional args.
-            [kwargs.pop(key) for key in ['start', 'end', 'limit']]
-
-            # store the optionnal args.
-            instance.options = kwargs
+class AppContext():
+    """Application context holder class.
 
-            # store the singleton in the class property.
-            cls.__singleton = instance
+    Each thread or asyncio task has its own current context
+    (see get_app_context), so many sessions can run at once.
+    """
 
-        return cls.__singleton
+    def __init__(self, app_config, start=None, end=None, limit=None,
+                 **kwargs):
+        """Init the context.
+
+        :param app_config: the application config
+        :param start:      start range
+        :param end:        end range
+        :param limit:      max operations to generate
+        :param kwargs:     the optional args
+
+        :type app_config: AppConfig
+        :type start:      int
+        :type end:        int
+        :type limit:      int
+        :type kwargs:     dict
+        """
+        self.app_config = app_config
+        self.start = start
+        self.end = end
+        self.limit = limit
+        self.options = kwargs
 
     @classmethod
     def get_instance(cls):
         """
-        Return the singleton of AppContext.
+        Return the context of the current thread or asyncio task.
 
-        :return AppContext: the singleton of AppContext
+        :return AppContext: the current context or None
         """
-        return cls.__singleton
+        return CURRENT_APP_CONTEXT.get()
 
     @classmethod
     def clearContext(cls):
-        cls.__singleton = None
+        CURRENT_APP_CONTEXT.set(None)
 
     @property
     def app_config(self):
@@ -154,53 +164,208 @@ def get_config_parser(config_name=None):
     return CONFIG_PARSER_DICT[ext_file]
 
 
-def init_app_context(**kwargs):
-    """Init the application context.
+def get_app_context():
+    """Return the context of the current thread or asyncio task.
 
-    :param kwargs: the application options
+    :return: AppContext|None
+    """
+    return CURRENT_APP_CONTEXT.get()
 
-    :type kwargs: dict
 
-    :return: AppContext
+def set_app_context(app_context):
+    """Set the context of the current thread or asyncio task.
+
+    The asyncio tasks created afterwards start with this context.
+
+    :param app_context: the new context
+
+    :type app_context: AppContext
+
+    :return: contextvars.Token to restore the former context
+    """
+    return CURRENT_APP_CONTEXT.set(app_context)
+
+
+def reset_app_context(token):
+    """Restore the context replaced by set_app_context.
+
+    :param token: the token returned by set_app_context
+
+    :type token: contextvars.Token
+    """
+    CURRENT_APP_CONTEXT.reset(token)
+
+
+def load_app_config(config_name=None):
+    """Parse the config file of a config name.
+
+    :param config_name: the name of the config file (None for the default)
+
+    :type config_name: str
+
+    :return: AppConfig
+
+    :raises ConfigError: In case of config not allowed
     """
-    # if the context doesn't exist, init the app context
-    app_context = AppContext.get_instance()
-    if app_context is None:
-        # get the config name if specified.
-        config_name = kwargs.get("config")
+    # get the config_parser function
+    config_parser = get_config_parser(config_name=config_name)
 
-        # get the config_parser function
-        config_parser = get_config_parser(config_name=config_name)
+    # defines the config path
+    config_path = None
+    if config_name is not None:
+        config_path = Path(config.CONFIG_FOLDER, config_name)
 
-        # defines the config path
-        config_path = None
-        if config_name is not None:
-            config_path = Path(config.CONFIG_FOLDER, config_name)
+    # parse the config.
+    return config_parser(filepath=config_path)
 
-        # parse the config.
-        app_config = config_parser(filepath=config_path)
 
-        # clear the log if enabled
-        if app_config.clear_onstart:
-            app_config.logger.clear()
+class ConfigRegistry():
+    """Registry of the app configs by config name.
+
+    Each config is parsed once, then shared by all the contexts using it.
+    When the registry is full, the least recently used config is evicted.
+    The registry can be used from many threads at once.
+    """
+
+    def __init__(self, max_size=DEFAULT_REGISTRY_SIZE, loader=load_app_config):
+        """Init the registry.
+
+        :param max_size: the max number of configs (None for no limit)
+        :param loader:   the function parsing the config of a config name
+
+        :type max_size: int
+        :type loader:   callable
+
+        :raise: BadArgumentError if the max size is not positive
+        """
+        if max_size is not None and max_size < 1:
+            raise BadArgumentError(
+                f"the max size has to be positive: {max_size} given")
+
+        self.max_size = max_size
+        self.loader = loader
+        self._configs = collections.OrderedDict()
+        self._lock = threading.Lock()
+        # locks of the configs being parsed, by config name
+        self._loading = {}
 
-        # create and return the singleton of AppContext
-        return AppContext(app_config, **kwargs)
+    def get(self, config_name=None):
+        """Return the app config of a config name, parsed once.
 
-    # otherwise update the positional args of the context
-    app_context.start = kwargs.get("start")
-    app_context.end = kwargs.get("end")
-    app_context.limit = kwargs.get("limit")
+        The other configs are not locked while the config is parsed.
+        The log of the config is cleared once, when it is parsed,
+        so the sessions sharing the config never clear it.
 
-    # clean the positional args.
-    [kwargs.pop(key) for key in ['start', 'end', 'limit']]
+        :param config_name: the name of the config file (None for the default)
 
-    # update the optional args.
-    app_context.options = kwargs
+        :type config_name: str
+
+        :return: AppConfig
+        """
+        with self._lock:
+            app_config = self._get_cached(config_name)
+            if app_config is not None:
+                return app_config
+
+            loading = self._loading.setdefault(config_name, threading.Lock())
+
+        with loading:
+            with self._lock:
+                # the config may be parsed by another thread meanwhile
+                app_config = self._get_cached(config_name)
+                if app_config is not None:
+                    return app_config
+
+            try:
+                app_config = self.loader(config_name)
+                if app_config.clear_onstart:
+                    app_config.logger.clear()
+
+                # cached before the loading lock is released,
+                # so the config is never parsed twice
+                self.add(config_name, app_config)
+            finally:
+                with self._lock:
+                    self._loading.pop(config_name, None)
+
+        return app_config
+
+    def _get_cached(self, config_name):
+        """Return the config cached as the most recently used one."""
+        app_config = self._configs.get(config_name)
+        if app_config is not None:
+            self._configs.move_to_end(config_name)
+
+        return app_config
+
+    def add(self, config_name, app_config):
+        """Add the app config of a config name.
+
+        :param config_name: the name of the config file (None for the default)
+        :param app_config:  the app config
+
+        :type config_name: str
+        :type app_config:  AppConfig
+        """
+        evicted = []
+        with self._lock:
+            self._configs[config_name] = app_config
+            self._configs.move_to_end(config_name)
+
+            # evict the least recently used configs
+            if self.max_size is not None:
+                while len(self._configs) > self.max_size:
+                    evicted.append(self._configs.popitem(last=False)[1])
+
+            # the loggers of the configs kept stay open
+            loggers = {id(kept.logger.logger)
+                       for kept in self._configs.values()}
+
+        for evicted_config in evicted:
+            if id(evicted_config.logger.logger) not in loggers:
+                evicted_config.logger.close()
+
+    def clear(self):
+        """Remove all the configs of the registry."""
+        with self._lock:
+            self._configs.clear()
+
+    def __contains__(self, config_name):
+        """Check if the config of a config name is cached."""
+        with self._lock:
+            return config_name in self._configs
+
+    def __len__(self):
+        """Return the number of configs cached."""
+        with self._lock:
+            return len(self._configs)
+
+
+# registry of the app configs of the application.
+CONFIG_REGISTRY = ConfigRegistry()
+
+
+def init_app_context(registry=None, **kwargs):
+    """Init the application context of the current thread or asyncio task.
+
+    A new context is created each time, so the contexts of the other
+    threads and tasks are never changed. The app config is taken from
+    the registry, so each config file is parsed (and its log cleared) once.
+
+    :param registry: the registry of the configs (default: CONFIG_REGISTRY)
+    :param kwargs:   the application options
+
+    :type registry: ConfigRegistry
+    :type kwargs:   dict
+
+    :return: AppContext
+    """
+    if registry is None:
+        registry = CONFIG_REGISTRY
 
-    # clear the log if enabled
-    app_config = app_context.app_config
-    if app_config.clear_onstart:
-        app_config.logger.clear()
+    app_config = registry.get(kwargs.get("config"))
 
+    # create the context of the current thread or task
+    app_context = AppContext(app_config, **kwargs)
+    CURRENT_APP_CONTEXT.set(app_context)
     return app_context
@@ -0,0 +1,170 @@
+# coding: utf-8
+
+"""Module of the loading of the log configs.
+
+`logging.config.fileConfig` and `logging.config.dictConfig` reconfigure
+the whole logging of the process: they close the handlers of all the
+loggers and disable the loggers they don't describe.
+Here only the app logger of a config is configured, so the app configs
+of many tenants (see ConfigRegistry) can log at the same time.
+"""
+
+import configparser
+import functools
+import logging
+import logging.config
+from pathlib import Path
+from ..errors.app_error import ConfigError
+
+# extensions of the yaml log configs, the others are ini log configs.
+YAML_EXTENSIONS = (".yaml", ".yml")
+
+
+def read_log_config(path):
+    """Read a log config file as a dictConfig dict.
+
+    :param path: the path of the ini or yaml log config
+
+    :type path: str|Path
+
+    :return: dict
+    """
+    path = Path(path)
+    if path.suffix in YAML_EXTENSIONS:
+        import yaml
+
+        with open(path) as config_file:
+            return yaml.safe_load(config_file)
+
+    return read_ini_log_config(path)
+
+
+def read_ini_log_config(path):
+    """Read an ini log config (fileConfig format) as a dictConfig dict.
+
+    :param path: the path of the ini log config
+
+    :type path: str|Path
+
+    :return: dict
+    """
+    parser = configparser.ConfigParser()
+    with open(path) as config_file:
+        parser.read_file(config_file)
+
+    def get_keys(section):
+        keys = parser.get(section, "keys", fallback="")
+        return [key.strip() for key in keys.split(",") if key.strip()]
+
+    formatters = {}
+    for name in get_keys("formatters"):
+        section = f"formatter_{name}"
+        formatter = {
+            "format": parser.get(section, "format", raw=True, fallback=None),
+            "datefmt": parser.get(section, "datefmt", raw=True,
+                                  fallback=None) or None,
+            "style": parser.get(section, "style", raw=True, fallback="%")}
+        formatter_class = parser.get(section, "class", fallback=None)
+        if formatter_class:
+            formatter["class"] = formatter_class
+
+        formatters[name] = formatter
+
+    handlers = {}
+    # the handler classes and args are evaluated like in fileConfig
+    namespace = vars(logging)
+    resolver = logging.config.BaseConfigurator({})
+    for name in get_keys("handlers"):
+        section = parser[f"handler_{name}"]
+        handler_class = section["class"]
+        try:
+            handler_class = eval(handler_class, namespace)
+        except (AttributeError, NameError):
+            handler_class = resolver.resolve(handler_class)
+
+        args = eval(section.get("args", "()"), namespace)
+        kwargs = eval(section.get("kwargs", "{}"), namespace)
+        handler = {"()": functools.partial(handler_class, *args, **kwargs)}
+        if section.get("level"):
+            handler["level"] = section["level"]
+
+        if section.get("formatter"):
+            handler["formatter"] = section["formatter"]
+
+        handlers[name] = handler
+
+    log_config = {"version": 1, "formatters": formatters,
+                  "handlers": handlers, "loggers": {}}
+    for name in get_keys("loggers"):
+        section = parser[f"logger_{name}"]
+        logger = {"handlers": [handler.strip() for handler
+                               in section.get("handlers", "").split(",")
+                               if handler.strip()]}
+        if section.get("level"):
+            logger["level"] = section["level"]
+
+        if name == "root":
+            log_config["root"] = logger
+        else:
+            logger["propagate"] = section.getint("propagate", fallback=1) == 1
+            log_config["loggers"][section["qualname"]] = logger
+
+    return log_config
+
+
+def configure_logger(log_config, logger_name):
+    """Configure only a logger from a dictConfig dict.
+
+    The handlers of the logger are replaced, the other loggers
+    are not changed. A logger missing from the config
+    is configured like the root logger, without propagation.
+
+    :param log_config:  the dictConfig dict
+    :param logger_name: the name of the logger
+
+    :type log_config:  dict
+    :type logger_name: str
+
+    :return: logging.Logger
+
+    :raise: ConfigError if the config is not valid
+    """
+    configurator = logging.config.dictConfigClass(log_config)
+    config = configurator.config
+    loggers = config.get("loggers", {})
+    if logger_name in loggers:
+        logger_config = loggers[logger_name]
+        propagate = logger_config.get("propagate", True)
+    else:
+        logger_config = config.get("root", {})
+        propagate = False
+
+    try:
+        formatters = config.get("formatters", {})
+        for name in formatters:
+            formatters[name] = configurator.configure_formatter(
+                formatters[name])
+
+        filters = config.get("filters", {})
+        for name in filters:
+            filters[name] = configurator.configure_filter(filters[name])
+
+        handlers = config.get("handlers", {})
+        for name in logger_config.get("handlers", []):
+            handler = configurator.configure_handler(handlers[name])
+            handler.name = name
+            handlers[name] = handler
+    except (KeyError, TypeError, ValueError) as error:
+        raise ConfigError(
+            f"log config of [{logger_name}] not valid: {error}") from error
+
+    logger = logging.getLogger(logger_name)
+    # the handlers of a former config of the logger
+    for handler in list(logger.handlers):
+        logger.removeHandler(handler)
+        handler.close()
+
+    configurator.common_logger_config(logger, logger_config)
+    logger.propagate = propagate
+    logger.disabled = False
+    return logger
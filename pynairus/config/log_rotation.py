@@ -0,0 +1,249 @@
+# coding: utf-8
+
+"""Module of the rotation of the log files.
+
+The log file is rotated when it reaches a size or after an interval.
+The rotated files are named with their rotation time,
+compressed in a background thread if enabled,
+and only the last ones are kept, so the disk use stays bounded.
+"""
+
+import glob
+import gzip
+import logging
+import logging.handlers
+import os
+import re
+import shutil
+import threading
+import time
+from ..helpers.string_helper import get_bool_from_str
+
+# default number of rotated files kept.
+DEFAULT_BACKUP_COUNT = 5
+
+# keys of the rotation in the log section of the app configs.
+ROTATION_KEYS = ("rotate_size", "rotate_interval", "rotate_backups",
+                 "rotate_compress")
+
+# suffix of the rotated files.
+ROTATION_SUFFIX = "%Y%m%d-%H%M%S"
+
+
+class RotatingLogHandler(logging.handlers.BaseRotatingHandler):
+    """File handler rotating the file by size and by time."""
+
+    def __init__(self, filename, max_bytes=0, interval=0,
+                 backup_count=DEFAULT_BACKUP_COUNT, compress=False,
+                 encoding=None, clock=time.time):
+        """Open the log file.
+
+        :param filename:     the path of the log file
+        :param max_bytes:    the max size of the file (0 for no limit)
+        :param interval:     the seconds between two rotations (0 for never)
+        :param backup_count: the number of rotated files kept
+        :param compress:     compress the rotated files with gzip
+        :param encoding:     the encoding of the file
+        :param clock:        the function returning the current time
+
+        :type filename:     str
+        :type max_bytes:    int
+        :type interval:     int
+        :type backup_count: int
+        :type compress:     bool
+        :type encoding:     str
+        :type clock:        callable
+        """
+        super().__init__(filename, "a", encoding=encoding, delay=True)
+        self.max_bytes = max_bytes
+        self.interval = interval
+        self.backup_count = backup_count
+        self.compress = compress
+        self.clock = clock
+        self.rollover_at = None
+        if interval > 0:
+            self.rollover_at = self.clock() + interval
+
+        # threads compressing the rotated files
+        self._compressions = []
+        # names of the rotated files: time suffix, index, gzip extension
+        self._rotated_pattern = re.compile(
+            rf"{re.escape(os.path.basename(self.baseFilename))}"
+            r"\.(?P<suffix>\d{8}-\d{6})(?:\.(?P<index>\d+))?(?:\.gz)?")
+
+    def shouldRollover(self, record):
+        """Check if the file has to be rotated before the record."""
+        if self.rollover_at is not None and self.clock() >= self.rollover_at:
+            return True
+
+        if self.max_bytes > 0:
+            if self.stream is None:
+                self.stream = self._open()
+
+            message = f"{self.format(record)}{self.terminator}"
+            return self.stream.tell() + len(message) >= self.max_bytes
+
+        return False
+
+    def doRollover(self):
+        """Rotate the file, then compress it and remove the oldest ones."""
+        if self.stream is not None:
+            self.stream.close()
+            self.stream = None
+
+        now = self.clock()
+        if self.interval > 0:
+            self.rollover_at = now + self.interval
+
+        if os.path.exists(self.baseFilename) \
+                and os.path.getsize(self.baseFilename) > 0:
+            rotated = self._get_rotated_name(now)
+            os.rename(self.baseFilename, rotated)
+            if self.compress:
+                thread = threading.Thread(target=compress_file,
+                                          args=(rotated,),
+                                          name="pymath-log-compression")
+                self._compressions = [compression for compression
+                                      in self._compressions
+                                      if compression.is_alive()]
+                self._compressions.append(thread)
+                thread.start()
+
+        self.remove_old_files()
+
+    def _get_rotated_name(self, now):
+        """Return a new name for the file rotated at a time.
+
+        The files rotated in the same second are numbered
+        after the last one, so a name is never reused.
+        """
+        suffix = time.strftime(ROTATION_SUFFIX, time.localtime(now))
+        name = f"{self.baseFilename}.{suffix}"
+        indexes = [index for rotated_suffix, index
+                   in map(self._get_rotation_key, self.get_rotated_files())
+                   if rotated_suffix == suffix]
+        if not indexes:
+            return name
+
+        return f"{name}.{max(indexes) + 1}"
+
+    def _get_rotation_key(self, path):
+        """Return the (time suffix, index) of a rotated file or None."""
+        match = self._rotated_pattern.fullmatch(os.path.basename(path))
+        if match is None:
+            return None
+
+        return (match.group("suffix"), int(match.group("index") or 0))
+
+    def get_rotated_files(self):
+        """Return the rotated files, from the oldest to the newest.
+
+        The files are sorted by rotation time, then by index
+        for the files rotated in the same second.
+
+        :return: list of str
+        """
+        rotated_files = glob.glob(f"{glob.escape(self.baseFilename)}.*")
+        keys = {path: self._get_rotation_key(path) for path in rotated_files}
+        return sorted((path for path, key in keys.items() if key is not None),
+                      key=keys.get)
+
+    def remove_old_files(self):
+        """Remove the rotated files beyond the backup count."""
+        rotated_files = self.get_rotated_files()
+        for path in rotated_files[:max(0, len(rotated_files)
+                                        - self.backup_count)]:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                # compressed meanwhile
+                pass
+
+    def close(self):
+        """Close the file and wait for the compressions."""
+        super().close()
+        for thread in self._compressions:
+            thread.join()
+
+        self._compressions = []
+
+
+def compress_file(path):
+    """Compress a file with gzip, then remove it.
+
+    :param path: the path of the file
+
+    :type path: str
+    """
+    tmp_path = f"{path}.gz.tmp"
+    try:
+        with open(path, "rb") as source, gzip.open(tmp_path, "wb") as target:
+            shutil.copyfileobj(source, target)
+    except FileNotFoundError:
+        # the file is removed with the oldest ones
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        return
+
+    os.replace(tmp_path, f"{path}.gz")
+    os.remove(path)
+
+
+def read_rotation(values):
+    """Read the rotation of the log section of an app config.
+
+    :param values: the values of the log section by key
+                   (str values are converted)
+
+    :type values: dict
+
+    :return: dict|None the args of the RotatingLogHandler,
+             None if the rotation is disabled
+    """
+    size, interval, backups, compress = (values.get(key)
+                                         for key in ROTATION_KEYS)
+    size = int(size or 0)
+    interval = int(interval or 0)
+    if size <= 0 and interval <= 0:
+        return None
+
+    if isinstance(compress, str):
+        compress = get_bool_from_str(compress)
+
+    return {"max_bytes": size, "interval": interval,
+            "backup_count": DEFAULT_BACKUP_COUNT if backups is None
+            else int(backups),
+            "compress": bool(compress)}
+
+
+def install_rotation(logger, rotation):
+    """Replace the file handlers of a logger with rotating ones.
+
+    The level, the formatter and the filters of the handlers are kept.
+
+    :param logger:   the logger
+    :param rotation: the args of the RotatingLogHandler (see read_rotation)
+
+    :type logger:   logging.Logger
+    :type rotation: dict
+
+    :return: list of the RotatingLogHandler installed
+    """
+    handlers = []
+    for handler in list(logger.handlers):
+        if type(handler) is not logging.FileHandler:
+            continue
+
+        rotating_handler = RotatingLogHandler(
+            handler.baseFilename, encoding=handler.encoding, **rotation)
+        rotating_handler.setLevel(handler.level)
+        rotating_handler.setFormatter(handler.formatter)
+        for log_filter in handler.filters:
+            rotating_handler.addFilter(log_filter)
+
+        logger.removeHandler(handler)
+        handler.close()
+        logger.addHandler(rotating_handler)
+        handlers.append(rotating_handler)
+
+    return handlers
@@ -0,0 +1,186 @@
+# coding: utf-8
+
+"""Module of the sampling and the rate limiting of the log messages.
+
+The debug messages (or the ones up to the `sample_level`) are counted
+by message key (the %-style template of the message, before formatting),
+so the retries of a bulk generation can't flood the log:
+
+- only one message in `sample_rate` is logged;
+- at most `rate_limit` messages by second are logged.
+
+The messages suppressed are counted and reported in a periodic summary.
+The warnings and the errors are never suppressed.
+"""
+
+import logging
+import threading
+import time
+from ..errors.app_error import ConfigError
+
+# keys of the sampling in the log section of the app configs.
+SAMPLING_KEYS = ("sample_rate", "rate_limit", "summary_interval",
+                 "sample_level")
+
+# default seconds between two summaries of the messages suppressed.
+DEFAULT_SUMMARY_INTERVAL = 60
+
+# default highest level of the messages sampled.
+DEFAULT_SAMPLE_LEVEL = logging.DEBUG
+
+
+class LogSampler():
+    """Sampler and rate limiter of the log messages by message key."""
+
+    def __init__(self, sample_rate=1, rate_limit=0,
+                 summary_interval=DEFAULT_SUMMARY_INTERVAL,
+                 level=DEFAULT_SAMPLE_LEVEL, clock=time.monotonic):
+        """Init the counters.
+
+        :param sample_rate:      log one message in n by key (1 for all)
+        :param rate_limit:       max messages by second by key (0 for no limit)
+        :param summary_interval: the seconds between two summaries
+        :param level:            the highest level of the messages sampled
+        :param clock:            the function returning the current time
+
+        :type sample_rate:      int
+        :type rate_limit:       int
+        :type summary_interval: int
+        :type level:            int
+        :type clock:            callable
+
+        :raise: ConfigError if the warnings would be sampled
+        """
+        if level >= logging.WARNING:
+            raise ConfigError(
+                f"the warnings and the errors can't be sampled: \
+{logging.getLevelName(level)} given")
+
+        self.level = level
+        self.sample_rate = max(1, sample_rate)
+        self.rate_limit = rate_limit
+        self.summary_interval = summary_interval
+        self.clock = clock
+        self.next_summary = clock() + summary_interval
+
+        # number of messages seen by key
+        self._seen = {}
+        # (second, number of messages logged in this second) by key
+        self._windows = {}
+        # number of messages suppressed by key since the last summary
+        self._suppressed = {}
+        self._lock = threading.Lock()
+
+    def samples(self, level):
+        """Check if the messages of a level are sampled.
+
+        :param level: the level of the messages
+
+        :type level: int
+
+        :return: bool
+        """
+        return level <= self.level
+
+    def allow(self, key):
+        """Check if a message is logged, count it otherwise.
+
+        :param key: the key of the message
+
+        :type key: str
+
+        :return: bool
+        """
+        with self._lock:
+            if self.sample_rate > 1:
+                seen = self._seen.get(key, 0)
+                self._seen[key] = seen + 1
+                if seen % self.sample_rate:
+                    self._suppress(key)
+                    return False
+
+            if self.rate_limit > 0:
+                second = int(self.clock())
+                window, logged = self._windows.get(key, (second, 0))
+                if window != second:
+                    logged = 0
+
+                if logged >= self.rate_limit:
+                    self._suppress(key)
+                    return False
+
+                self._windows[key] = (second, logged + 1)
+
+            return True
+
+    def _suppress(self, key):
+        """Count a message suppressed."""
+        self._suppressed[key] = self._suppressed.get(key, 0) + 1
+
+    def summary_due(self):
+        """Check if the summary interval is elapsed.
+
+        :return: bool
+        """
+        return self.clock() >= self.next_summary
+
+    def pop_summary(self):
+        """Return the counts of the messages suppressed and reset them.
+
+        :return: dict of the counts by key
+        """
+        with self._lock:
+            summary = self._suppressed
+            self._suppressed = {}
+            self.next_summary = self.clock() + self.summary_interval
+
+        return summary
+
+
+def get_message_key(msg):
+    """Return the key of a message.
+
+    :param msg: the %-style message, or a callable returning it
+
+    :type msg: str|callable
+
+    :return: str
+    """
+    if callable(msg):
+        return getattr(msg, "__qualname__", repr(msg))
+
+    return msg
+
+
+def read_sampling(values):
+    """Read the sampling of the log section of an app config.
+
+    :param values: the values of the log section by key
+                   (str values are converted)
+
+    :type values: dict
+
+    :return: dict|None the args of the LogSampler,
+             None if the sampling is disabled
+
+    :raise: ConfigError if the level is not valid
+    """
+    sample_rate, rate_limit, summary_interval, level = (
+        values.get(key) for key in SAMPLING_KEYS)
+    sample_rate = int(sample_rate or 1)
+    rate_limit = int(rate_limit or 0)
+    if sample_rate <= 1 and rate_limit <= 0:
+        return None
+
+    if not level:
+        level = DEFAULT_SAMPLE_LEVEL
+    elif isinstance(level, str) and not level.isdigit():
+        level = logging.getLevelName(level.upper())
+        if not isinstance(level, int):
+            raise ConfigError(
+                f"unknown sample level: {values.get('sample_level')}")
+
+    return {"sample_rate": sample_rate, "rate_limit": rate_limit,
+            "summary_interval": DEFAULT_SUMMARY_INTERVAL
+            if summary_interval is None else int(summary_interval),
+            "level": int(level)}
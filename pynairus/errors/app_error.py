@@ -26,3 +26,13 @@ class ComputeError(Exception):
 class StrategyError(Exception):
     """Raises when generate_random is not implemented."""
     pass
+
+
+class StoreError(Exception):
+    """Raised if a store method is not implemented."""
+    pass
+
+
+class SessionError(Exception):
+    """Raised if a session is used in a bad state."""
+    pass
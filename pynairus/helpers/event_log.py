@@ -0,0 +1,141 @@
+# coding: utf-8
+
+"""Module of the JSON-lines event log of the sessions.
+
+Each event is a compact JSON object on its own line, starting with its type:
+
+    {"event":"answer","t":1539856512.063,"session":"5f0c...","good":true}
+
+The events are written through a buffered file and read back as a stream,
+so the analytics never parse the free-text log.
+"""
+
+import json
+import threading
+import time
+
+# size of the write buffer of the event files.
+DEFAULT_BUFFER_SIZE = 1 << 16
+
+# types of the session events.
+QUESTION_EVENT = "question"
+ANSWER_EVENT = "answer"
+SCORE_EVENT = "score"
+TOTAL_TIME_EVENT = "total_time"
+
+_ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+
+
+class EventSink():
+    """Buffered writer of the JSON-lines events.
+
+    The sink can be shared by many sessions and threads.
+    """
+
+    def __init__(self, path, buffer_size=DEFAULT_BUFFER_SIZE,
+                 clock=time.time):
+        """Open the event file in append mode.
+
+        :param path:        the path of the event file
+        :param buffer_size: the size of the write buffer in bytes
+        :param clock:       the function returning the timestamp
+
+        :type path:        str|Path
+        :type buffer_size: int
+        :type clock:       callable
+        """
+        self.path = path
+        self.clock = clock
+        self._file = open(path, "a", encoding="utf-8",
+                          buffering=buffer_size)
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        """Enter in the context manager."""
+        return self
+
+    def __exit__(self, *args):
+        """Close the sink at the end of the context manager."""
+        self.close()
+
+    def emit(self, event, **fields):
+        """Write an event.
+
+        :param event:  the type of the event
+        :param fields: the fields of the event (JSON serializable)
+
+        :type event:  str
+        :type fields: dict
+        """
+        line = _ENCODER.encode(
+            {"event": event, "t": round(self.clock(), 3), **fields})
+        with self._lock:
+            self._file.write(line + "\n")
+
+    def flush(self):
+        """Write the buffered events in the file."""
+        with self._lock:
+            self._file.flush()
+
+    def close(self):
+        """Write the buffered events and close the file."""
+        with self._lock:
+            if not self._file.closed:
+                self._file.close()
+
+
+def read_events(path, event=None):
+    """Read lazily the events of a file.
+
+    The lines of the other types are skipped without being parsed.
+
+    :param path:  the path of the event file
+    :param event: the type of the events to read (None for all)
+
+    :type path:  str|Path
+    :type event: str
+
+    :return: generator of dict
+    """
+    prefix = None if event is None else _ENCODER.encode({"event": event})[:-1]
+    decode = json.loads
+    with open(path, encoding="utf-8") as file:
+        for line in file:
+            if prefix is not None and not line.startswith(prefix):
+                continue
+
+            if line.strip():
+                yield decode(line)
+
+
+def summarize_events(events):
+    """Aggregate the answers and the scores of a stream of events.
+
+    :param events: the events (see read_events)
+
+    :type events: iterable
+
+    :return: dict of the totals
+    """
+    summary = {"sessions": 0, "questions": 0, "answers": 0, "good": 0,
+               "errors": 0, "response_time": 0, "timed": 0, "score": 0}
+    for item in events:
+        event = item["event"]
+        if event == ANSWER_EVENT:
+            summary["answers"] += 1
+            if item.get("good"):
+                summary["good"] += 1
+            elif "error" in item:
+                summary["errors"] += 1
+
+            response_time = item.get("time")
+            if response_time is not None:
+                summary["timed"] += 1
+                summary["response_time"] += response_time
+        elif event == QUESTION_EVENT:
+            summary["questions"] += 1
+        elif event == SCORE_EVENT:
+            summary["sessions"] += 1
+            summary["score"] += item["score"]
+
+    return summary
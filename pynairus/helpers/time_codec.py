@@ -0,0 +1,182 @@
+# coding: utf-8
+
+"""Time codec module.
+
+The time strings are formatted from a lookup table of all the times
+of a day and parsed without regular expression.
+The batch functions require the numpy module.
+"""
+
+from ..errors.app_error import BadArgumentError
+
+# number of seconds in a day.
+DAY_SECONDS = 24 * 60 * 60
+
+# lookup tables built on the first use.
+_TIME_STRINGS = []
+_TIME_SECONDS = {}
+_TIME_ARRAY = []
+
+
+def _format(timestamp):
+    """Format a timestamp of the day.
+        Example: 1501 => 25m01s
+    """
+    secs = timestamp % 60
+    tmp_mins = timestamp // 60 % 60
+    mins = f"{tmp_mins:02d}m" if tmp_mins > 0 else ""
+    tmp_hours = timestamp // 60 // 60
+    hours = f"{tmp_hours}h" if tmp_hours > 0 else ""
+
+    return f"{hours}{mins}{secs:02d}s"
+
+
+def get_time_strings():
+    """Return the table of the time strings by timestamp.
+
+    The index 0 is not a valid timestamp and is set to None.
+
+    :return: list of str
+    """
+    if not _TIME_STRINGS:
+        strings = [None] + [_format(timestamp)
+                            for timestamp in range(1, DAY_SECONDS + 1)]
+        _TIME_SECONDS.update(
+            (string, timestamp) for timestamp, string in enumerate(strings)
+            if timestamp > 0)
+        _TIME_STRINGS[:] = strings
+
+    return _TIME_STRINGS
+
+
+def check_timestamp(timestamp):
+    """Check that the timestamp is in a day.
+
+    :param timestamp: the timestamp to check
+
+    :type timestamp: int
+
+    :raises BadArgumentError: if the timestamp is out of the day
+    """
+    # raise an error if the number is greater than a day
+    if timestamp > DAY_SECONDS:
+        raise BadArgumentError(f"The timestamp is greater than a day")
+
+    # raise an error if the number is lower than one second
+    if timestamp < 1:
+        raise BadArgumentError(f"The timestamp is lower than one second")
+
+
+def format_time(timestamp):
+    """Convert seconds to time string.
+        Example: 1501 => 25m01s
+
+    :param timestamp: the time in seconds
+
+    :type timestamp: int
+
+    :return: str
+
+    :raises BadArgumentError: if the timestamp is out of the day
+    """
+    check_timestamp(timestamp)
+    return get_time_strings()[timestamp]
+
+
+def parse_time(time):
+    """Parse the time string and return a tuple with 3 values.
+
+    Example: parse_time("1h52m34s") will output (1, 52, 34).
+
+    :param time: the string to parse
+
+    :type time: str
+
+    :return: tuple
+
+    :raises BadArgumentError: if the string cannot be parsed
+    :raises TypeError: if the time is not a string
+    """
+    if not isinstance(time, str):
+        raise TypeError(f"expected string, {type(time).__name__} given")
+
+    # the string musts end with the seconds
+    if not time.endswith("s"):
+        raise BadArgumentError(f"The time [{time}] can't be parsed")
+
+    hour, separator, rest = time[:-1].partition("h")
+    if not separator:
+        hour, rest = None, hour
+
+    minute, separator, second = rest.partition("m")
+    if not separator:
+        minute, second = None, minute
+
+    for part in (hour, minute, second):
+        if part is not None and not part.isdecimal():
+            raise BadArgumentError(f"The time [{time}] can't be parsed")
+
+    return (int(hour) if hour is not None else 0,
+            int(minute) if minute is not None else 0,
+            int(second))
+
+
+def parse_seconds(time):
+    """Parse the time string and return the time in seconds.
+
+    Example: parse_seconds("25m1s") will output 1501.
+
+    :param time: the string to parse
+
+    :type time: str
+
+    :return: int
+
+    :raises BadArgumentError: if the string cannot be parsed
+    """
+    # the formatted times are found in the lookup table
+    if _TIME_SECONDS and time in _TIME_SECONDS:
+        return _TIME_SECONDS[time]
+
+    hours, mins, secs = parse_time(time)
+    return (hours * 60 * 60) + (mins * 60) + secs
+
+
+def format_times(timestamps):
+    """Convert many timestamps to time strings.
+
+    :param timestamps: the times in seconds
+
+    :type timestamps: array-like
+
+    :return: numpy.ndarray of str
+
+    :raises BadArgumentError: if a timestamp is out of the day
+    """
+    import numpy
+    if not _TIME_ARRAY:
+        _TIME_ARRAY.append(numpy.array([""] + get_time_strings()[1:]))
+
+    timestamps = numpy.asarray(timestamps, dtype=numpy.int64)
+    if len(timestamps) > 0:
+        check_timestamp(timestamps.max())
+        check_timestamp(timestamps.min())
+
+    return _TIME_ARRAY[0][timestamps]
+
+
+def parse_times(times):
+    """Parse many time strings.
+
+    :param times: the strings to parse
+
+    :type times: iterable
+
+    :return: numpy.ndarray of the times in seconds
+
+    :raises BadArgumentError: if a string cannot be parsed
+    """
+    import numpy
+    get_time_strings()
+    return numpy.fromiter((parse_seconds(time) for time in times),
+                          dtype=numpy.int64)
@@ -0,0 +1,118 @@
+# coding: utf-8
+
+"""Time helper module."""
+
+import functools
+from .time_codec import parse_seconds, format_time
+
+
+@functools.total_ordering
+class TimeValue():
+    """Time stored in seconds.
+
+    The time is computed and compared with integers,
+    the string is rendered only for the display.
+    Ex. TimeValue(1501) => 25m01s
+    """
+
+    __slots__ = ("seconds",)
+
+    def __init__(self, seconds):
+        """Constructor.
+
+        :param seconds: the time in seconds
+
+        :type seconds: int
+        """
+        self.seconds = int(seconds)
+
+    @classmethod
+    def parse(cls, time):
+        """Parse a time string.
+
+        Example: TimeValue.parse("25m1s") == TimeValue.parse("25m01s")
+
+        :param time: the string to parse
+
+        :type time: str
+
+        :return: TimeValue
+
+        :raises BadArgumentError: if the string cannot be parsed
+        """
+        return cls(parse_seconds(time))
+
+    @classmethod
+    def convert(cls, time):
+        """Return the time as a TimeValue.
+
+        :param time: the time to convert
+
+        :type time: TimeValue|str
+
+        :return: TimeValue
+
+        :raises BadArgumentError: if the string cannot be parsed
+        """
+        if isinstance(time, cls):
+            return time
+
+        return cls.parse(time)
+
+    def __str__(self):
+        """Display the time string.
+
+        :return: str
+
+        :raises BadArgumentError: if the time is out of the day
+        """
+        return format_time(self.seconds)
+
+    def __repr__(self):
+        """String representation.
+
+        :return: str
+        """
+        return f"{self.__class__.__name__}({self.seconds})"
+
+    def __int__(self):
+        """Return the time in seconds."""
+        return self.seconds
+
+    def __hash__(self):
+        """Hash of the time."""
+        return hash(self.seconds)
+
+    def __eq__(self, other):
+        """Compare the times in seconds."""
+        if not isinstance(other, TimeValue):
+            return NotImplemented
+
+        return self.seconds == other.seconds
+
+    def __lt__(self, other):
+        """Compare the times in seconds."""
+        if not isinstance(other, TimeValue):
+            return NotImplemented
+
+        return self.seconds < other.seconds
+
+    def __add__(self, other):
+        """Add two times.
+
+        :return: TimeValue
+        """
+        if not isinstance(other, TimeValue):
+            return NotImplemented
+
+        return TimeValue(self.seconds + other.seconds)
+
+    def __sub__(self, other):
+        """Substract two times.
+
+        :return: TimeValue
+        """
+        if not isinstance(other, TimeValue):
+            return NotImplemented
+
+        return TimeValue(self.seconds - other.seconds)
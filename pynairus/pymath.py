@@ -2,82 +2,313 @@
 
 """pymath module"""
 
-import timeit
+import asyncio
+from pathlib import Path
 from .config import app_context as ns_ac
 from .errors.app_error import BadArgumentError
 from .strategies import operator_strategy as ns_os
+from .strategies.operation_batch import OperationBatch
+from .strategies.unique_sampler import UniqueSampler
+from .stores.answer_store import MemoryAnswerStore
+from .stores.sqlite_store import SqliteAnswerStore, DEFAULT_LEARNER
+from .stores.bloom_filter import BloomAnswerStore
+from .sessions.session import Session, run_session
+from .sessions.io_adapter import ConsoleAdapter
+from .helpers.event_log import EventSink
 
-# Store good anwsers
-ANSWERS = {}
+# random draws replacing an operation already answered,
+# before searching an operation not answered in the whole space.
+ANSWERED_RETRIES = 32
 
 
-def is_already_answered(numbers):
+def is_already_answered(numbers, store):
     """
-    Check if a good anwser has been stored in the "ANSWERS" tuple.
+    Check if a good anwser has been stored in the answer store.
 
-        :param numbers: The operations tuple to test.
+        :param numbers: The operation key to test (see pack_operation).
+        :param store:   The answer store.
 
-        :type numbers: tuple
+        :type numbers: int
+        :type store:   AnswerStore
 
         :return: bool
     """
-    if ANSWERS.get(numbers) is None:
-        return False
+    return store.is_already_answered(numbers)
 
-    return ANSWERS.get(numbers)
 
+def get_strategy(operator, strategies=None):
+    """"
+    Return the strategy of an operator.
+        :param operator:   Operator.
+        :param strategies: Strategies by operator (default: STRATEGIES).
+
+        :type operator:   str
+        :type strategies: dict
+
+        :return BaseStrategy
+    """
+    if strategies is None:
+        strategies = ns_os.STRATEGIES
+
+    if operator not in strategies:
+        raise BadArgumentError(f"the operator {operator} not exists")
+
+    return strategies[operator]
 
-def generate_random(start, end, operator):
+
+def generate_random(start, end, operator, strategies=None):
     """"
     Generate ramdom number.
-        :param start:    Start range.
-        :param end:      End range.
-        :param operator: Operator.
+        :param start:      Start range.
+        :param end:        End range.
+        :param operator:   Operator.
+        :param strategies: Strategies by operator (default: STRATEGIES).
 
-        :type start:     int
-        :type end:       int
-        :type operator:  str
+        :type start:      int
+        :type end:        int
+        :type operator:   str
+        :type strategies: dict
 
         :return ComputeNumbers
     """
-    if operator not in ns_os.STRATEGIES:
-        raise BadArgumentError(f"the operator {operator} not exists")
+    return get_strategy(operator, strategies).generate_random(start, end)
+
 
-    strategy = ns_os.STRATEGIES[operator]
-    return strategy.generate_random(start, end)
+def generate_batch(start, end, operator, size, strategies=None):
+    """
+    Generate the operands of many ramdom operations at once.
+        :param start:      Start range.
+        :param end:        End range.
+        :param operator:   Operator.
+        :param size:       Number of operations.
+        :param strategies: Strategies by operator (default: STRATEGIES).
 
+        :type start:      int
+        :type end:        int
+        :type operator:   str
+        :type size:       int
+        :type strategies: dict
 
-def pymath(**kwargs):
+        :return OperationBatch
     """
-    Launch application with random operations.
-        keys required:
-            - start: start range (int).
-            - end:   end range (int).
-            - limit: max operations to generate (int).
+    strategy = get_strategy(operator, strategies)
+    firsts, seconds = strategy.generate_batch(start, end, size)
+    return OperationBatch.from_operands(strategy.key, firsts, seconds)
 
-        keys optionals:
-            - operator:  operator (str).
-            - timer:     activate the timer (bool).
-            - config:    the name the config file (str).
+
+def get_quotas(operators, limit):
     """
-    # init the context
-    app_context = ns_ac.init_app_context(**kwargs)
-    logger = app_context.app_config.logger
+    Count the operations of each operator when alternating the operators.
+        :param operators: Operators to alternate.
+        :param limit:     Number of operations.
+
+        :type operators: tuple
+        :type limit:     int
+
+        :return dict of the number of operations by operator
+    """
+    quotas = {}
+    for index, operator in enumerate(operators):
+        count = (limit + len(operators) - 1 - index) // len(operators)
+        quotas[operator] = quotas.get(operator, 0) + count
+
+    return quotas
+
+
+def iter_random(start, end, operators, limit, strategies=None):
+    """
+    Generate lazily ramdom operations by alternating the operators.
+        :param start:      Start range.
+        :param end:        End range.
+        :param operators:  Operators to alternate.
+        :param limit:      Number of operations.
+        :param strategies: Strategies by operator (default: STRATEGIES).
+
+        :type start:      int
+        :type end:        int
+        :type operators:  tuple
+        :type limit:      int
+        :type strategies: dict
+
+        :return generator of tuples (operator, ComputeNumbers)
+    """
+    for x in range(limit):
+        operator = operators[x % len(operators)]
+        yield operator, generate_random(start, end, operator, strategies)
+
+
+def iter_unique(start, end, operators, limit, strategies=None,
+                samplers=None):
+    """
+    Generate lazily distinct ramdom operations by alternating the operators.
+    The capacity of the operators is checked before returning the generator.
+        :param start:      Start range.
+        :param end:        End range.
+        :param operators:  Operators to alternate.
+        :param limit:      Number of operations.
+        :param strategies: Strategies by operator (default: STRATEGIES).
+        :param samplers:   Dict filled with the samplers by operator,
+                           to draw the replacements (see skip_answered).
+
+        :type start:      int
+        :type end:        int
+        :type operators:  tuple
+        :type limit:      int
+        :type strategies: dict
+        :type samplers:   dict
+
+        :return generator of tuples (operator, ComputeNumbers)
+
+        :raise BadArgumentError: if there are not enough distinct operations
+    """
+    if samplers is None:
+        samplers = {}
+
+    for operator in operators:
+        if operator not in samplers:
+            samplers[operator] = UniqueSampler(
+                get_strategy(operator, strategies), start, end)
+
+    # check the capacity before any draw
+    for operator, count in get_quotas(operators, limit).items():
+        samplers[operator].check_capacity(count)
+
+    return ((operators[x % len(operators)],
+             samplers[operators[x % len(operators)]].draw())
+            for x in range(limit))
+
+
+def generate_unique(start, end, operators, limit, strategies=None):
+    """
+    Generate distinct ramdom operations by alternating the operators.
+        :param start:      Start range.
+        :param end:        End range.
+        :param operators:  Operators to alternate.
+        :param limit:      Number of operations.
+        :param strategies: Strategies by operator (default: STRATEGIES).
+
+        :type start:      int
+        :type end:        int
+        :type operators:  tuple
+        :type limit:      int
+        :type strategies: dict
+
+        :return list of ComputeNumbers
+
+        :raise BadArgumentError: if there are not enough distinct operations
+    """
+    return [numbers for _, numbers
+            in iter_unique(start, end, operators, limit, strategies)]
+
+
+def draw_unanswered(sampler, store):
+    """
+    Draw the next operation of a sampler not already answered.
+        :param sampler: The sampler of the operations.
+        :param store:   The answer store.
 
-    # init vars
-    start = app_context.start
-    end = app_context.end
-    limit = app_context.limit
-    timer = app_context.options.get("timer")
-    operator = app_context.options.get("operator")
+        :type sampler: UniqueSampler
+        :type store:   AnswerStore
 
-    # we clear the awnsers dict
-    ANSWERS.clear()
+        :return tuple (packed answer key, ComputeNumbers)
 
-    if timer is True:
-        # Initialisation of the total time for the answers.
-        total_time = 0
-        logger.info(f"timer is activated at {total_time}s.")
+        :raise BadArgumentError: if the operations left are all answered
+    """
+    while len(sampler):
+        numbers = sampler.draw()
+        answer_key = ns_os.pack_operation(numbers)
+        if not is_already_answered(answer_key, store):
+            return answer_key, numbers
+
+    raise BadArgumentError(
+        f"all the operations with the operator {sampler.strategy.operator} \
+are already answered or asked")
+
+
+def skip_answered(operations, start, end, logger, store, strategies=None,
+                  samplers=None):
+    """
+    Replace lazily the operations already answered with new ones.
+    In unique mode, the replacements are drawn from the unique samplers,
+    so they are never asked twice. Otherwise a few random operations
+    are drawn, then the space is searched without replacement.
+        :param operations: The (operator, operation) tuples.
+        :param start:      Start range.
+        :param end:        End range.
+        :param logger:     The app logger.
+        :param store:      The answer store.
+        :param strategies: Strategies by operator (default: STRATEGIES).
+        :param samplers:   The samplers by operator of the unique mode
+                           (see iter_unique).
+
+        :type operations: iterable
+        :type start:      int
+        :type end:        int
+        :type logger:     LoggerWrapper
+        :type store:      AnswerStore
+        :type strategies: dict
+        :type samplers:   dict
+
+        :return generator of tuples (packed answer key, ComputeNumbers)
+
+        :raise BadArgumentError: if all the operations are answered
+    """
+    retries = 0
+    if samplers is None:
+        # the samplers of the random mode are created on demand
+        samplers = {}
+        retries = ANSWERED_RETRIES
+
+    for operator, numbers in operations:
+        # we pack the operation in its answer key
+        answer_key = ns_os.pack_operation(numbers)
+
+        # try a few random operations first
+        for _ in range(retries):
+            if not is_already_answered(answer_key, store):
+                break
+
+            logger.debug("operation %s already answered.", numbers)
+            numbers = generate_random(start, end, operator, strategies)
+            answer_key = ns_os.pack_operation(numbers)
+        else:
+            if is_already_answered(answer_key, store):
+                logger.debug("operation %s already answered.", numbers)
+                if operator not in samplers:
+                    samplers[operator] = UniqueSampler(
+                        get_strategy(operator, strategies), start, end)
+
+                answer_key, numbers = draw_unanswered(samplers[operator],
+                                                      store)
+
+        yield answer_key, numbers
+
+
+def create_session(start, end, limit, options, logger):
+    """
+    Create a session of random operations.
+        :param start:   Start range.
+        :param end:     End range.
+        :param limit:   Number of operations.
+        :param options: The optional keys of pymath.
+        :param logger:  The app logger.
+
+        :type start:   int
+        :type end:     int
+        :type limit:   int
+        :type options: dict
+        :type logger:  LoggerWrapper
+
+        :return Session
+
+        :raise BadArgumentError: if there are not enough distinct operations
+    """
+    timer = options.get("timer") is True
+    operator = options.get("operator")
+    unique = options.get("unique")
+
+    # each session draws from its own random generators
+    strategies = ns_os.create_strategies(options.get("seed"))
 
     # by default we build a tuple of addition and substraction operations
     if operator is None:
@@ -85,57 +316,110 @@ def pymath(**kwargs):
     else:
         operators = (operator, operator)
 
-    numbers_operations = []
-    try:
-        numbers_operations = [generate_random(
-            start, end, operators[x % 2]) for x in range(limit)]
+    # each stage of the pipeline handles one operation at a time
+    samplers = None
+    if unique is True:
+        # the replacements of the answered operations use the same samplers
+        samplers = {}
+        operations = iter_unique(start, end, operators, limit, strategies,
+                                 samplers)
+    else:
+        operations = iter_random(start, end, operators, limit, strategies)
+
+    # the answers are stored in a new store if none is given
+    store = options.get("store")
+    history = options.get("history")
+    history_opened = store is None and history is not None
+    if history_opened:
+        learner = options.get("learner") or DEFAULT_LEARNER
+        logger.info("answer history of %s: %s", learner, history)
+        store = SqliteAnswerStore(history, learner)
+        bloom = options.get("bloom")
+        if bloom is not None:
+            store = BloomAnswerStore.open(store, bloom)
+    elif store is None:
+        store = MemoryAnswerStore()
+
+    if timer:
+        logger.info("timer is activated at 0s.")
 
-        logger.debug(f"numbers_operations generated: {numbers_operations}")
-    except BadArgumentError as identifier:
-        logger.error("An error occured during operation generation",
-                     identifier)
+    return Session(skip_answered(operations, start, end, logger, store,
+                                 strategies, samplers),
+                   store, limit, timer=timer, logger=logger,
+                   close_store=history_opened, events=options.get("events"),
+                   learner=options.get("learner"))
 
-    score = 0
-    for numbers in numbers_operations:
-        # we generate the key for the answer
-        answer_key = (numbers.first, numbers.second, numbers.operator)
 
-        # loop until we found an good anwser not already given
-        while is_already_answered(answer_key):
-            logger.debug(f"key {answer_key} already exists.")
-            # generate another operation
-            numbers = generate_random(start, end, numbers.operator)
-            # we create another answer key
-            answer_key = (numbers.first, numbers.second, numbers.operator)
+def open_session(**kwargs):
+    """
+    Open a session of random operations in the application context.
+        keys required:
+            - start: start range (int).
+            - end:   end range (int).
+            - limit: max operations to generate (int).
+
+        keys optionals: the optional keys of pymath.
+
+        :return Session
+
+        :raise BadArgumentError: if there are not enough distinct operations
+    """
+    app_context = ns_ac.init_app_context(**kwargs)
+    return create_session(app_context.start, app_context.end,
+                          app_context.limit, app_context.options,
+                          app_context.app_config.logger)
+
+
+def pymath(**kwargs):
+    """
+    Launch application with random operations on the console.
+        keys required:
+            - start: start range (int).
+            - end:   end range (int).
+            - limit: max operations to generate (int).
 
-        print(f"{numbers}")
-        result = numbers.get_good_result()
+        keys optionals:
+            - operator:  operator (str).
+            - timer:     activate the timer (bool).
+            - config:    the name the config file (str).
+            - unique:    never repeat an operation (bool).
+            - seed:      seed of the random operations (int|str).
+            - store:     the store of the answers (AnswerStore),
+                         by default each session has its own store.
+            - history:   the path of the SQLite answer history (str),
+                         used if no store is given.
+            - learner:   the learner of the answer history (str).
+            - bloom:     the path of the Bloom filter of the history (str).
+            - events:    the path of the JSON-lines event log (str)
+                         or the sink of the events (EventSink).
+            - adapter:   the I/O adapter of the session (IOAdapter),
+                         by default the console.
+
+        :return Session
+    """
+    adapter = kwargs.pop("adapter", None)
+    if adapter is None:
+        adapter = ConsoleAdapter()
 
-        if timer is True:
-            start_time = timeit.default_timer()
+    # the event log given by path is written by this session only
+    events_opened = isinstance(kwargs.get("events"), (str, Path))
+    if events_opened:
+        kwargs["events"] = EventSink(kwargs["events"])
 
+    try:
         try:
-            response = input()
-            if timer is True:
-                response_time = timeit.default_timer() - start_time
-                print(f"Temps de réponse : {response_time:04.2f} secondes")
-                total_time += response_time
-
-            if numbers.validate(response):
-                print(f"Bonne réponse!")
-                score += 1
-                ANSWERS[answer_key] = True
-            else:
-                ANSWERS[answer_key] = False
-                print(f"Mauvaise réponse, le résulat attendue est: {result}")
-        except ValueError as identifier:
-            # log a warning to not stop the application.
-            logger.warning(f"Input error: {identifier}")
-            print(f"Erreur de saisie: {identifier}")
-
-        print(f"Ton score est de {score} / {limit}")
-
-    logger.info(f"final score: {score}/{limit}")
-    if timer is True:
-        logger.info(f"total time: {total_time:04.2f}")
-        print(f"Temps de réponse total : {total_time:04.2f}")
+            session = open_session(**kwargs)
+        except BadArgumentError as identifier:
+            # reported like the errors of run_session
+            asyncio.run(adapter.send_error(identifier))
+            app_context = ns_ac.AppContext.get_instance()
+            if app_context is not None:
+                app_context.app_config.logger.error(
+                    "An error occured during operation generation",
+                    identifier)
+            return None
+
+        return asyncio.run(run_session(session, adapter))
+    finally:
+        if events_opened:
+            kwargs["events"].close()
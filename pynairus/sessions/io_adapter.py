@@ -0,0 +1,159 @@
+# coding: utf-8
+
+"""Module of the I/O adapters of the sessions.
+
+An adapter sends the questions to a learner and receives the answers.
+All its methods are coroutines, so the adapters never block the event loop.
+"""
+
+import asyncio
+from ..errors import app_error as err
+
+
+class IOAdapter():
+    """Abstract class of I/O adapter."""
+
+    async def send_question(self, numbers):
+        """Send a question to the learner.
+
+        :param numbers: the operation asked
+        :type numbers:  ComputeNumbers
+        """
+        self._not_implemented()
+
+    async def receive_answer(self):
+        """Wait for the answer of the learner.
+
+        :return: str|None None if the learner left the session
+        """
+        self._not_implemented()
+
+    async def send_feedback(self, feedback, session):
+        """Send the feedback of an answer to the learner.
+
+        :param feedback: the feedback of the answer
+        :param session:  the session of the learner
+
+        :type feedback: Feedback
+        :type session:  Session
+        """
+        self._not_implemented()
+
+    async def send_error(self, error):
+        """Send an error which stops the session.
+
+        :param error: the error raised
+        :type error:  Exception
+        """
+        self._not_implemented()
+
+    async def send_summary(self, session):
+        """Send the summary of the session finished.
+
+        :param session: the session finished
+        :type session:  Session
+        """
+        self._not_implemented()
+
+    def _not_implemented(self):
+        """Raise the error of the abstract methods."""
+        message = f"method not implemented for class {self.__class__.__name__}"
+        raise err.SessionError(message)
+
+
+class TextAdapter(IOAdapter):
+    """Abstract class of adapter exchanging lines of text.
+
+    The messages are the ones of the command line application,
+    override write_line and read_line to exchange them.
+    """
+
+    async def write_line(self, line):
+        """Write a line to the learner.
+
+        :param line: the line without end of line
+        :type line:  str
+        """
+        self._not_implemented()
+
+    async def read_line(self):
+        """Read a line of the learner.
+
+        :return: str|None None at the end of the input
+        """
+        self._not_implemented()
+
+    async def send_question(self, numbers):
+        """Write the question."""
+        await self.write_line(f"{numbers}")
+
+    async def receive_answer(self):
+        """Read the answer."""
+        return await self.read_line()
+
+    async def send_feedback(self, feedback, session):
+        """Write the response time, the result and the score."""
+        if feedback.response_time is not None:
+            await self.write_line(
+                f"Temps de réponse : {feedback.response_time:04.2f} secondes")
+
+        if feedback.error is not None:
+            await self.write_line(f"Erreur de saisie: {feedback.error}")
+        elif feedback.good:
+            await self.write_line("Bonne réponse!")
+        else:
+            await self.write_line(
+                "Mauvaise réponse, le résulat attendue est: "
+                f"{feedback.result}")
+
+        await self.write_line(
+            f"Ton score est de {feedback.score} / {session.limit}")
+
+    async def send_error(self, error):
+        """Write the generation error."""
+        await self.write_line(f"Erreur de génération: {error}")
+
+    async def send_summary(self, session):
+        """Write the total time if the session is timed."""
+        if session.timer:
+            await self.write_line(
+                f"Temps de réponse total : {session.total_time:04.2f}")
+
+
+class ConsoleAdapter(TextAdapter):
+    """Adapter of the standard input and output.
+
+    The input is read in a thread to not block the event loop.
+    """
+
+    async def write_line(self, line):
+        """Print the line."""
+        print(line)
+
+    async def read_line(self):
+        """Read a line of the standard input."""
+        try:
+            return await asyncio.to_thread(input)
+        except EOFError:
+            return None
+
+
+class QueueAdapter(TextAdapter):
+    """Adapter exchanging the lines with queues.
+
+    The host puts the answers in the `answers` queue (None to leave)
+    and gets the lines sent in the `lines` queue.
+    """
+
+    def __init__(self):
+        """Init the queues."""
+        self.answers = asyncio.Queue()
+        self.lines = asyncio.Queue()
+
+    async def write_line(self, line):
+        """Put the line in the lines queue."""
+        await self.lines.put(line)
+
+    async def read_line(self):
+        """Get the next answer of the answers queue."""
+        return await self.answers.get()
@@ -0,0 +1,239 @@
+# coding: utf-8
+
+"""Module of the session engine.
+
+A session is a state machine: it asks the next question,
+takes the answer, scores it and times it.
+It never reads nor writes anything itself: the questions and the answers
+go through an I/O adapter (see io_adapter), so one event loop
+can run many sessions at the same time.
+"""
+
+import collections
+import timeit
+import uuid
+from ..errors import app_error as err
+from ..helpers import event_log as ns_el
+
+# states of a session.
+WAITING = "waiting"
+ASKING = "asking"
+FINISHED = "finished"
+
+# feedback of an answer: the error is set if the answer can't be validated.
+Feedback = collections.namedtuple(
+    "Feedback", ["good", "result", "response_time", "score", "error"])
+
+
+class Session():
+    """Session of operations asked to a learner."""
+
+    def __init__(self, operations, store, limit, timer=False, logger=None,
+                 close_store=False, clock=timeit.default_timer, events=None,
+                 learner=None):
+        """Init the session.
+
+        :param operations:  the (answer key, ComputeNumbers) tuples
+                            (see skip_answered)
+        :param store:       the answer store
+        :param limit:       the number of operations of the session
+        :param timer:       time the answers
+        :param logger:      the app logger
+        :param close_store: close the store at the end of the session,
+                            otherwise it is only flushed
+        :param clock:       the function returning the current time
+        :param events:      the sink of the session events
+        :param learner:     the learner of the session
+
+        :type operations:  iterable
+        :type store:       AnswerStore
+        :type limit:       int
+        :type timer:       bool
+        :type logger:      LoggerWrapper
+        :type close_store: bool
+        :type clock:       callable
+        :type events:      EventSink
+        :type learner:     str
+        """
+        self.operations = iter(operations)
+        self.store = store
+        self.limit = limit
+        self.timer = timer
+        self.logger = logger
+        self.close_store = close_store
+        self.clock = clock
+        self.events = events
+        self.learner = learner
+        self.session_id = uuid.uuid4().hex
+        self.state = WAITING
+        self.score = 0
+        self.answered = 0
+        self.total_time = 0
+        self.numbers = None
+        self._answer_key = None
+        self._asked_at = None
+
+    @property
+    def finished(self):
+        """Check if the session is finished."""
+        return self.state == FINISHED
+
+    def _check_state(self, state):
+        """Raise an error if the session is not in the state."""
+        if self.state != state:
+            raise err.SessionError(
+                f"the session is {self.state}: {state} state expected")
+
+    def next_question(self):
+        """Draw the next question of the session.
+
+        :return: ComputeNumbers|None None if the session is finished
+
+        :raise: SessionError if a question is waiting for its answer
+        :raise: BadArgumentError if the operations can't be generated,
+                the session is finished
+        """
+        self._check_state(WAITING)
+        try:
+            item = next(self.operations, None)
+        except err.BadArgumentError:
+            self.finish()
+            raise
+
+        if item is None:
+            self.finish()
+            return None
+
+        self._answer_key, self.numbers = item
+        if self.logger is not None:
+            self.logger.debug("operation generated: %s", self.numbers)
+
+        if self.events is not None:
+            self._emit(ns_el.QUESTION_EVENT, operation=str(self.numbers),
+                       key=self._answer_key)
+
+        self.state = ASKING
+        self._asked_at = self.clock()
+        return self.numbers
+
+    def submit(self, response):
+        """Validate the answer of the current question.
+
+        The answer is stored, then the session waits for the next question.
+
+        :param response: the answer given
+        :type response:  str
+
+        :return: Feedback
+
+        :raise: SessionError if no question is waiting for its answer
+        """
+        self._check_state(ASKING)
+        response_time = None
+        if self.timer:
+            response_time = self.clock() - self._asked_at
+            self.total_time += response_time
+
+        numbers = self.numbers
+        self.state = WAITING
+        self.answered += 1
+        try:
+            good = numbers.validate(response)
+        except ValueError as identifier:
+            # log a warning to not stop the session.
+            if self.logger is not None:
+                self.logger.warning("Input error: %s", identifier)
+
+            if self.events is not None:
+                self._emit(ns_el.ANSWER_EVENT, key=self._answer_key,
+                           good=None, time=response_time,
+                           error=str(identifier))
+
+            return Feedback(None, None, response_time, self.score,
+                            str(identifier))
+
+        if good:
+            self.score += 1
+
+        self.store.set(self._answer_key, good)
+        if self.events is not None:
+            self._emit(ns_el.ANSWER_EVENT, key=self._answer_key, good=good,
+                       time=response_time)
+
+        return Feedback(good, numbers.get_good_result(), response_time,
+                        self.score, None)
+
+    def finish(self):
+        """Finish the session and write its answers.
+
+        The session can be finished before its last question.
+        """
+        if self.state == FINISHED:
+            return
+
+        self.state = FINISHED
+        self.numbers = None
+        # write the last answers and close the store owned by the session
+        if self.close_store:
+            self.store.close()
+        else:
+            self.store.flush()
+
+        if self.logger is not None:
+            self.logger.info("final score: %d/%d", self.score, self.limit)
+            if self.timer:
+                self.logger.info("total time: %04.2f", self.total_time)
+
+        if self.events is not None:
+            self._emit(ns_el.SCORE_EVENT, score=self.score, limit=self.limit,
+                       answered=self.answered)
+            if self.timer:
+                self._emit(ns_el.TOTAL_TIME_EVENT, time=self.total_time)
+
+    def _emit(self, event, **fields):
+        """Write an event of the session."""
+        self.events.emit(event, session=self.session_id,
+                         learner=self.learner, **fields)
+
+
+async def run_session(session, adapter):
+    """Run a session through an I/O adapter.
+
+    The session is finished when the operations are exhausted,
+    when the adapter has no more answer or on error.
+
+    :param session: the session to run
+    :param adapter: the adapter of the learner
+
+    :type session: Session
+    :type adapter: IOAdapter
+
+    :return: Session
+    """
+    try:
+        while True:
+            try:
+                numbers = session.next_question()
+            except err.BadArgumentError as identifier:
+                await adapter.send_error(identifier)
+                if session.logger is not None:
+                    session.logger.error(
+                        "An error occured during operation generation",
+                        identifier)
+                break
+
+            if numbers is None:
+                break
+
+            await adapter.send_question(numbers)
+            response = await adapter.receive_answer()
+            if response is None:
+                # the learner left the session
+                break
+
+            await adapter.send_feedback(session.submit(response), session)
+    finally:
+        session.finish()
+
+    await adapter.send_summary(session)
+    return session
@@ -0,0 +1,232 @@
+# coding: utf-8
+
+"""Module of the session server.
+
+The server hosts many sessions on one event loop.
+The protocol is line-based: the server sends the lines of the command line
+application, the learner sends one answer by line (UTF-8).
+The learner leaves the session by closing the connection
+or with the quit command.
+"""
+
+import asyncio
+from .io_adapter import TextAdapter
+from .session import run_session
+from ..errors import app_error as err
+
+# command of the learner to leave the session.
+QUIT_COMMAND = "quit"
+
+# line asking the name of the learner.
+LEARNER_PROMPT = "Ton nom ?"
+
+
+class StreamAdapter(TextAdapter):
+    """Adapter of an asyncio TCP stream.
+
+    The lines are written in the buffer of the stream
+    and sent together when the answer is awaited,
+    so a feedback and the next question take one packet.
+    """
+
+    def __init__(self, reader, writer, timeout=None):
+        """Init the adapter.
+
+        :param reader:  the stream of the learner
+        :param writer:  the stream to the learner
+        :param timeout: the seconds to wait for an answer (None for ever)
+
+        :type reader:  asyncio.StreamReader
+        :type writer:  asyncio.StreamWriter
+        :type timeout: float
+        """
+        self.reader = reader
+        self.writer = writer
+        self.timeout = timeout
+
+    async def write_line(self, line):
+        """Write the line in the buffer of the stream."""
+        self.writer.write(f"{line}\n".encode("utf-8"))
+
+    async def read_line(self):
+        """Send the lines buffered and read the answer."""
+        try:
+            await self.writer.drain()
+            line = await asyncio.wait_for(self.reader.readline(),
+                                          self.timeout)
+        except (ConnectionError, asyncio.TimeoutError):
+            return None
+
+        if not line:
+            # end of the stream
+            return None
+
+        return parse_answer(line.decode("utf-8", errors="replace"))
+
+    async def close(self):
+        """Send the last lines and close the stream."""
+        try:
+            await self.writer.drain()
+            self.writer.close()
+            await self.writer.wait_closed()
+        except ConnectionError:
+            pass
+
+
+class WebSocketAdapter(TextAdapter):
+    """Adapter of a WebSocket connection (one line by message)."""
+
+    def __init__(self, websocket, timeout=None):
+        """Init the adapter.
+
+        :param websocket: the connection of the learner
+        :param timeout:   the seconds to wait for an answer (None for ever)
+
+        :type websocket: websockets.WebSocketServerProtocol
+        :type timeout:   float
+        """
+        self.websocket = websocket
+        self.timeout = timeout
+
+    async def write_line(self, line):
+        """Send the line in a message."""
+        import websockets
+        try:
+            await self.websocket.send(line)
+        except websockets.ConnectionClosed:
+            pass
+
+    async def read_line(self):
+        """Receive the answer message."""
+        import websockets
+        try:
+            message = await asyncio.wait_for(self.websocket.recv(),
+                                             self.timeout)
+        except (websockets.ConnectionClosed, asyncio.TimeoutError):
+            return None
+
+        if isinstance(message, bytes):
+            message = message.decode("utf-8", errors="replace")
+
+        return parse_answer(message)
+
+    async def close(self):
+        """Close the connection."""
+        await self.websocket.close()
+
+
+def parse_answer(line):
+    """Return the answer of a line.
+
+    :param line: the line received
+
+    :type line: str
+
+    :return: str|None None if the learner leaves the session
+    """
+    answer = line.strip()
+    if answer.lower() == QUIT_COMMAND:
+        return None
+
+    return answer
+
+
+class SessionServer():
+    """Server of the sessions over TCP and WebSocket."""
+
+    def __init__(self, session_factory, ask_learner=False, timeout=None,
+                 logger=None):
+        """Init the server.
+
+        :param session_factory: the function creating the session
+                                of a learner name (see create_session)
+        :param ask_learner:     ask the name of the learner first
+        :param timeout:         the seconds to wait for an answer
+        :param logger:          the app logger
+
+        :type session_factory: callable
+        :type ask_learner:     bool
+        :type timeout:         float
+        :type logger:          LoggerWrapper
+        """
+        self.session_factory = session_factory
+        self.ask_learner = ask_learner
+        self.timeout = timeout
+        self.logger = logger
+        # number of the sessions running and served
+        self.active = 0
+        self.served = 0
+
+    async def handle(self, adapter):
+        """Run a session through the adapter of a learner.
+
+        :param adapter: the adapter of the learner
+
+        :type adapter: StreamAdapter|WebSocketAdapter
+
+        :return: Session|None None if the session can't be created
+        """
+        session = None
+        self.active += 1
+        try:
+            learner = None
+            if self.ask_learner:
+                await adapter.write_line(LEARNER_PROMPT)
+                learner = await adapter.read_line()
+                if learner is None:
+                    return None
+
+            try:
+                session = self.session_factory(learner)
+            except err.BadArgumentError as identifier:
+                await adapter.send_error(identifier)
+                return None
+
+            await run_session(session, adapter)
+        except err.BadArgumentError as identifier:
+            # the session is already finished
+            if self.logger is not None:
+                self.logger.warning("session error: %s", identifier)
+        finally:
+            self.active -= 1
+            self.served += 1
+            await adapter.close()
+
+        return session
+
+    async def handle_stream(self, reader, writer):
+        """Handle a TCP connection."""
+        await self.handle(StreamAdapter(reader, writer, self.timeout))
+
+    async def handle_websocket(self, websocket, *args):
+        """Handle a WebSocket connection."""
+        await self.handle(WebSocketAdapter(websocket, self.timeout))
+
+    async def start_tcp(self, host="127.0.0.1", port=0):
+        """Start listening on a TCP port.
+
+        :param host: the host of the server
+        :param port: the port (0 for any free port)
+
+        :type host: str
+        :type port: int
+
+        :return: asyncio.Server
+        """
+        return await asyncio.start_server(self.handle_stream, host, port)
+
+    async def start_websocket(self, host="127.0.0.1", port=0):
+        """Start listening on a WebSocket port.
+
+        The websockets package is required.
+
+        :param host: the host of the server
+        :param port: the port (0 for any free port)
+
+        :type host: str
+        :type port: int
+
+        :return: websockets server
+        """
+        import websockets
+        return await websockets.serve(self.handle_websocket, host, port)
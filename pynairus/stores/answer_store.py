@@ -0,0 +1,200 @@
+# coding: utf-8
+
+"""Module of the answer stores.
+
+A store keeps for each answer key (an operation packed with pack_operation)
+whether the answer given was good or not.
+"""
+
+import collections
+import time
+from ..errors import app_error as err
+
+# default max number of answers kept in memory.
+DEFAULT_MAX_SIZE = 100000
+
+
+class AnswerStore():
+    """Abstract class of answer store."""
+
+    def get(self, key):
+        """Return the answer stored for the key.
+
+        :param key: the answer key
+
+        :type key: int
+
+        :return: bool|None True for a good answer, False for a bad one,
+                 None if no answer is stored
+        """
+        self._not_implemented()
+
+    def set(self, key, good):
+        """Store the answer of the key.
+
+        :param key:  the answer key
+        :param good: True for a good answer, False otherwise
+
+        :type key:  int
+        :type good: bool
+        """
+        self._not_implemented()
+
+    def clear(self):
+        """Remove all the answers of the store."""
+        self._not_implemented()
+
+    def flush(self):
+        """Write the answers not written yet.
+
+            By default the answers are written immediately.
+            Override this method to write them by batches.
+        """
+        pass
+
+    def __len__(self):
+        """Return the number of answers stored."""
+        self._not_implemented()
+
+    def iter_keys(self):
+        """Iterate over the keys of the answers stored.
+
+        :return: iterator of int
+        """
+        self._not_implemented()
+
+    def get_fingerprint(self):
+        """Return the fingerprint of the answers stored.
+
+        The fingerprint changes when answers are stored,
+        so the data built from the answers (like a Bloom filter)
+        can be checked before being reused.
+
+        :return: bytes|None None if the store can't be fingerprinted
+        """
+        return None
+
+    def __contains__(self, key):
+        """Check if an answer is stored for the key."""
+        return self.get(key) is not None
+
+    def is_already_answered(self, key):
+        """Check if a good answer is stored for the key.
+
+        :param key: the answer key
+
+        :type key: int
+
+        :return: bool
+        """
+        return self.get(key) is True
+
+    def _not_implemented(self):
+        """Raise the error of the abstract methods."""
+        message = f"method not implemented for class {self.__class__.__name__}"
+        raise err.StoreError(message)
+
+
+class MemoryAnswerStore(AnswerStore):
+    """In-memory answer store with bounded size.
+
+    When the store is full, the least recently used answer is evicted.
+    If a ttl is given, the answers expire after ttl seconds.
+    """
+
+    def __init__(self, max_size=DEFAULT_MAX_SIZE, ttl=None,
+                 clock=time.monotonic):
+        """Init the store.
+
+        :param max_size: the max number of answers (None for no limit)
+        :param ttl:      the lifetime of the answers in seconds
+        :param clock:    the function returning the current time
+
+        :type max_size: int
+        :type ttl:      float
+        :type clock:    callable
+
+        :raise: BadArgumentError if the max size or the ttl are not positive
+        """
+        if max_size is not None and max_size < 1:
+            raise err.BadArgumentError(
+                f"the max size has to be positive: {max_size} given")
+
+        if ttl is not None and ttl <= 0:
+            raise err.BadArgumentError(
+                f"the ttl has to be positive: {ttl} given")
+
+        self.max_size = max_size
+        self.ttl = ttl
+        self.clock = clock
+        self._answers = collections.OrderedDict()
+
+    def get(self, key):
+        """Return the answer stored for the key.
+
+        :param key: the answer key
+
+        :type key: int
+
+        :return: bool|None
+        """
+        item = self._answers.get(key)
+        if item is None:
+            return None
+
+        good, expiry = item
+        if expiry is not None and expiry <= self.clock():
+            del self._answers[key]
+            return None
+
+        self._answers.move_to_end(key)
+        return good
+
+    def set(self, key, good):
+        """Store the answer of the key.
+
+        :param key:  the answer key
+        :param good: True for a good answer, False otherwise
+
+        :type key:  int
+        :type good: bool
+        """
+        expiry = None if self.ttl is None else self.clock() + self.ttl
+        self._answers[key] = (good, expiry)
+        self._answers.move_to_end(key)
+
+        # evict the least recently used answers
+        if self.max_size is not None:
+            while len(self._answers) > self.max_size:
+                self._answers.popitem(last=False)
+
+    def clear(self):
+        """Remove all the answers of the store."""
+        self._answers.clear()
+
+    def iter_keys(self):
+        """Iterate over the keys of the answers stored.
+
+        :return: iterator of int
+        """
+        return iter(list(self._answers))
+
+    def purge(self):
+        """Remove the expired answers.
+
+        :return: int the number of answers removed
+        """
+        if self.ttl is None:
+            return 0
+
+        now = self.clock()
+        expired = [key for key, (_, expiry) in self._answers.items()
+                   if expiry <= now]
+        for key in expired:
+            del self._answers[key]
+
+        return len(expired)
+
+    def __len__(self):
+        """Return the number of answers stored (expired included)."""
+        return len(self._answers)
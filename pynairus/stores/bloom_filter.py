@@ -0,0 +1,342 @@
+# coding: utf-8
+
+"""Module of the Bloom filter of the answer keys.
+
+The filter tells for sure when an answer key has never been stored,
+so most of the new operations skip the lookup in the answer store.
+"""
+
+import hashlib
+import math
+import os
+import struct
+from pathlib import Path
+from .answer_store import AnswerStore
+from ..errors import app_error as err
+
+# default rate of false positives.
+DEFAULT_ERROR_RATE = 0.01
+
+# default number of keys of a new filter.
+DEFAULT_CAPACITY = 100000
+
+# header of the filter files: magic, capacity, error rate, hashes, count
+# and fingerprint of the store of the keys (see AnswerStore.get_fingerprint).
+FILE_HEADER = struct.Struct("<4sQdIQ16s")
+FILE_MAGIC = b"PNB2"
+
+# fingerprint of the filters built from no store.
+NO_FINGERPRINT = bytes(16)
+
+# the keys in [-MAX_KEY, MAX_KEY[ are hashed on 8 bytes.
+MAX_KEY = 2 ** 63
+
+# mask of the first hash of a digest.
+HASH_MASK = 2 ** 64 - 1
+
+
+class BloomFilter():
+    """Compact probabilistic set of the answer keys."""
+
+    def __init__(self, capacity=DEFAULT_CAPACITY,
+                 error_rate=DEFAULT_ERROR_RATE):
+        """Init an empty filter.
+
+        The size of the filter is computed to keep the rate
+        of false positives under the error rate up to the capacity.
+
+        :param capacity:   the number of keys expected
+        :param error_rate: the rate of false positives (0 < rate < 1)
+
+        :type capacity:   int
+        :type error_rate: float
+
+        :raise: BadArgumentError if the capacity or the error rate are wrong
+        """
+        if capacity < 1:
+            raise err.BadArgumentError(
+                f"the capacity has to be positive: {capacity} given")
+
+        if not 0 < error_rate < 1:
+            raise err.BadArgumentError(
+                f"the error rate has to be in ]0, 1[: {error_rate} given")
+
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.size = math.ceil(
+            -capacity * math.log(error_rate) / math.log(2) ** 2)
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self.count = 0
+        self.bits = bytearray((self.size + 7) // 8)
+        # fingerprint of the store of the keys
+        self.fingerprint = NO_FINGERPRINT
+
+    def _hash(self, key):
+        """Return the first position and the step of the bits of a key.
+
+        The positions are derived from one digest by double hashing:
+        the position i is (h1 + i * h2) % size.
+        """
+        if -MAX_KEY <= key < MAX_KEY:
+            data = key.to_bytes(8, "little", signed=True)
+        else:
+            # the keys wider than 64 bits take more bytes
+            data = key.to_bytes((key.bit_length() + 8) // 8, "little",
+                                signed=True)
+
+        digest = int.from_bytes(hashlib.blake2b(data, digest_size=16).digest(),
+                                "little")
+        size = self.size
+        return ((digest & HASH_MASK) % size,
+                ((digest >> 64) | 1) % size)
+
+    def add(self, key):
+        """Add a key to the filter.
+
+        :param key: the answer key (see pack_operation)
+
+        :type key: int
+        """
+        position, step = self._hash(key)
+        bits = self.bits
+        size = self.size
+        added = False
+        for _ in range(self.hashes):
+            mask = 1 << (position & 7)
+            if not bits[position >> 3] & mask:
+                bits[position >> 3] |= mask
+                added = True
+
+            position = (position + step) % size
+
+        if added:
+            self.count += 1
+
+    def __contains__(self, key):
+        """Check if a key may be in the filter.
+
+        :param key: the answer key (see pack_operation)
+
+        :type key: int
+
+        :return: bool False if the key has never been added
+        """
+        position, step = self._hash(key)
+        bits = self.bits
+        size = self.size
+        for _ in range(self.hashes):
+            if not bits[position >> 3] >> (position & 7) & 1:
+                return False
+
+            position = (position + step) % size
+
+        return True
+
+    def __len__(self):
+        """Return the approximate number of keys added."""
+        return self.count
+
+    def clear(self):
+        """Remove all the keys of the filter."""
+        self.bits = bytearray(len(self.bits))
+        self.count = 0
+
+    def save(self, path):
+        """Save the filter in a file.
+
+        The file is replaced atomically.
+
+        :param path: the path of the file
+
+        :type path: str|Path
+        """
+        path = Path(path)
+        tmp_path = path.with_name(f"{path.name}.tmp")
+        with open(tmp_path, "wb") as file:
+            file.write(FILE_HEADER.pack(FILE_MAGIC, self.capacity,
+                                        self.error_rate, self.hashes,
+                                        self.count, self.fingerprint))
+            file.write(self.bits)
+
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path):
+        """Load a filter saved in a file.
+
+        :param path: the path of the file
+
+        :type path: str|Path
+
+        :return: BloomFilter
+
+        :raise: BadArgumentError if the file is not a valid filter
+        """
+        with open(path, "rb") as file:
+            header = file.read(FILE_HEADER.size)
+            bits = bytearray(file.read())
+
+        if len(header) < FILE_HEADER.size:
+            raise err.BadArgumentError(f"the file [{path}] is not a filter")
+
+        magic, capacity, error_rate, hashes, count, fingerprint = \
+            FILE_HEADER.unpack(header)
+        bloom_filter = cls(capacity, error_rate)
+        if magic != FILE_MAGIC or hashes != bloom_filter.hashes \
+                or len(bits) != len(bloom_filter.bits):
+            raise err.BadArgumentError(f"the file [{path}] is not a filter")
+
+        bloom_filter.bits = bits
+        bloom_filter.count = count
+        bloom_filter.fingerprint = fingerprint
+        return bloom_filter
+
+    @classmethod
+    def from_keys(cls, keys, capacity=DEFAULT_CAPACITY,
+                  error_rate=DEFAULT_ERROR_RATE):
+        """Build a filter with keys.
+
+        :param keys:       the answer keys
+        :param capacity:   the number of keys expected
+        :param error_rate: the rate of false positives
+
+        :type keys:       iterable
+        :type capacity:   int
+        :type error_rate: float
+
+        :return: BloomFilter
+        """
+        bloom_filter = cls(capacity, error_rate)
+        for key in keys:
+            bloom_filter.add(key)
+
+        return bloom_filter
+
+
+class BloomAnswerStore(AnswerStore):
+    """Answer store checking a Bloom filter before the lookups.
+
+    The keys not in the filter are never looked up in the store.
+    """
+
+    def __init__(self, store, bloom_filter, path=None):
+        """Init the store.
+
+        :param store:        the answer store to filter
+        :param bloom_filter: the filter of the keys of the store
+        :param path:         the file where the filter is saved on close
+
+        :type store:        AnswerStore
+        :type bloom_filter: BloomFilter
+        :type path:         str|Path
+        """
+        self.store = store
+        self.bloom_filter = bloom_filter
+        self.path = path
+        # number of lookups skipped with the filter
+        self.skipped = 0
+
+    @classmethod
+    def open(cls, store, path, error_rate=DEFAULT_ERROR_RATE):
+        """Filter a store with the filter saved in a file.
+
+        The filter is built from the keys of the store
+        if the file doesn't exist or is not a filter, if the filter is full
+        or if the store has changed since the filter was saved
+        (like the answers written without the filter).
+
+        :param store:      the answer store to filter
+        :param path:       the file of the filter
+        :param error_rate: the rate of false positives of a new filter
+
+        :type store:      AnswerStore
+        :type path:       str|Path
+        :type error_rate: float
+
+        :return: BloomAnswerStore
+
+        :raise: OSError if the filter can't be read,
+                the store is closed
+        """
+        try:
+            fingerprint = store.get_fingerprint() or NO_FINGERPRINT
+            bloom_filter = None
+            if Path(path).exists():
+                try:
+                    bloom_filter = BloomFilter.load(path)
+                except err.BadArgumentError:
+                    # not a filter file, rebuilt from the store
+                    bloom_filter = None
+                else:
+                    if bloom_filter.count > bloom_filter.capacity:
+                        error_rate = bloom_filter.error_rate
+                        bloom_filter = None
+                    elif bloom_filter.fingerprint != fingerprint:
+                        # stale filter
+                        bloom_filter = None
+
+            if bloom_filter is None:
+                capacity = max(DEFAULT_CAPACITY, 2 * len(store))
+                bloom_filter = BloomFilter.from_keys(store.iter_keys(),
+                                                     capacity, error_rate)
+                bloom_filter.fingerprint = fingerprint
+        except BaseException:
+            if hasattr(store, "close"):
+                store.close()
+            raise
+
+        return cls(store, bloom_filter, path)
+
+    def get(self, key):
+        """Return the answer stored for the key.
+
+        :param key: the answer key
+
+        :type key: int
+
+        :return: bool|None
+        """
+        if key not in self.bloom_filter:
+            self.skipped += 1
+            return None
+
+        return self.store.get(key)
+
+    def set(self, key, good):
+        """Store the answer of the key.
+
+        :param key:  the answer key
+        :param good: True for a good answer, False otherwise
+
+        :type key:  int
+        :type good: bool
+        """
+        self.bloom_filter.add(key)
+        self.store.set(key, good)
+
+    def clear(self):
+        """Remove all the answers of the store."""
+        self.store.clear()
+        self.bloom_filter.clear()
+
+    def flush(self):
+        """Write the answers and the filter."""
+        self.store.flush()
+        if self.path is not None:
+            self.bloom_filter.fingerprint = self.store.get_fingerprint() \
+                or NO_FINGERPRINT
+            self.bloom_filter.save(self.path)
+
+    def close(self):
+        """Write the filter and close the store if it can be."""
+        self.flush()
+        if hasattr(self.store, "close"):
+            self.store.close()
+
+    def iter_keys(self):
+        """Iterate over the keys of the answers stored."""
+        return self.store.iter_keys()
+
+    def __len__(self):
+        """Return the number of answers stored."""
+        return len(self.store)
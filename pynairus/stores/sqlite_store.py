@@ -0,0 +1,220 @@
+# coding: utf-8
+
+"""Module of the SQLite answer history.
+
+The answers are kept by learner across the sessions.
+"""
+
+import hashlib
+import sqlite3
+import time
+from .answer_store import AnswerStore
+from ..errors import app_error as err
+
+# default number of answers written in one transaction.
+DEFAULT_BATCH_SIZE = 100
+
+# default learner of the history.
+DEFAULT_LEARNER = "default"
+
+# size of the fingerprints of the history in bytes.
+FINGERPRINT_SIZE = 16
+
+# largest key stored as a SQLite integer, the wider keys are stored as blobs.
+MAX_INTEGER_KEY = 2 ** 63 - 1
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS answers (
+    learner     TEXT NOT NULL,
+    operation   INTEGER NOT NULL,
+    good        INTEGER NOT NULL,
+    answered_at REAL NOT NULL,
+    PRIMARY KEY (learner, operation)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS answers_learner_answered_at
+    ON answers (learner, answered_at);
+"""
+
+
+def to_sql_key(key):
+    """Convert an answer key to a SQLite value.
+
+    :param key: the answer key
+
+    :type key: int
+
+    :return: int|bytes
+    """
+    if key <= MAX_INTEGER_KEY:
+        return key
+
+    return key.to_bytes((key.bit_length() + 7) // 8, "little")
+
+
+def from_sql_key(value):
+    """Convert a SQLite value to an answer key.
+
+    :param value: the value converted with to_sql_key
+
+    :type value: int|bytes
+
+    :return: int
+    """
+    if isinstance(value, bytes):
+        return int.from_bytes(value, "little")
+
+    return value
+
+
+class SqliteAnswerStore(AnswerStore):
+    """Answer history of a learner stored in a SQLite database.
+
+    The answers are stored by packed operation key (see pack_operation),
+    the keys wider than 64 bits as blobs.
+    They are written by batches in a single transaction,
+    the answers not written yet are kept in memory.
+    """
+
+    def __init__(self, path, learner=DEFAULT_LEARNER,
+                 batch_size=DEFAULT_BATCH_SIZE):
+        """Open the history.
+
+        :param path:       the path of the database (or ":memory:")
+        :param learner:    the learner of the answers
+        :param batch_size: the number of answers written in a transaction
+
+        :type path:       str|Path
+        :type learner:    str
+        :type batch_size: int
+
+        :raise: BadArgumentError if the batch size is not positive
+        """
+        if batch_size < 1:
+            raise err.BadArgumentError(
+                f"the batch size has to be positive: {batch_size} given")
+
+        self.learner = learner
+        self.batch_size = batch_size
+        self._pending = {}
+        self.connection = sqlite3.connect(str(path))
+        self.connection.execute("PRAGMA journal_mode = WAL")
+        self.connection.execute("PRAGMA synchronous = NORMAL")
+        with self.connection:
+            self.connection.executescript(SCHEMA)
+
+    def __enter__(self):
+        """Enter in the context manager."""
+        return self
+
+    def __exit__(self, *args):
+        """Close the history at the end of the context manager."""
+        self.close()
+
+    def get(self, key):
+        """Return the answer stored for the key.
+
+        :param key: the answer key
+
+        :type key: int
+
+        :return: bool|None
+        """
+        if key in self._pending:
+            return self._pending[key][0]
+
+        row = self.connection.execute(
+            "SELECT good FROM answers WHERE learner = ? AND operation = ?",
+            (self.learner, to_sql_key(key))).fetchone()
+
+        return None if row is None else bool(row[0])
+
+    def set(self, key, good):
+        """Store the answer of the key.
+
+        The answer is written with the next batch.
+
+        :param key:  the answer key
+        :param good: True for a good answer, False otherwise
+
+        :type key:  int
+        :type good: bool
+        """
+        self._pending[key] = (bool(good), time.time())
+        if len(self._pending) >= self.batch_size:
+            self.flush()
+
+    def set_many(self, answers):
+        """Store many answers.
+
+        :param answers: the (key, good) tuples
+
+        :type answers: iterable
+        """
+        for key, good in answers:
+            self._pending[key] = (bool(good), time.time())
+
+        self.flush()
+
+    def flush(self):
+        """Write the pending answers in a single transaction."""
+        if not self._pending:
+            return
+
+        with self.connection:
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO answers (learner, operation, good, \
+answered_at) VALUES (?, ?, ?, ?)",
+                ((self.learner, to_sql_key(key), good, answered_at)
+                 for key, (good, answered_at) in self._pending.items()))
+
+        self._pending.clear()
+
+    def iter_keys(self):
+        """Iterate over the keys of the answers of the learner.
+
+        :return: generator of int
+        """
+        self.flush()
+        for row in self.connection.execute(
+                "SELECT operation FROM answers WHERE learner = ?",
+                (self.learner,)):
+            yield from_sql_key(row[0])
+
+    def get_fingerprint(self):
+        """Return the fingerprint of the answers of the learner.
+
+        It's computed from the learner, the number of answers
+        and the time of the last one, so it changes with each answer
+        written, by this store or by another one.
+
+        :return: bytes (FINGERPRINT_SIZE bytes)
+        """
+        self.flush()
+        count, last_answered_at = self.connection.execute(
+            "SELECT COUNT(*), MAX(answered_at) FROM answers \
+WHERE learner = ?", (self.learner,)).fetchone()
+
+        return hashlib.blake2b(
+            f"{self.learner}\0{count}\0{last_answered_at!r}".encode(),
+            digest_size=FINGERPRINT_SIZE).digest()
+
+    def clear(self):
+        """Remove all the answers of the learner."""
+        self._pending.clear()
+        with self.connection:
+            self.connection.execute("DELETE FROM answers WHERE learner = ?",
+                                    (self.learner,))
+
+    def close(self):
+        """Write the pending answers and close the database."""
+        self.flush()
+        self.connection.close()
+
+    def __len__(self):
+        """Return the number of answers of the learner."""
+        self.flush()
+        row = self.connection.execute(
+            "SELECT COUNT(*) FROM answers WHERE learner = ?",
+            (self.learner,)).fetchone()
+
+        return row[0]
@@ -0,0 +1,190 @@
+# coding: utf-8
+
+"""Module of the array-backed operation batches.
+
+The numpy module is required to use it.
+"""
+
+from . import operator_strategy as ns_os
+from ..errors import app_error as err
+
+# Operator keys by operator code.
+OPERATOR_KEYS = tuple(sorted(ns_os.OPERATOR_CODES,
+                             key=ns_os.OPERATOR_CODES.get))
+
+
+class OperationView():
+    """Lightweight view on an operation of a batch.
+
+    The operands are the values stored in the batch
+    (the times are stored in seconds).
+    """
+
+    __slots__ = ("first", "second", "key")
+
+    def __init__(self, first, second, key):
+        """Constructor."""
+        self.first = first
+        self.second = second
+        self.key = key
+
+    def __repr__(self):
+        """String representation.
+
+        :return: str
+        """
+        return repr(self.to_operation())
+
+    @property
+    def operator(self):
+        """Return the operator displayed in the operation.
+
+        :return: str
+        """
+        return ns_os.STRATEGIES[self.key].operator
+
+    def to_operation(self):
+        """Build the operation of the view.
+
+        :return: ComputeNumbers
+        """
+        return ns_os.STRATEGIES[self.key].build_operation(self.first,
+                                                          self.second)
+
+    def validate(self, result):
+        """Validate the result.
+
+        :return: bool True if the result is right, False otherwise
+        """
+        return self.to_operation().validate(result)
+
+    def get_good_result(self):
+        """Return the expected result.
+
+        :return: int|str
+        """
+        return self.to_operation().get_good_result()
+
+
+class OperationBatch():
+    """Struct of arrays storing many operations.
+
+    Each operation costs 17 bytes: two int64 operands and one uint8 code.
+    """
+
+    def __init__(self, firsts, seconds, codes):
+        """Init the batch.
+
+        :param firsts:  the first operands
+        :param seconds: the second operands
+        :param codes:   the operator codes (see OPERATOR_CODES)
+
+        :type firsts:  array-like
+        :type seconds: array-like
+        :type codes:   array-like
+
+        :raise: BadArgumentError if the columns have different sizes
+        """
+        import numpy
+        self.firsts = numpy.asarray(firsts, dtype=numpy.int64)
+        self.seconds = numpy.asarray(seconds, dtype=numpy.int64)
+        self.codes = numpy.asarray(codes, dtype=numpy.uint8)
+
+        if not len(self.firsts) == len(self.seconds) == len(self.codes):
+            raise err.BadArgumentError(
+                f"the columns must have the same size: {len(self.firsts)}, \
+{len(self.seconds)}, {len(self.codes)} given")
+
+    @classmethod
+    def from_operands(cls, key, firsts, seconds):
+        """Create a batch of operations of the same operator.
+
+        :param key:     the key of the operator
+        :param firsts:  the first operands
+        :param seconds: the second operands
+
+        :type key:     str
+        :type firsts:  array-like
+        :type seconds: array-like
+
+        :return: OperationBatch
+
+        :raise: BadArgumentError if the operator not exists
+        """
+        import numpy
+        if key not in ns_os.OPERATOR_CODES:
+            raise err.BadArgumentError(f"the operator {key} not exists")
+
+        codes = numpy.full(len(firsts), ns_os.OPERATOR_CODES[key],
+                           dtype=numpy.uint8)
+        return cls(firsts, seconds, codes)
+
+    @classmethod
+    def concatenate(cls, batches):
+        """Concatenate many batches in a new one.
+
+        :param batches: the batches to concatenate
+
+        :type batches: iterable
+
+        :return: OperationBatch
+        """
+        import numpy
+        batches = list(batches)
+        return cls(numpy.concatenate([[]] + [b.firsts for b in batches]),
+                   numpy.concatenate([[]] + [b.seconds for b in batches]),
+                   numpy.concatenate([[]] + [b.codes for b in batches]))
+
+    def __len__(self):
+        """Return the number of operations of the batch."""
+        return len(self.codes)
+
+    def __getitem__(self, item):
+        """Return a view on an operation or a sub-batch.
+
+        :param item: an index, a slice, a mask or an array of indexes
+
+        :type item: int|slice|array-like
+
+        :return: OperationView|OperationBatch
+        """
+        if isinstance(item, slice) or hasattr(item, "__len__"):
+            return OperationBatch(self.firsts[item], self.seconds[item],
+                                  self.codes[item])
+
+        return OperationView(int(self.firsts[item]),
+                             int(self.seconds[item]),
+                             OPERATOR_KEYS[self.codes[item]])
+
+    def __iter__(self):
+        """Iterate over views on the operations of the batch."""
+        for first, second, code in zip(self.firsts.tolist(),
+                                       self.seconds.tolist(),
+                                       self.codes.tolist()):
+            yield OperationView(first, second, OPERATOR_KEYS[code])
+
+    def __repr__(self):
+        """String representation.
+
+        :return: str
+        """
+        return f"{self.__class__.__name__}(size={len(self)})"
+
+    @property
+    def nbytes(self):
+        """Return the memory used by the columns of the batch.
+
+        :return: int
+        """
+        return self.firsts.nbytes + self.seconds.nbytes + self.codes.nbytes
+
+    def select(self, key):
+        """Return the sub-batch of the operations of an operator.
+
+        :param key: the key of the operator
+
+        :type key: str
+
+        :return: OperationBatch
+        """
+        return self[self.codes == ns_os.OPERATOR_CODES.get(key)]
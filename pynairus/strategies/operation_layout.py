@@ -0,0 +1,349 @@
+# coding: utf-8
+
+"""Module of layouts mapping integer indexes to the operands of a strategy.
+
+A layout numbers all the distinct operands pairs a strategy can generate
+for a range, so that the pair at any index is computed in constant time.
+The pairs of an array of indexes are computed at once with numpy
+(see get_operands_array), the numpy module is required to use it.
+"""
+
+import bisect
+import math
+from ..errors import app_error as err
+
+
+class BaseLayout():
+    """Abstract class of operands layout."""
+
+    # number of operands pairs of the layout.
+    size = 0
+
+    def __len__(self):
+        """Return the number of operands pairs of the layout."""
+        return self.size
+
+    def get_operands(self, index):
+        """Return the operands pair at the index.
+
+        :param index: the index of the operands pair
+
+        :type index: int
+
+        :return: tuple (first, second)
+
+        :raise: IndexError if the index is out of range
+        """
+        if not 0 <= index < self.size:
+            raise IndexError(f"layout index out of range: {index} given")
+
+        return self._get_operands(index)
+
+    def _get_operands(self, index):
+        """Abstract method to implement in each layout."""
+        message = f"method not implemented for class {self.__class__.__name__}"
+        raise err.StrategyError(message)
+
+    def get_operands_array(self, indexes):
+        """Return the operands pairs of an array of indexes.
+
+        :param indexes: the indexes of the operands pairs
+
+        :type indexes: numpy.ndarray
+
+        :return: tuple of two numpy arrays (firsts, seconds)
+
+        :raise: IndexError if an index is out of range
+        """
+        import numpy
+        indexes = numpy.asarray(indexes, dtype=numpy.int64)
+        if len(indexes) == 0:
+            return (indexes, indexes.copy())
+
+        if indexes.min() < 0 or indexes.max() >= self.size:
+            raise IndexError("layout index out of range")
+
+        return self._get_operands_array(indexes)
+
+    def _get_operands_array(self, indexes):
+        """Abstract method to implement in each layout."""
+        message = f"method not implemented for class {self.__class__.__name__}"
+        raise err.StrategyError(message)
+
+    def contains(self, first, second):
+        """Check if an operands pair is in the layout.
+
+        :param first:  the first operand
+        :param second: the second operand
+
+        :type first:  int
+        :type second: int
+
+        :return: bool
+        """
+        message = f"method not implemented for class {self.__class__.__name__}"
+        raise err.StrategyError(message)
+
+    def contains_array(self, firsts, seconds):
+        """Check if the operands pairs of two arrays are in the layout.
+
+        :param firsts:  the first operands
+        :param seconds: the second operands
+
+        :type firsts:  numpy.ndarray
+        :type seconds: numpy.ndarray
+
+        :return: numpy array of bool
+        """
+        message = f"method not implemented for class {self.__class__.__name__}"
+        raise err.StrategyError(message)
+
+    def get_canonical(self):
+        """Return the layout without the swapped pairs.
+
+        A pair and its swapped pair are the same commutative operation.
+        By default the layout has no swapped pairs.
+        Override this method otherwise.
+
+        :return: BaseLayout
+        """
+        return self
+
+
+class RectangleLayout(BaseLayout):
+    """Layout of all the pairs of two ranges.
+
+    Ex. (1, 2) x (5, 6) => (1, 5), (1, 6), (2, 5), (2, 6)
+    """
+
+    def __init__(self, first_range, second_range):
+        """Init the layout.
+
+        :param first_range:  the (min, max) range of the first operand
+        :param second_range: the (min, max) range of the second operand
+
+        :type first_range:  tuple
+        :type second_range: tuple
+        """
+        self.first_min, self.first_max = first_range
+        self.second_min, self.second_max = second_range
+        self.width = max(0, self.second_max - self.second_min + 1)
+        self.size = max(0, self.first_max - self.first_min + 1) * self.width
+
+    def _get_operands(self, index):
+        """Return the operands pair at the index."""
+        row, col = divmod(index, self.width)
+        return (self.first_min + row, self.second_min + col)
+
+    def _get_operands_array(self, indexes):
+        """Return the operands pairs of an array of indexes."""
+        import numpy
+        rows, cols = numpy.divmod(indexes, self.width)
+        return (self.first_min + rows, self.second_min + cols)
+
+    def contains(self, first, second):
+        """Check if an operands pair is in the layout."""
+        return (self.first_min <= first <= self.first_max
+                and self.second_min <= second <= self.second_max)
+
+    def contains_array(self, firsts, seconds):
+        """Check if the operands pairs of two arrays are in the layout."""
+        return ((self.first_min <= firsts) & (firsts <= self.first_max)
+                & (self.second_min <= seconds) & (seconds <= self.second_max))
+
+    def get_canonical(self):
+        """Return the layout without the swapped pairs.
+
+        The pairs of the intersection of the ranges are kept
+        only once, with first >= second: they form a triangle.
+        The other pairs of the rectangle have no swapped pair.
+
+        :return: BaseLayout
+        """
+        low = max(self.first_min, self.second_min)
+        high = min(self.first_max, self.second_max)
+        if self.size == 0 or low > high:
+            return self
+
+        second_range = (self.second_min, self.second_max)
+        return ConcatLayout((
+            TriangleLayout(low, high),
+            RectangleLayout((self.first_min, low - 1), second_range),
+            RectangleLayout((high + 1, self.first_max), second_range),
+            RectangleLayout((low, high), (self.second_min, low - 1)),
+            RectangleLayout((low, high), (high + 1, self.second_max))))
+
+
+class TriangleLayout(BaseLayout):
+    """Layout of the pairs of a range where first >= second.
+
+    If strict, the pairs have to be first > second.
+    Ex. (1, 3) => (1, 1), (2, 1), (2, 2), (3, 1), (3, 2), (3, 3)
+    """
+
+    def __init__(self, start, end, strict=False):
+        """Init the layout.
+
+        :param start:  start range
+        :param end:    end range
+        :param strict: exclude the pairs of equal numbers
+
+        :type start:  int
+        :type end:    int
+        :type strict: bool
+        """
+        self.start = start
+        self.end = end
+        self.strict = strict
+        # number of rows of the triangle
+        rows = max(0, end - start + (0 if strict else 1))
+        self.size = rows * (rows + 1) // 2
+
+    def _get_operands(self, index):
+        """Return the operands pair at the index."""
+        # the row r starts at the index r * (r + 1) / 2
+        row = (math.isqrt(8 * index + 1) - 1) // 2
+        col = index - row * (row + 1) // 2
+        first = self.start + row + (1 if self.strict else 0)
+        return (first, self.start + col)
+
+    def _get_operands_array(self, indexes):
+        """Return the operands pairs of an array of indexes."""
+        import numpy
+        rows = ((numpy.sqrt(8.0 * indexes + 1) - 1) // 2).astype(numpy.int64)
+        # fix the rounding of the float square roots
+        rows -= rows * (rows + 1) // 2 > indexes
+        rows += (rows + 1) * (rows + 2) // 2 <= indexes
+        cols = indexes - rows * (rows + 1) // 2
+        firsts = self.start + rows + (1 if self.strict else 0)
+        return (firsts, self.start + cols)
+
+    def contains(self, first, second):
+        """Check if an operands pair is in the layout."""
+        if self.strict:
+            return self.start <= second < first <= self.end
+
+        return self.start <= second <= first <= self.end
+
+    def contains_array(self, firsts, seconds):
+        """Check if the operands pairs of two arrays are in the layout."""
+        below = seconds < firsts if self.strict else seconds <= firsts
+        return (self.start <= seconds) & below & (firsts <= self.end)
+
+
+class SegmentLayout(BaseLayout):
+    """Layout of segments of first operands sharing the same second operand.
+
+    Ex. [(4, 6, 2), (4, 6, 3)] => (4, 2), (5, 2), (6, 2), (4, 3), ...
+    """
+
+    def __init__(self, segments):
+        """Init the layout.
+
+        :param segments: the (first_min, first_max, second) segments
+
+        :type segments: iterable
+        """
+        self.segments = []
+        self.offsets = []
+        self.size = 0
+        for first_min, first_max, second in segments:
+            if first_min > first_max:
+                continue
+
+            self.segments.append((first_min, second))
+            self.offsets.append(self.size)
+            self.size += first_max - first_min + 1
+
+    def _get_operands(self, index):
+        """Return the operands pair at the index."""
+        position = bisect.bisect_right(self.offsets, index) - 1
+        first_min, second = self.segments[position]
+        return (first_min + index - self.offsets[position], second)
+
+    def _get_operands_array(self, indexes):
+        """Return the operands pairs of an array of indexes."""
+        import numpy
+        positions = numpy.searchsorted(self.offsets, indexes,
+                                       side="right") - 1
+        first_mins, seconds = numpy.array(self.segments,
+                                          dtype=numpy.int64).T
+        offsets = numpy.array(self.offsets, dtype=numpy.int64)
+        return (first_mins[positions] + indexes - offsets[positions],
+                seconds[positions])
+
+    def contains(self, first, second):
+        """Check if an operands pair is in the layout."""
+        ends = self.offsets[1:] + [self.size]
+        return any(segment_second == second
+                   and first_min <= first < first_min + end - offset
+                   for (first_min, segment_second), offset, end
+                   in zip(self.segments, self.offsets, ends))
+
+    def contains_array(self, firsts, seconds):
+        """Check if the operands pairs of two arrays are in the layout."""
+        import numpy
+        found = numpy.zeros(len(firsts), dtype=bool)
+        ends = self.offsets[1:] + [self.size]
+        for (first_min, second), offset, end in zip(self.segments,
+                                                    self.offsets, ends):
+            found |= ((seconds == second) & (first_min <= firsts)
+                      & (firsts < first_min + end - offset))
+
+        return found
+
+
+class ConcatLayout(BaseLayout):
+    """Layout of the pairs of many layouts, one after the other."""
+
+    def __init__(self, layouts):
+        """Init the layout.
+
+        :param layouts: the layouts to concatenate
+
+        :type layouts: iterable
+        """
+        self.layouts = []
+        self.offsets = []
+        self.size = 0
+        for layout in layouts:
+            if len(layout) == 0:
+                continue
+
+            self.layouts.append(layout)
+            self.offsets.append(self.size)
+            self.size += len(layout)
+
+    def _get_operands(self, index):
+        """Return the operands pair at the index."""
+        position = bisect.bisect_right(self.offsets, index) - 1
+        return self.layouts[position].get_operands(
+            index - self.offsets[position])
+
+    def _get_operands_array(self, indexes):
+        """Return the operands pairs of an array of indexes."""
+        import numpy
+        positions = numpy.searchsorted(self.offsets, indexes,
+                                       side="right") - 1
+        firsts = numpy.empty(len(indexes), dtype=numpy.int64)
+        seconds = numpy.empty(len(indexes), dtype=numpy.int64)
+        for position, (layout, offset) in enumerate(zip(self.layouts,
+                                                        self.offsets)):
+            selected = positions == position
+            firsts[selected], seconds[selected] = layout.get_operands_array(
+                indexes[selected] - offset)
+
+        return (firsts, seconds)
+
+    def contains(self, first, second):
+        """Check if an operands pair is in the layout."""
+        return any(layout.contains(first, second) for layout in self.layouts)
+
+    def contains_array(self, firsts, seconds):
+        """Check if the operands pairs of two arrays are in the layout."""
+        import numpy
+        found = numpy.zeros(len(firsts), dtype=bool)
+        for layout in self.layouts:
+            found |= layout.contains_array(firsts, seconds)
+
+        return found
@@ -0,0 +1,108 @@
+# coding: utf-8
+
+"""Module of the random-access operation spaces."""
+
+
+class OperationSpace():
+    """Sequence of all the distinct operations of a strategy for a range.
+
+    The operations are built on demand from their index,
+    so a space never materializes its operations.
+    A slice of a space is another space sharing the same layout.
+    """
+
+    def __init__(self, strategy, start, end, canonical=False):
+        """Init the space.
+
+        :param strategy:  the strategy of the operations
+        :param start:     start range
+        :param end:       end range
+        :param canonical: keep only one operation by question
+                          (3 + 4 and 4 + 3 are the same question)
+
+        :type strategy:  BaseStrategy
+        :type start:     int
+        :type end:       int
+        :type canonical: bool
+        """
+        self.strategy = strategy
+        self.start = start
+        self.end = end
+        self.canonical = canonical
+        if canonical:
+            self.layout = strategy.get_canonical_layout(start, end)
+        else:
+            self.layout = strategy.get_layout(start, end)
+        self.indexes = range(len(self.layout))
+
+    def __len__(self):
+        """Return the number of operations of the space."""
+        return len(self.indexes)
+
+    def __getitem__(self, item):
+        """Return the operation at the index or a sub-space for a slice.
+
+        :param item: the index or the slice
+
+        :type item: int|slice
+
+        :return: ComputeNumbers|OperationSpace
+
+        :raise: IndexError if the index is out of range
+        """
+        if isinstance(item, slice):
+            space = object.__new__(self.__class__)
+            space.__dict__.update(self.__dict__)
+            space.indexes = self.indexes[item]
+            return space
+
+        return self.strategy.build_operation(*self.get_operands(item))
+
+    def __iter__(self):
+        """Iterate over the operations of the space."""
+        for index in self.indexes:
+            yield self.strategy.build_operation(
+                *self.layout.get_operands(index))
+
+    def __repr__(self):
+        """String representation.
+
+        :return: str
+        """
+        return f"{self.__class__.__name__}({self.strategy.operator!r}, \
+{self.start}, {self.end}, size={len(self)})"
+
+    def get_operands(self, index):
+        """Return the operands pair at the index without building it.
+
+        :param index: the index of the operation in the space
+
+        :type index: int
+
+        :return: tuple (first, second)
+
+        :raise: IndexError if the index is out of range
+        """
+        return self.layout.get_operands(self.indexes[index])
+
+    def get_operands_array(self, indexes):
+        """Return the operands pairs of an array of indexes at once.
+
+        The numpy module is required to use it.
+
+        :param indexes: the indexes of the operations in the space
+
+        :type indexes: numpy.ndarray
+
+        :return: tuple of two numpy arrays (firsts, seconds)
+
+        :raise: IndexError if an index is out of range
+        """
+        import numpy
+        indexes = numpy.asarray(indexes, dtype=numpy.int64)
+        if len(indexes) and (indexes.min() < 0
+                             or indexes.max() >= len(self)):
+            raise IndexError("space index out of range")
+
+        return self.layout.get_operands_array(
+            self.indexes.start + self.indexes.step * indexes)
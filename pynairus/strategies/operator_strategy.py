@@ -2,8 +2,11 @@
 
 """Module of strategies for random mathematical operation generation."""
 
+import copy
 import random
-from ..helpers.string_helper import convert_seconds_to_time
+from ..helpers.time_helper import TimeValue
+from . import operation_layout as ns_ol
+from .operation_space import OperationSpace
 from ..validators import operator_validator as py_ov
 from ..errors import app_error as err
 
@@ -18,6 +21,35 @@ DOUBLE_DIV_OPERATOR_KEY = "2÷"
 TIME_ADD_KEY = "t+"
 TIME_SUB_KEY = "t-"
 
+# Compact codes of the operators, stored in the operation batches.
+OPERATOR_CODES = {
+    ADD_OPERATOR_KEY: 0,
+    SUB_OPERATOR_KEY: 1,
+    MULT_TABLE_OPERATOR_KEY: 2,
+    SIMPLE_MULT_OPERATOR_KEY: 3,
+    COMPLEX_MULT_OPERATOR_KEY: 4,
+    SINGLE_DIV_OPERATOR_KEY: 5,
+    DOUBLE_DIV_OPERATOR_KEY: 6,
+    TIME_ADD_KEY: 7,
+    TIME_SUB_KEY: 8
+}
+
+# Opcodes of the questions by validator type:
+# the multiplication and the division strategies ask the same questions.
+VALIDATOR_CODES = {
+    py_ov.AdditionValidator: OPERATOR_CODES[ADD_OPERATOR_KEY],
+    py_ov.SubstractionValidator: OPERATOR_CODES[SUB_OPERATOR_KEY],
+    py_ov.MultiplicationValidator: OPERATOR_CODES[MULT_TABLE_OPERATOR_KEY],
+    py_ov.DivisionValidator: OPERATOR_CODES[SINGLE_DIV_OPERATOR_KEY],
+    py_ov.TimeAdditionValidator: OPERATOR_CODES[TIME_ADD_KEY],
+    py_ov.TimeSubstractionValidator: OPERATOR_CODES[TIME_SUB_KEY]
+}
+
+# Bits of the opcode and of each operand in the packed operation keys:
+# the keys of the larger operands are wider (see pack_operation).
+OPCODE_BITS = 4
+OPERAND_BITS = 29
+
 
 def display_operators_list():
     """Display the available operators list."""
@@ -46,9 +78,202 @@ def get_operators_list():
     )
 
 
+def draw_operands(rng, first_range, second_range, size):
+    """Draw the operands of `size` operations in one numpy call.
+
+    :param rng:          the numpy random generator
+    :param first_range:  the (min, max) range of the first operand
+    :param second_range: the (min, max) range of the second operand
+    :param size:         the number of operations
+
+    :type rng:          numpy.random.Generator
+    :type first_range:  tuple
+    :type second_range: tuple
+    :type size:         int
+
+    :return: tuple of two numpy arrays (firsts, seconds)
+
+    :raise: ValueError if a min is greater than its max
+    """
+    low = [[first_range[0]], [second_range[0]]]
+    high = [[first_range[1]], [second_range[1]]]
+    firsts, seconds = rng.integers(low, high, size=(2, size), endpoint=True)
+    return firsts, seconds
+
+
+def draw_divisions(rng, start, end, divisor_range, size):
+    """Draw the dividends and the divisors of `size` divisions.
+
+    The divisors are drawn first, then each dividend is drawn
+    between its divisor and the end of the range.
+    The divisor range has to be checked against the dividend range.
+
+    :param rng:           the numpy random generator
+    :param start:         start range of the dividends
+    :param end:           end range of the dividends
+    :param divisor_range: the (min, max) range of the divisors
+    :param size:          the number of operations
+
+    :type rng:           numpy.random.Generator
+    :type start:         int
+    :type end:           int
+    :type divisor_range: tuple
+    :type size:          int
+
+    :return: tuple of two numpy arrays (dividends, divisors)
+
+    :raise: ValueError if a divisor is greater than the end range
+    """
+    import numpy
+    divisors = rng.integers(*divisor_range, size=size, endpoint=True)
+    dividends = rng.integers(numpy.maximum(divisors, start), end,
+                             endpoint=True)
+    return dividends, divisors
+
+
+def create_strategies(seed=None):
+    """Return a copy of the strategies with their own random generators.
+
+    With a seed, each strategy gets a stream derived from the seed
+    and its key, so the sessions are reproducible.
+
+    :param seed: the seed of the strategies
+
+    :type seed: int|str
+
+    :return: dict
+    """
+    return {key: strategy.spawn(None if seed is None else f"{seed}:{key}")
+            for key, strategy in STRATEGIES.items()}
+
+
+def get_operation_space(operator, start, end, canonical=False):
+    """Return the space of the distinct operations of an operator.
+
+    :param operator:  the key of the operator
+    :param start:     start range
+    :param end:       end range
+    :param canonical: keep only one operation by question
+
+    :type operator:  str
+    :type start:     int
+    :type end:       int
+    :type canonical: bool
+
+    :return: OperationSpace
+
+    :raise: BadArgumentError if the operator not exists
+    """
+    if operator not in STRATEGIES:
+        raise err.BadArgumentError(f"the operator {operator} not exists")
+
+    return STRATEGIES[operator].get_operation_space(start, end, canonical)
+
+
+def get_validator_code(validator):
+    """Return the opcode of the questions of a validator.
+
+    :param validator: the validator of the operation
+
+    :type validator: BaseValidator
+
+    :return: int
+
+    :raise: BadArgumentError if the validator has no opcode
+    """
+    for validator_class in type(validator).__mro__:
+        if validator_class in VALIDATOR_CODES:
+            return VALIDATOR_CODES[validator_class]
+
+    raise err.BadArgumentError(
+        f"the validator {type(validator).__name__} has no opcode")
+
+
+def pack_operand(operand):
+    """Pack an operand in a positive integer.
+
+    The negative operands are interleaved with the positive ones
+    (0, -1, 1, -2, 2... => 0, 1, 2, 3, 4...).
+
+    :param operand: the operand (the times are packed in seconds)
+
+    :type operand: int|TimeValue
+
+    :return: int
+    """
+    value = int(operand)
+    return value << 1 if value >= 0 else (-value << 1) - 1
+
+
+def unpack_operand(packed):
+    """Unpack an operand packed with pack_operand.
+
+    :param packed: the packed operand
+
+    :type packed: int
+
+    :return: int
+    """
+    return packed >> 1 if not packed & 1 else -((packed + 1) >> 1)
+
+
+def pack_operation(numbers):
+    """Pack an operation in a single integer key.
+
+    The key holds the canonical operands and the opcode of the question,
+    so the swapped commutative operations have the same key.
+    The operands packed in OPERAND_BITS bits give a key
+    fitting in a signed 64 bits integer.
+    The larger operands are packed in the width of the larger one,
+    after a marker bit giving the width: these keys have more than 64 bits.
+
+    :param numbers: the operation
+
+    :type numbers: ComputeNumbers
+
+    :return: int
+
+    :raise: BadArgumentError if the validator has no opcode
+    """
+    first, second = numbers.validator.get_canonical_operands(numbers.first,
+                                                             numbers.second)
+    first, second = pack_operand(first), pack_operand(second)
+    width = max(first.bit_length(), second.bit_length())
+    if width <= OPERAND_BITS:
+        key = (first << OPERAND_BITS) | second
+    else:
+        key = (((1 << width) | first) << width) | second
+
+    return (key << OPCODE_BITS) | get_validator_code(numbers.validator)
+
+
+def unpack_operation(key):
+    """Unpack an operation key.
+
+    :param key: the key packed with pack_operation
+
+    :type key: int
+
+    :return: tuple (opcode, first, second)
+    """
+    opcode = key & ((1 << OPCODE_BITS) - 1)
+    key >>= OPCODE_BITS
+    if key.bit_length() <= 2 * OPERAND_BITS:
+        width = OPERAND_BITS
+    else:
+        # the wide keys start with a marker bit
+        width = (key.bit_length() - 1) // 2
+
+    operand_mask = (1 << width) - 1
+    return (opcode, unpack_operand((key >> width) & operand_mask),
+            unpack_operand(key & operand_mask))
+
+
 class ComputeNumbers():
     """Compute the numbers and validate the result."""
 
+    __slots__ = ("first", "second", "operator", "validator")
+
     def __init__(self, first, second, operator, validator):
         """Constructor."""
         self.first = first
@@ -81,20 +306,146 @@ class ComputeNumbers():
 class BaseStrategy():
     """Abstract class of operator strategy."""
 
-    def __init__(self, validator):
+    # key of the strategy in the strategies dictionnary.
+    key = None
+
+    # operator of the operations built by the strategy.
+    operator = None
+
+    def __init__(self, validator, rng=None):
         """Init operator strategy.
 
             :param validator: the validator instance.
+            :param rng:       the random generator of the strategy.
 
             :type validator: BaseValidator
+            :type rng:       random.Random
         """
         self.validator = validator
+        self.rng = rng if rng is not None else random.Random()
+        self._batch_rng = None
+
+    def seed(self, seed=None):
+        """Reseed the random generators of the strategy.
+
+            :param seed: the seed of the generators.
+
+            :type seed: int|str
+        """
+        self.rng.seed(seed)
+        self._batch_rng = None
+
+    def spawn(self, seed=None):
+        """Return a copy of the strategy with its own random generator.
+
+            :param seed: the seed of the new generator.
+
+            :type seed: int|str
+
+            :return: BaseStrategy
+        """
+        strategy = copy.copy(self)
+        strategy.rng = random.Random(seed)
+        strategy._batch_rng = None
+        return strategy
 
     def generate_random(self, start, end):
         """Abstract method to implement in each strategy."""
         message = f"method not implemented for class {self.__class__.__name__}"
         raise err.StrategyError(message)
 
+    def generate_batch(self, start, end, size):
+        """Abstract method to implement in each strategy.
+
+        Generate `size` operations at once with numpy.
+        """
+        message = f"method not implemented for class {self.__class__.__name__}"
+        raise err.StrategyError(message)
+
+    def get_layout(self, start, end):
+        """Abstract method to implement in each strategy.
+
+        Return the layout of the distinct operations of the range.
+        """
+        message = f"method not implemented for class {self.__class__.__name__}"
+        raise err.StrategyError(message)
+
+    def count_operations(self, start, end):
+        """Return the number of distinct operations of the range.
+
+        :param start: start range
+        :param end:   end range
+
+        :type start:  int
+        :type end:    int
+
+        :return: int
+        """
+        return len(self.get_layout(start, end))
+
+    def get_canonical_layout(self, start, end):
+        """Return the layout of the distinct questions of the range.
+
+        With a commutative validator, the swapped operations
+        are the same question, so only one of them is kept.
+
+        :param start: start range
+        :param end:   end range
+
+        :type start:  int
+        :type end:    int
+
+        :return: BaseLayout
+        """
+        layout = self.get_layout(start, end)
+        if self.validator.commutative:
+            return layout.get_canonical()
+
+        return layout
+
+    def get_operation_space(self, start, end, canonical=False):
+        """Return the space of the distinct operations of the range.
+
+        :param start:     start range
+        :param end:       end range
+        :param canonical: keep only one operation by question
+
+        :type start:     int
+        :type end:       int
+        :type canonical: bool
+
+        :return: OperationSpace
+        """
+        return OperationSpace(self, start, end, canonical)
+
+    def build_operation(self, first, second):
+        """Build the operation of the strategy with its operands.
+
+        :param first:  the first operand
+        :param second: the second operand
+
+        :type first:  int
+        :type second: int
+
+        :return: ComputeNumbers
+        """
+        return ComputeNumbers(first, second, self.operator, self.validator)
+
+    def get_batch_rng(self):
+        """Return the numpy random generator of the strategy.
+
+        The generator is seeded from the random generator of the strategy.
+        The numpy module is required to use it.
+
+        :return: numpy.random.Generator
+        """
+        if self._batch_rng is None:
+            import numpy
+            self._batch_rng = numpy.random.default_rng(
+                self.rng.getrandbits(128))
+
+        return self._batch_rng
+
     def get_validator(self):
         """Return the validator of the strategy.
 
@@ -111,6 +462,9 @@ class AdditionStrategy(BaseStrategy):
         :type validator: AdditionValidator
     """
 
+    key = ADD_OPERATOR_KEY
+    operator = ADD_OPERATOR_KEY
+
     def generate_random(self, start, end):
         """Implementation of random generation for addition strategy.
 
@@ -122,12 +476,41 @@ class AdditionStrategy(BaseStrategy):
 
         :return: ComputeNumbers
         """
-        first = random.randint(start, end)
-        second = random.randint(start, end)
+        first = self.rng.randint(start, end)
+        second = self.rng.randint(start, end)
         return ComputeNumbers(first, second,
                               ADD_OPERATOR_KEY,
                               self.validator)
 
+    def generate_batch(self, start, end, size):
+        """Implementation of batch generation for addition strategy.
+
+        :param start: start range
+        :param end:   end range
+        :param size:  number of operations to generate
+
+        :type start:  int
+        :type end:    int
+        :type size:   int
+
+        :return: tuple of numpy arrays (firsts, seconds)
+        """
+        return draw_operands(self.get_batch_rng(), (start, end),
+                             (start, end), size)
+
+    def get_layout(self, start, end):
+        """Return the layout of the distinct operations of the range.
+
+        :param start: start range
+        :param end:   end range
+
+        :type start:  int
+        :type end:    int
+
+        :return: BaseLayout
+        """
+        return ns_ol.RectangleLayout((start, end), (start, end))
+
 
 class SubstractionStrategy(BaseStrategy):
     """Strategy for random substrations.
@@ -137,6 +520,9 @@ class SubstractionStrategy(BaseStrategy):
         :type validator: SubstractionValidator
     """
 
+    key = SUB_OPERATOR_KEY
+    operator = SUB_OPERATOR_KEY
+
     def generate_random(self, start, end):
         """Implementation of random generation for substraction strategy.
 
@@ -148,8 +534,8 @@ class SubstractionStrategy(BaseStrategy):
 
         :return: ComputeNumbers
         """
-        first = random.randint(start, end)
-        second = random.randint(start, end)
+        first = self.rng.randint(start, end)
+        second = self.rng.randint(start, end)
 
         # switch the numbers if the second number
         # is greater than the first number.
@@ -161,6 +547,39 @@ class SubstractionStrategy(BaseStrategy):
                               SUB_OPERATOR_KEY,
                               self.validator)
 
+    def generate_batch(self, start, end, size):
+        """Implementation of batch generation for substraction strategy.
+
+        :param start: start range
+        :param end:   end range
+        :param size:  number of operations to generate
+
+        :type start:  int
+        :type end:    int
+        :type size:   int
+
+        :return: tuple of numpy arrays (firsts, seconds)
+        """
+        import numpy
+        firsts, seconds = draw_operands(self.get_batch_rng(), (start, end),
+                                        (start, end), size)
+
+        # the first number musts be greater than equal the second number.
+        return numpy.maximum(firsts, seconds), numpy.minimum(firsts, seconds)
+
+    def get_layout(self, start, end):
+        """Return the layout of the distinct operations of the range.
+
+        :param start: start range
+        :param end:   end range
+
+        :type start:  int
+        :type end:    int
+
+        :return: BaseLayout
+        """
+        return ns_ol.TriangleLayout(start, end)
+
 
 class MutliplicationTableStrategy(BaseStrategy):
     """Strategy for random mutliplication table operations.
@@ -170,6 +589,9 @@ class MutliplicationTableStrategy(BaseStrategy):
         :type validator: MultiplicationValidator
     """
 
+    key = MULT_TABLE_OPERATOR_KEY
+    operator = MULT_TABLE_OPERATOR_KEY
+
     def generate_random(self, start, end):
         """Implementation of random generation
         for table multiplication strategy.
@@ -182,6 +604,46 @@ class MutliplicationTableStrategy(BaseStrategy):
 
         :return: ComputeNumbers
 
+        :raise: BadArgumentError in case of bad range
+        """
+        self.check_range(start, end)
+
+        first = self.rng.randint(start, end)
+        second = self.rng.randint(1, 10)
+        return ComputeNumbers(first,
+                              second,
+                              MULT_TABLE_OPERATOR_KEY,
+                              self.validator)
+
+    def generate_batch(self, start, end, size):
+        """Implementation of batch generation
+        for table multiplication strategy.
+
+        :param start: start range
+        :param end:   end range
+        :param size:  number of operations to generate
+
+        :type start:  int
+        :type end:    int
+        :type size:   int
+
+        :return: tuple of numpy arrays (firsts, seconds)
+
+        :raise: BadArgumentError in case of bad range
+        """
+        self.check_range(start, end)
+        return draw_operands(self.get_batch_rng(), (start, end),
+                             (1, 10), size)
+
+    def check_range(self, start, end):
+        """Check the range of the tables.
+
+        :param start: start range
+        :param end:   end range
+
+        :type start:  int
+        :type end:    int
+
         :raise: BadArgumentError in case of bad range
         """
         if start < 1 or start > 10:
@@ -194,12 +656,21 @@ class MutliplicationTableStrategy(BaseStrategy):
 {end} given"
             raise err.BadArgumentError(err_message)
 
-        first = random.randint(start, end)
-        second = random.randint(1, 10)
-        return ComputeNumbers(first,
-                              second,
-                              MULT_TABLE_OPERATOR_KEY,
-                              self.validator)
+    def get_layout(self, start, end):
+        """Return the layout of the distinct operations of the range.
+
+        :param start: start range
+        :param end:   end range
+
+        :type start:  int
+        :type end:    int
+
+        :return: BaseLayout
+
+        :raise: BadArgumentError in case of bad range
+        """
+        self.check_range(start, end)
+        return ns_ol.RectangleLayout((start, end), (1, 10))
 
 
 class SimpleMutliplicationStrategy(BaseStrategy):
@@ -210,6 +681,9 @@ class SimpleMutliplicationStrategy(BaseStrategy):
         :type validator: MultiplicationValidator
     """
 
+    key = SIMPLE_MULT_OPERATOR_KEY
+    operator = MULT_TABLE_OPERATOR_KEY
+
     def generate_random(self, start, end):
         """Implementation of random generation
         for simple multiplication strategy.
@@ -222,13 +696,43 @@ class SimpleMutliplicationStrategy(BaseStrategy):
 
         :return: ComputeNumbers
         """
-        first = random.randint(start, end)
-        second = random.randint(1, 9)
+        first = self.rng.randint(start, end)
+        second = self.rng.randint(1, 9)
         return ComputeNumbers(first,
                               second,
                               MULT_TABLE_OPERATOR_KEY,
                               self.validator)
 
+    def generate_batch(self, start, end, size):
+        """Implementation of batch generation
+        for simple multiplication strategy.
+
+        :param start: start range
+        :param end:   end range
+        :param size:  number of operations to generate
+
+        :type start:  int
+        :type end:    int
+        :type size:   int
+
+        :return: tuple of numpy arrays (firsts, seconds)
+        """
+        return draw_operands(self.get_batch_rng(), (start, end),
+                             (1, 9), size)
+
+    def get_layout(self, start, end):
+        """Return the layout of the distinct operations of the range.
+
+        :param start: start range
+        :param end:   end range
+
+        :type start:  int
+        :type end:    int
+
+        :return: BaseLayout
+        """
+        return ns_ol.RectangleLayout((start, end), (1, 9))
+
 
 class ComplexMutliplicationStrategy(BaseStrategy):
     """Strategy for random mutliplication with n digits factor.
@@ -238,6 +742,9 @@ class ComplexMutliplicationStrategy(BaseStrategy):
         :type validator: MultiplicationValidator
     """
 
+    key = COMPLEX_MULT_OPERATOR_KEY
+    operator = MULT_TABLE_OPERATOR_KEY
+
     def generate_random(self, start, end):
         """Implementation of random generation
         for complex multiplication strategy.
@@ -250,26 +757,58 @@ class ComplexMutliplicationStrategy(BaseStrategy):
 
         :return: ComputeNumbers
         """
-        first = random.randint(start, end)
-        second = random.randint(start, end)
+        first = self.rng.randint(start, end)
+        second = self.rng.randint(start, end)
         return ComputeNumbers(first,
                               second,
                               MULT_TABLE_OPERATOR_KEY,
                               self.validator)
 
+    def generate_batch(self, start, end, size):
+        """Implementation of batch generation
+        for complex multiplication strategy.
 
-class SingleDivisorStrategy(BaseStrategy):
-    """Implementation of simple division strategy
-    Ex. 50 ÷ 3 = 16r2
+        :param start: start range
+        :param end:   end range
+        :param size:  number of operations to generate
 
-    :param validator: the validator instance.
+        :type start:  int
+        :type end:    int
+        :type size:   int
 
-    :type validator: DivisionValidator
+        :return: tuple of numpy arrays (firsts, seconds)
+        """
+        return draw_operands(self.get_batch_rng(), (start, end),
+                             (start, end), size)
+
+    def get_layout(self, start, end):
+        """Return the layout of the distinct operations of the range.
+
+        :param start: start range
+        :param end:   end range
+
+        :type start:  int
+        :type end:    int
+
+        :return: BaseLayout
+        """
+        return ns_ol.RectangleLayout((start, end), (start, end))
+
+
+class BaseDivisorStrategy(BaseStrategy):
+    """Abstract class of division strategies.
+
+    The dividend is drawn between the divisor and the end of the range,
+    so the operations are generated without any retry.
     """
 
+    operator = SINGLE_DIV_OPERATOR_KEY
+
+    # (min, max) range of the divisors, to define in each strategy.
+    divisor_range = None
+
     def generate_random(self, start, end):
-        """Implementation of random generation
-        for complex multiplication strategy.
+        """Implementation of random generation for division strategies.
 
         :param start: start range
         :param end:   end range
@@ -278,32 +817,40 @@ class SingleDivisorStrategy(BaseStrategy):
         :type end:    int
 
         :return: ComputeNumbers
+
+        :raise: BadArgumentError in case of bad range
         """
+        divisor_min, divisor_max = self.check_range(start, end)
+
         # generate the operator numbers
-        dividend = random.randint(start, end)
-        divisor = random.randint(2, 9)
-        # while the divisor is greater than the dividend
-        # we generate another random integer.
-        while divisor > dividend:
-            dividend = random.randint(start, end)
+        divisor = self.rng.randint(divisor_min, divisor_max)
+        dividend = self.rng.randint(max(start, divisor), end)
         return ComputeNumbers(dividend,
                               divisor,
                               SINGLE_DIV_OPERATOR_KEY,
                               self.validator)
 
+    def generate_batch(self, start, end, size):
+        """Implementation of batch generation for division strategies.
 
-class DoubleDivisorStrategy(BaseStrategy):
-    """Implementation of time subtraction strategy
-    Ex. 50 / 20 = 2r10
+        :param start: start range
+        :param end:   end range
+        :param size:  number of operations to generate
 
-    :param validator: the validator instance.
+        :type start:  int
+        :type end:    int
+        :type size:   int
 
-    :type validator: DivisionValidator
-    """
+        :return: tuple of numpy arrays (dividends, divisors)
 
-    def generate_random(self, start, end):
-        """Implementation of random generation
-        for complex multiplication strategy.
+        :raise: BadArgumentError in case of bad range
+        """
+        divisor_range = self.check_range(start, end)
+        return draw_divisions(self.get_batch_rng(), start, end,
+                              divisor_range, size)
+
+    def get_layout(self, start, end):
+        """Return the layout of the distinct operations of the range.
 
         :param start: start range
         :param end:   end range
@@ -311,20 +858,64 @@ class DoubleDivisorStrategy(BaseStrategy):
         :type start:  int
         :type end:    int
 
-        :return: ComputeNumbers
+        :return: BaseLayout
         """
-        # generate the operator numbers
-        dividend = random.randint(start, end)
-        divisor = random.randint(10, 99)
-        # while the divisor is greater than the dividend
-        # we generate another random integer.
-        while divisor > dividend:
-            dividend = random.randint(start, end)
+        divisor_min, divisor_max = self.divisor_range
+        return ns_ol.SegmentLayout(
+            (max(start, divisor), end, divisor)
+            for divisor in range(divisor_min, divisor_max + 1))
+
+    def check_range(self, start, end):
+        """Check the range of the dividends.
+
+        :param start: start range
+        :param end:   end range
+
+        :type start:  int
+        :type end:    int
+
+        :return: tuple (min, max) of the divisors allowed for the range
+
+        :raise: BadArgumentError in case of bad range
+        """
+        if start > end:
+            raise err.BadArgumentError(
+                f"the start param has to be lower than equal the end param: \
+{start} > {end} given")
+
+        divisor_min, divisor_max = self.divisor_range
+        if end < divisor_min:
+            raise err.BadArgumentError(
+                f"the end param has to be greater than equal {divisor_min}: \
+{end} given")
+
+        return divisor_min, min(divisor_max, end)
+
+
+class SingleDivisorStrategy(BaseDivisorStrategy):
+    """Implementation of simple division strategy
+    Ex. 50 ÷ 3 = 16r2
+
+    :param validator: the validator instance.
+
+    :type validator: DivisionValidator
+    """
+
+    key = SINGLE_DIV_OPERATOR_KEY
+    divisor_range = (2, 9)
 
-        return ComputeNumbers(dividend,
-                              divisor,
-                              SINGLE_DIV_OPERATOR_KEY,
-                              self.validator)
+
+class DoubleDivisorStrategy(BaseDivisorStrategy):
+    """Implementation of double division strategy
+    Ex. 50 / 20 = 2r10
+
+    :param validator: the validator instance.
+
+    :type validator: DivisionValidator
+    """
+
+    key = DOUBLE_DIV_OPERATOR_KEY
+    divisor_range = (10, 99)
 
 
 class TimeAdditionStrategy(BaseStrategy):
@@ -336,6 +927,9 @@ class TimeAdditionStrategy(BaseStrategy):
     :type validator: TimeAdditionValidator
     """
 
+    key = TIME_ADD_KEY
+    operator = ADD_OPERATOR_KEY
+
     def generate_random(self, start, end):
         """Implementation of random generation
         for complex multiplication strategy.
@@ -348,13 +942,59 @@ class TimeAdditionStrategy(BaseStrategy):
 
         :return: ComputeNumbers
         """
-        first = convert_seconds_to_time(random.randint(start, end))
-        second = convert_seconds_to_time(random.randint(start, end))
+        first = TimeValue(self.rng.randint(start, end))
+        second = TimeValue(self.rng.randint(start, end))
         return ComputeNumbers(first,
                               second,
                               ADD_OPERATOR_KEY,
                               self.validator)
 
+    def generate_batch(self, start, end, size):
+        """Implementation of batch generation for time addition strategy.
+        The times are returned in seconds.
+
+        :param start: start range
+        :param end:   end range
+        :param size:  number of operations to generate
+
+        :type start:  int
+        :type end:    int
+        :type size:   int
+
+        :return: tuple of numpy arrays (firsts, seconds)
+        """
+        return draw_operands(self.get_batch_rng(), (start, end),
+                             (start, end), size)
+
+    def build_operation(self, first, second):
+        """Build the operation with time operands.
+
+        :param first:  the first time in seconds
+        :param second: the second time in seconds
+
+        :type first:  int
+        :type second: int
+
+        :return: ComputeNumbers
+        """
+        return ComputeNumbers(TimeValue(first),
+                              TimeValue(second),
+                              self.operator,
+                              self.validator)
+
+    def get_layout(self, start, end):
+        """Return the layout of the distinct operations of the range.
+
+        :param start: start range
+        :param end:   end range
+
+        :type start:  int
+        :type end:    int
+
+        :return: BaseLayout
+        """
+        return ns_ol.RectangleLayout((start, end), (start, end))
+
 
 class TimeSubstractionStrategy(BaseStrategy):
     """Implementation of time subtraction strategy
@@ -365,6 +1005,9 @@ class TimeSubstractionStrategy(BaseStrategy):
     :type validator: TimeSubstractionValidator
     """
 
+    key = TIME_SUB_KEY
+    operator = SUB_OPERATOR_KEY
+
     def generate_random(self, start, end):
         """Implementation of random generation
         for complex multiplication strategy.
@@ -377,8 +1020,8 @@ class TimeSubstractionStrategy(BaseStrategy):
 
         :return: ComputeNumbers
         """
-        first = random.randint(start, end)
-        second = random.randint(start, end)
+        first = self.rng.randint(start, end)
+        second = self.rng.randint(start, end)
 
         # switch the numbers if the second number
         # is greater than the first number.
@@ -386,13 +1029,72 @@ class TimeSubstractionStrategy(BaseStrategy):
             first, second = second, first
 
         if first == second:
-            second = random.randint(start, first)
+            second = self.rng.randint(start, first)
 
-        return ComputeNumbers(convert_seconds_to_time(first),
-                              convert_seconds_to_time(second),
+        return ComputeNumbers(TimeValue(first),
+                              TimeValue(second),
                               SUB_OPERATOR_KEY,
                               self.validator)
 
+    def generate_batch(self, start, end, size):
+        """Implementation of batch generation
+        for time substraction strategy.
+        The times are returned in seconds.
+
+        :param start: start range
+        :param end:   end range
+        :param size:  number of operations to generate
+
+        :type start:  int
+        :type end:    int
+        :type size:   int
+
+        :return: tuple of numpy arrays (firsts, seconds)
+        """
+        import numpy
+        rng = self.get_batch_rng()
+        tmp_firsts, tmp_seconds = draw_operands(rng, (start, end),
+                                                (start, end), size)
+
+        # the first time musts be greater than the second time.
+        firsts = numpy.maximum(tmp_firsts, tmp_seconds)
+        seconds = numpy.minimum(tmp_firsts, tmp_seconds)
+
+        # redraw the second time of the equal times when it's possible.
+        equals = (firsts == seconds) & (firsts > start)
+        seconds[equals] = rng.integers(start, firsts[equals])
+
+        return firsts, seconds
+
+    def build_operation(self, first, second):
+        """Build the operation with time operands.
+
+        :param first:  the first time in seconds
+        :param second: the second time in seconds
+
+        :type first:  int
+        :type second: int
+
+        :return: ComputeNumbers
+        """
+        return ComputeNumbers(TimeValue(first),
+                              TimeValue(second),
+                              self.operator,
+                              self.validator)
+
+    def get_layout(self, start, end):
+        """Return the layout of the distinct operations of the range.
+
+        :param start: start range
+        :param end:   end range
+
+        :type start:  int
+        :type end:    int
+
+        :return: BaseLayout
+        """
+        return ns_ol.TriangleLayout(start, end, strict=True)
+
 
 # Strategies dictionnary.
 MULT_VALIDATOR = py_ov.MultiplicationValidator()
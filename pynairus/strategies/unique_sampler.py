@@ -0,0 +1,82 @@
+# coding: utf-8
+
+"""Module for sampling operations without replacement."""
+
+from ..errors import app_error as err
+
+
+class UniqueSampler():
+    """Draw distinct questions from the operation space of a strategy.
+
+    The space is canonical, so two swapped commutative operations
+    are never drawn both. The operands of a commutative operation
+    drawn are swapped at random, if the swapped operation is in the range.
+
+    The draws use a lazy Fisher-Yates shuffle of the space indexes:
+    only the swapped indexes are stored, so each draw takes a constant time
+    and the memory grows with the number of draws, not with the space size.
+    """
+
+    def __init__(self, strategy, start, end):
+        """Init the sampler.
+
+        :param strategy: the strategy of the operations
+        :param start:    start range
+        :param end:      end range
+
+        :type strategy: BaseStrategy
+        :type start:    int
+        :type end:      int
+        """
+        self.strategy = strategy
+        self.space = strategy.get_operation_space(start, end, canonical=True)
+        # layout of all the operations, to swap the commutative ones
+        self.layout = None
+        if strategy.validator.commutative:
+            self.layout = strategy.get_layout(start, end)
+        self.drawn = 0
+        self._swaps = {}
+
+    def __len__(self):
+        """Return the number of operations not drawn yet."""
+        return len(self.space) - self.drawn
+
+    def check_capacity(self, count):
+        """Check that `count` distinct operations can still be drawn.
+
+        :param count: the number of operations to draw
+
+        :type count: int
+
+        :raise: BadArgumentError if there are not enough operations
+        """
+        if count > len(self):
+            raise err.BadArgumentError(
+                f"{count} distinct operations requested with the operator \
+{self.strategy.operator}: only {len(self)} available")
+
+    def draw(self):
+        """Draw an operation not drawn yet.
+
+        :return: ComputeNumbers
+
+        :raise: BadArgumentError if all the operations have been drawn
+        """
+        self.check_capacity(1)
+
+        # swap the current index with a random index not drawn yet.
+        current = self.drawn
+        index = self.strategy.rng.randrange(current, len(self.space))
+        drawn_index = self._swaps.get(index, index)
+        replacement = self._swaps.pop(current, current)
+        if index != current:
+            self._swaps[index] = replacement
+        self.drawn += 1
+
+        first, second = self.space.get_operands(drawn_index)
+        if self.layout is not None and first != second \
+                and self.layout.contains(second, first) \
+                and self.strategy.rng.random() < 0.5:
+            first, second = second, first
+
+        return self.strategy.build_operation(first, second)
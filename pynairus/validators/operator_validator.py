@@ -4,12 +4,47 @@
 
 from ..errors.app_error import BadArgumentError
 from ..errors.app_error import ValidateError
-from ..helpers.string_helper import parse_time_string, convert_seconds_to_time
+from ..helpers.time_helper import TimeValue
+
+
+def convert_int_answers(answers):
+    """Convert many answers in integers.
+
+        The answers which can't be converted are set to 0
+        and flagged as invalid.
+
+        :param answers: the answers to convert
+
+        :type answers: iterable
+
+        :return: tuple of numpy arrays (values, valids)
+    """
+    import numpy
+    try:
+        values = numpy.asarray(answers, dtype=numpy.int64)
+        return values, numpy.ones(len(values), dtype=bool)
+    except (TypeError, ValueError, OverflowError):
+        pass
+
+    # convert the answers one by one to flag the invalid ones
+    values = numpy.zeros(len(answers), dtype=numpy.int64)
+    valids = numpy.zeros(len(answers), dtype=bool)
+    for index, answer in enumerate(answers):
+        try:
+            values[index] = int(answer)
+            valids[index] = True
+        except (TypeError, ValueError, OverflowError):
+            pass
+
+    return values, valids
 
 
 class BaseValidator():
     """Abstract class for validators."""
 
+    # the order of the operands doesn't change the result.
+    commutative = False
+
     def validate(self, answer, first, second):
         """Validate the answer.
 
@@ -38,10 +73,102 @@ class BaseValidator():
         """
         return answer
 
+    def get_canonical_operands(self, first, second):
+        """Return the operands of the canonical form of the operation.
+
+            The operations of a commutative validator are the same
+            question in both orders (3 + 4 and 4 + 3),
+            so their canonical form has the greatest operand first.
+
+            :param first:  the first number of the operation
+            :param second: the second number of the operation
+
+            :type first:  int|TimeValue
+            :type second: int|TimeValue
+
+            :return: tuple (first, second)
+        """
+        if self.commutative and first < second:
+            return (second, first)
+
+        return (first, second)
+
+    def get_results(self, firsts, seconds):
+        """Return the good results of many operations.
+
+            By default the results are computed one by one.
+            Override this method to vectorize it.
+
+            :param firsts:  the first numbers of the operations
+            :param seconds: the second numbers of the operations
+
+            :type firsts:  iterable
+            :type seconds: iterable
+
+            :return: numpy.ndarray
+        """
+        import numpy
+        return numpy.array([self.get_result(first, second)
+                            for first, second in zip(firsts, seconds)])
+
+    def validate_many(self, answers, firsts, seconds):
+        """Validate many answers.
+
+            The answers which can't be converted are wrong.
 
-class AdditionValidator(BaseValidator):
+            :param answers: the answers to validate
+            :param firsts:  the first numbers of the operations
+            :param seconds: the second numbers of the operations
+
+            :type answers: iterable
+            :type firsts:  iterable
+            :type seconds: iterable
+
+            :return: numpy.ndarray of bool
+        """
+        import numpy
+        validated = []
+        for answer, result in zip(answers,
+                                  self.get_results(firsts, seconds)):
+            try:
+                validated.append(self.convert_answer(answer) == result)
+            except (TypeError, ValueError):
+                validated.append(False)
+
+        return numpy.array(validated, dtype=bool)
+
+
+class BaseIntegerValidator(BaseValidator):
+    """Abstract class for the validators of integer results."""
+
+    def convert_answer(self, answer):
+        """Convert the type of the answer."""
+        return int(answer)
+
+    def validate_many(self, answers, firsts, seconds):
+        """Validate many answers with vectorized operations.
+
+            The answers which can't be converted are wrong.
+
+            :param answers: the answers to validate
+            :param firsts:  the first numbers of the operations
+            :param seconds: the second numbers of the operations
+
+            :type answers: iterable
+            :type firsts:  iterable
+            :type seconds: iterable
+
+            :return: numpy.ndarray of bool
+        """
+        values, valids = convert_int_answers(answers)
+        return valids & (values == self.get_results(firsts, seconds))
+
+
+class AdditionValidator(BaseIntegerValidator):
     """Validator for addition."""
 
+    commutative = True
+
     def get_result(self, first, second):
         """Return the result of the addition.
 
@@ -55,12 +182,22 @@ class AdditionValidator(BaseValidator):
         """
         return first + second
 
-    def convert_answer(self, answer):
-        """Convert the type of the answer."""
-        return int(answer)
+    def get_results(self, firsts, seconds):
+        """Return the results of many additions.
+
+            :param firsts:  first numbers
+            :param seconds: second numbers
+
+            :type firsts:  array-like
+            :type seconds: array-like
+
+            :return: numpy.ndarray
+        """
+        import numpy
+        return numpy.asarray(firsts) + numpy.asarray(seconds)
 
 
-class SubstractionValidator(BaseValidator):
+class SubstractionValidator(BaseIntegerValidator):
     """Validator for substraction."""
 
     def get_result(self, first, second):
@@ -76,14 +213,26 @@ class SubstractionValidator(BaseValidator):
         """
         return first - second
 
-    def convert_answer(self, answer):
-        """Convert the type of the answer."""
-        return int(answer)
+    def get_results(self, firsts, seconds):
+        """Return the results of many substractions.
 
+            :param firsts:  first numbers
+            :param seconds: second numbers
+
+            :type firsts:  array-like
+            :type seconds: array-like
+
+            :return: numpy.ndarray
+        """
+        import numpy
+        return numpy.asarray(firsts) - numpy.asarray(seconds)
 
-class MultiplicationValidator(BaseValidator):
+
+class MultiplicationValidator(BaseIntegerValidator):
     """Validator for multiplication."""
 
+    commutative = True
+
     def get_result(self, first, second):
         """Return the result for the multiplication.
 
@@ -97,87 +246,101 @@ class MultiplicationValidator(BaseValidator):
         """
         return first * second
 
+    def get_results(self, firsts, seconds):
+        """Return the results of many multiplications.
+
+            :param firsts:  first numbers
+            :param seconds: second numbers
+
+            :type firsts:  array-like
+            :type seconds: array-like
+
+            :return: numpy.ndarray
+        """
+        import numpy
+        return numpy.asarray(firsts) * numpy.asarray(seconds)
+
+
+class BaseTimeValidator(BaseValidator):
+    """Abstract class for the validators of time results."""
+
     def convert_answer(self, answer):
-        """Convert the type of the answer."""
-        return int(answer)
+        """Convert the answer in time.
+
+            The answers which can't be parsed are converted to None,
+            so they are always wrong.
+
+            :param answer: the answer to convert
 
+            :type answer: str
 
-class TimeAdditionValidator(BaseValidator):
+            :return: TimeValue|None
+        """
+        try:
+            return TimeValue.parse(answer)
+        except (BadArgumentError, TypeError):
+            return None
+
+
+class TimeAdditionValidator(BaseTimeValidator):
     """Validator for time addition."""
 
+    commutative = True
+
     def get_result(self, first, second):
         """Return the result for the time addition.
 
             :param first:  first time
-            :param second: second ttime
+            :param second: second time
 
-            :type first:  str
-            :type second: str
+            :type first:  TimeValue|str
+            :type second: TimeValue|str
 
-            :return: str
+            :return: TimeValue
 
             :raise ValidateError: if an error occured while parsing the args
         """
 
         try:
-            # parse the firt time string
-            first_tuple = parse_time_string(first)
-            # parse the second time string
-            second_tuple = parse_time_string(second)
-            # add the hours, minutes and seconds
-            hours = first_tuple[0] + second_tuple[0]
-            mins = first_tuple[1] + second_tuple[1]
-            secs = first_tuple[2] + second_tuple[2]
-            # convert in seconds
-            timestamp = (hours * 60 * 60) + (mins * 60) + secs
-            # return the result
-            return convert_seconds_to_time(timestamp)
+            return TimeValue.convert(first) + TimeValue.convert(second)
         except BadArgumentError as error:
             raise ValidateError(
                 f"An error occured while validating: {first} + {second}",
                 error)
 
 
-class TimeSubstractionValidator(BaseValidator):
+class TimeSubstractionValidator(BaseTimeValidator):
     """Validator for substraction."""
 
     def get_result(self, first, second):
         """Return the result of the substraction.
 
-            :param first:  first number
-            :param second: second number
+            :param first:  first time
+            :param second: second time
 
-            :type first:  int
-            :type second: int
+            :type first:  TimeValue|str
+            :type second: TimeValue|str
 
-            :return: int
+            :return: TimeValue
 
             :raise ValidateError: if an error occured
         """
         try:
-            # parse the firt time string and convert in second
-            first_tuple = parse_time_string(first)
-            first_seconds = (first_tuple[0] * 60 * 60) + \
-                (first_tuple[1] * 60) + first_tuple[2]
-
-            # parse the second time string and convert in second
-            second_tuple = parse_time_string(second)
-            second_seconds = (second_tuple[0] * 60 * 60) + \
-                (second_tuple[1] * 60) + second_tuple[2]
-
-            # verify the numbers:
-            # second number must not be greater than the first one
-            if second_seconds > first_seconds:
-                raise ValidateError(
-                    f"The first time ({first}) isn't greater than {second}")
-
-            # return the final result
-            return convert_seconds_to_time(first_seconds - second_seconds)
+            first_time = TimeValue.convert(first)
+            second_time = TimeValue.convert(second)
         except BadArgumentError as error:
             raise ValidateError(
                 f"An error occured while validating: {first} - {second}",
                 error)
 
+        # verify the numbers:
+        # second number must not be greater than the first one
+        if second_time > first_time:
+            raise ValidateError(
+                f"The first time ({first}) isn't greater than {second}")
+
+        return first_time - second_time
+
 
 class DivisionValidator(BaseValidator):
     """Validator for multiplication."""
@@ -204,3 +367,53 @@ class DivisionValidator(BaseValidator):
         rest = f"r{tmp_rest}" if tmp_rest > 0 else ""
 
         return f"{quotient}{rest}"
+
+    def get_results(self, firsts, seconds):
+        """Return the results of many divisions.
+
+            :param firsts:  first numbers
+            :param seconds: second numbers
+
+            :type firsts:  array-like
+            :type seconds: array-like
+
+            :return: numpy.ndarray of str
+
+            :raise ValidateError: if a first number isn't greater
+                                  than its second number
+        """
+        import numpy
+        firsts = numpy.asarray(firsts, dtype=numpy.int64)
+        seconds = numpy.asarray(seconds, dtype=numpy.int64)
+
+        errors = numpy.flatnonzero(seconds > firsts)
+        if len(errors) > 0:
+            first, second = firsts[errors[0]], seconds[errors[0]]
+            message = f"The first number ({first}) isn't greater than {second}"
+            raise ValidateError(message)
+
+        quotients, tmp_rests = numpy.divmod(firsts, seconds)
+        rests = numpy.where(
+            tmp_rests > 0,
+            numpy.char.add("r", tmp_rests.astype(str)), "")
+
+        return numpy.char.add(quotients.astype(str), rests)
+
+    def validate_many(self, answers, firsts, seconds):
+        """Validate many answers with vectorized operations.
+
+            :param answers: the answers to validate
+            :param firsts:  the first numbers of the operations
+            :param seconds: the second numbers of the operations
+
+            :type answers: iterable
+            :type firsts:  iterable
+            :type seconds: iterable
+
+            :return: numpy.ndarray of bool
+        """
+        import numpy
+        results = self.get_results(firsts, seconds)
+        answers = numpy.array(
+            [answer if isinstance(answer, str) else "" for answer in answers])
+        return answers == results
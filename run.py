@@ -33,6 +33,18 @@ if __name__ == "__main__":
                         help="Add a timer")
     PARSER.add_argument("-l", "--list_operator", action=ListOperatorsAction,
                         help="Display the list of operators and exit")
+    PARSER.add_argument("-u", "--unique", action="store_true",
+                        help="Never repeat an operation")
+    PARSER.add_argument("-s", "--seed", type=int,
+                        help="Seed of the random operations")
+    PARSER.add_argument("-H", "--history", type=str,
+                        help="Path of the answer history database")
+    PARSER.add_argument("-L", "--learner", type=str,
+                        help="Learner of the answer history")
+    PARSER.add_argument("-B", "--bloom", type=str,
+                        help="Path of the Bloom filter of the answer history")
+    PARSER.add_argument("-E", "--events", type=str,
+                        help="Path of the JSON-lines event log")
     PARSER.add_argument("-c", "--config", type=str,
                         help="Specify a config name")
     PARSER.add_argument("-V", "--version", action=VersionAction,
@@ -45,7 +57,9 @@ if __name__ == "__main__":
         # otherwise we launch the application
         from pynairus.pymath import pymath
         pymath(start=ARGS.start, end=ARGS.end, limit=ARGS.limit,
-               operator=ARGS.operator, timer=ARGS.timer, config=ARGS.config)
+               operator=ARGS.operator, timer=ARGS.timer, config=ARGS.config,
+               unique=ARGS.unique, seed=ARGS.seed, history=ARGS.history,
+               learner=ARGS.learner, bloom=ARGS.bloom, events=ARGS.events)
     except err.BadArgumentError as exc:
         print("An error occured, please see the log!")
         ns_os.display_operators_list()
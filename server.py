@@ -0,0 +1,102 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+"""
+Serve sessions of ramdom operations to many learners
+
+Show the help:
+    $ python server.py -h
+
+Connect a learner:
+    $ nc 127.0.0.1 8765
+
+"""
+
+import asyncio
+from pynairus.config import app_context as ns_ac
+from pynairus.pymath import create_session
+from pynairus.helpers.event_log import EventSink
+from pynairus.sessions.session_server import SessionServer
+from pynairus.actions.list_operators_action import ListOperatorsAction
+from pynairus.actions.version_action import VersionAction
+
+
+async def serve(args):
+    """Serve the sessions until interrupted."""
+    app_context = ns_ac.init_app_context(
+        start=args.start, end=args.end, limit=args.limit,
+        operator=args.operator, timer=args.timer, config=args.config,
+        unique=args.unique, history=args.history)
+    logger = app_context.app_config.logger
+
+    # the sessions share the event log
+    events = None if args.events is None else EventSink(args.events)
+
+    def session_factory(learner):
+        options = dict(app_context.options, learner=learner, events=events)
+        return create_session(args.start, args.end, args.limit, options,
+                              logger)
+
+    server = SessionServer(session_factory,
+                           ask_learner=args.history is not None,
+                           timeout=args.idle_timeout, logger=logger)
+
+    tcp_server = await server.start_tcp(args.host, args.port)
+    print(f"TCP server on {args.host}:{args.port}")
+    if args.websocket_port is not None:
+        await server.start_websocket(args.host, args.websocket_port)
+        print(f"WebSocket server on {args.host}:{args.websocket_port}")
+
+    try:
+        async with tcp_server:
+            await tcp_server.serve_forever()
+    finally:
+        if events is not None:
+            events.close()
+
+
+if __name__ == "__main__":
+    import argparse
+    PARSER = argparse.ArgumentParser()
+
+    # Défines the positionals arguments
+    PARSER.add_argument("start", type=int,
+                        help="Start of the random range")
+    PARSER.add_argument("end", type=int,
+                        help="End of the random range")
+    PARSER.add_argument("limit", type=int,
+                        help="Limit of operations of each session")
+
+    # Defines the optionnal arguments
+    PARSER.add_argument("-o", "--operator", type=str,
+                        help="Add an operator (default: tuple('+', '-'))")
+    PARSER.add_argument("-t", "--timer", action="store_true",
+                        help="Add a timer")
+    PARSER.add_argument("-l", "--list_operator", action=ListOperatorsAction,
+                        help="Display the list of operators and exit")
+    PARSER.add_argument("-u", "--unique", action="store_true",
+                        help="Never repeat an operation")
+    PARSER.add_argument("-H", "--history", type=str,
+                        help="Path of the answer history database, \
+the learners give their name first")
+    PARSER.add_argument("-E", "--events", type=str,
+                        help="Path of the JSON-lines event log")
+    PARSER.add_argument("-c", "--config", type=str,
+                        help="Specify a config name")
+    PARSER.add_argument("--host", type=str, default="127.0.0.1",
+                        help="Host of the server (default: 127.0.0.1)")
+    PARSER.add_argument("-p", "--port", type=int, default=8765,
+                        help="TCP port of the server (default: 8765)")
+    PARSER.add_argument("-w", "--websocket_port", type=int,
+                        help="WebSocket port (websockets package required)")
+    PARSER.add_argument("-i", "--idle_timeout", type=float,
+                        help="Seconds before closing an idle session")
+    PARSER.add_argument("-V", "--version", action=VersionAction,
+                        help="Display the current version and exit")
+
+    ARGS = PARSER.parse_args()
+
+    try:
+        asyncio.run(serve(ARGS))
+    except KeyboardInterrupt:
+        pass
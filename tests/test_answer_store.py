@@ -0,0 +1,97 @@
+# coding: utf-8
+
+"""Unit tests for answer store module."""
+
+import unittest
+from pynairus.errors.app_error import BadArgumentError, StoreError
+from pynairus.stores import answer_store as ns_as
+
+
+class FakeClock():
+    """Clock moved by hand."""
+
+    def __init__(self):
+        """Constructor."""
+        self.now = 0
+
+    def __call__(self):
+        """Return the current time."""
+        return self.now
+
+
+class AnswerStoreTest(unittest.TestCase):
+    """Unit tests of the answer stores."""
+
+    def test_base_store(self):
+        """Test the abstract methods of AnswerStore."""
+        store = ns_as.AnswerStore()
+        for method, args in ((store.get, ((1, 2, "+"),)),
+                             (store.set, ((1, 2, "+"), True)),
+                             (store.clear, ()), (store.__len__, ())):
+            with self.assertRaisesRegex(StoreError, "AnswerStore",
+                                        msg=f"{method.__name__} error"):
+                method(*args)
+
+    def test_memory_store(self):
+        """Test the MemoryAnswerStore."""
+        store = ns_as.MemoryAnswerStore()
+        self.assertIsInstance(store, ns_as.AnswerStore,
+                              "1. instance of AnswerStore expected")
+        self.assertIsNone(store.get((1, 2, "+")), "2. no answer expected")
+
+        store.set((1, 2, "+"), True)
+        store.set((3, 2, "-"), False)
+        self.assertTrue(store.get((1, 2, "+")), "3. good answer expected")
+        self.assertFalse(store.get((3, 2, "-")), "4. bad answer expected")
+        self.assertTrue(store.is_already_answered((1, 2, "+")),
+                        "5. already answered expected")
+        self.assertFalse(store.is_already_answered((3, 2, "-")),
+                         "6. a bad answer is not answered")
+        self.assertIn((3, 2, "-"), store, "7. the answer has to be stored")
+        self.assertEqual(2, len(store), "8. two answers expected")
+
+        store.clear()
+        self.assertEqual(0, len(store), "9. the store has to be empty")
+
+        with self.assertRaises(BadArgumentError, msg="10. error expected"):
+            ns_as.MemoryAnswerStore(max_size=0)
+
+        with self.assertRaises(BadArgumentError, msg="11. error expected"):
+            ns_as.MemoryAnswerStore(ttl=0)
+
+    def test_lru_eviction(self):
+        """Test the eviction of the least recently used answers."""
+        store = ns_as.MemoryAnswerStore(max_size=3)
+        for first in range(3):
+            store.set((first, 1, "+"), True)
+
+        # the first answer is used, so the second one is evicted
+        self.assertTrue(store.get((0, 1, "+")), "1. answer expected")
+        store.set((3, 1, "+"), True)
+        self.assertEqual(3, len(store), "2. the size has to be capped")
+        self.assertNotIn((1, 1, "+"), store, "3. the answer is evicted")
+        self.assertIn((0, 1, "+"), store, "4. the answer is kept")
+
+        for first in range(1000):
+            store.set((first, 2, "+"), True)
+
+        self.assertEqual(3, len(store), "5. the size has to be capped")
+
+    def test_ttl_expiry(self):
+        """Test the expiry of the answers."""
+        clock = FakeClock()
+        store = ns_as.MemoryAnswerStore(ttl=10, clock=clock)
+        store.set((1, 2, "+"), True)
+        clock.now = 5
+        store.set((2, 2, "+"), True)
+
+        clock.now = 9
+        self.assertTrue(store.get((1, 2, "+")), "1. answer expected")
+
+        clock.now = 10
+        self.assertIsNone(store.get((1, 2, "+")), "2. the answer expired")
+        self.assertEqual(1, len(store), "3. the answer has to be removed")
+
+        clock.now = 15
+        self.assertEqual(1, store.purge(), "4. one answer purged")
+        self.assertEqual(0, len(store), "5. the store has to be empty")
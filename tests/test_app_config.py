@@ -2,8 +2,12 @@
 
 """Test module for AppConfig class."""
 
+import io
+import queue
+import tempfile
 import unittest
 import logging
+import logging.handlers
 from pathlib import Path
 import pynairus.config.app_config as py_ac
 from pynairus.errors.app_error import BadArgumentError
@@ -303,3 +307,180 @@ class AppConfigTest(unittest.TestCase):
             log_content = test_log_file.read()
             self.assertIs('', log_content,
                           msg="3. The log content must an empty string")
+
+
+class CountingHandler(logging.StreamHandler):
+    """Stream handler counting its flushes."""
+
+    def __init__(self, stream):
+        super().__init__(stream)
+        self.flushes = 0
+
+    def flush(self):
+        self.flushes += 1
+        super().flush()
+
+
+class LoggerWrapperTest(unittest.TestCase):
+    """Unit test class for the queued and lazy logging of LoggerWrapper."""
+
+    def setUp(self):
+        """Invoked before every tests."""
+        self.folder = tempfile.TemporaryDirectory()
+        self.path = Path(self.folder.name, "queue.log")
+        self.logger = logging.getLogger("pymath.test.queue")
+        self.logger.setLevel(logging.DEBUG)
+        self.logger.propagate = False
+        self.file_handler = logging.FileHandler(self.path)
+        self.file_handler.setLevel(logging.INFO)
+        self.logger.addHandler(self.file_handler)
+
+    def tearDown(self):
+        """Invoked after every tests."""
+        for handler in list(self.logger.handlers):
+            self.logger.removeHandler(handler)
+            handler.close()
+
+        self.folder.cleanup()
+
+    def test_queue(self):
+        """Test the records written by the listener."""
+        wrapper = py_ac.LoggerWrapper(self.logger, True, queue_enabled=True)
+        self.assertIsNotNone(wrapper.listener, "1. listener expected")
+        self.assertNotIn(self.file_handler, self.logger.handlers,
+                         "2. the handlers have to be moved")
+        self.assertIsInstance(self.logger.handlers[-1],
+                              logging.handlers.QueueHandler,
+                              "3. the records have to be queued")
+
+        for index in range(500):
+            wrapper.info(f"{TEST_INFO} {index}")
+        wrapper.debug(TEST_DEBUG)
+
+        wrapper.close()
+        lines = self.path.read_text().splitlines()
+        self.assertListEqual([f"{TEST_INFO} {index}" for index in range(500)],
+                             lines, "4. the records have to be written")
+        self.assertIn(self.file_handler, self.logger.handlers,
+                      "5. the handlers have to be given back")
+        self.assertIsNone(wrapper.listener, "6. the listener is stopped")
+
+        wrapper.close()
+        wrapper.clear()
+        self.assertEqual("", self.path.read_text(),
+                         "7. the log has to be cleared")
+        self.assertIsNotNone(wrapper.listener, "8. the queue is restarted")
+        wrapper.close()
+
+    def test_lazy_messages(self):
+        """Test the messages formatted only if logged."""
+        formatted = []
+
+        class Operation():
+            def __str__(self):
+                formatted.append(self)
+                return "1 + 2 = ?"
+
+        def message():
+            formatted.append(message)
+            return TEST_INFO
+
+        self.logger.setLevel(logging.INFO)
+        wrapper = py_ac.LoggerWrapper(self.logger, True)
+        self.assertFalse(wrapper.is_enabled_for(logging.DEBUG),
+                         "1. the debug level is disabled")
+        wrapper.debug("operation generated: %s", Operation())
+        wrapper.debug(message)
+        self.assertListEqual([], formatted,
+                             "2. the disabled messages are not formatted")
+
+        wrapper.info("operation generated: %s", Operation())
+        wrapper.info(message)
+        wrapper.log(logging.WARNING, "%d/%d", 1, 2)
+        wrapper.close()
+        self.assertEqual(1, formatted.count(message),
+                         "3. the message has to be built once")
+        self.assertListEqual(["operation generated: 1 + 2 = ?", TEST_INFO,
+                              "1/2"], self.path.read_text().splitlines(),
+                             "4. the messages have to be written")
+
+        wrapper = py_ac.LoggerWrapper(self.logger, False)
+        wrapper.info(message)
+        self.assertFalse(wrapper.is_enabled_for(logging.CRITICAL),
+                         "5. the log is disabled")
+        self.assertEqual(1, formatted.count(message),
+                         "6. the message is not built")
+
+    def test_sampling(self):
+        """Test the sampled messages and their summary."""
+        self.file_handler.setLevel(logging.DEBUG)
+        wrapper = py_ac.LoggerWrapper(self.logger, True,
+                                      sampling={"sample_rate": 10,
+                                                "rate_limit": 0,
+                                                "summary_interval": 3600})
+        for index in range(25):
+            wrapper.debug("operation %d already answered.", index)
+
+        wrapper.info("final score: %d/%d", 1, 2)
+        wrapper.info("final score: %d/%d", 2, 2)
+        wrapper.warning("%d warnings", 1)
+        wrapper.close()
+
+        lines = self.path.read_text().splitlines()
+        self.assertListEqual(["operation 0 already answered.",
+                              "operation 10 already answered.",
+                              "operation 20 already answered.",
+                              "final score: 1/2", "final score: 2/2",
+                              "1 warnings"], lines[:-1],
+                             "1. one debug in 10 and all the others expected")
+        self.assertEqual(
+            "22 log messages suppressed: "
+            "'operation %d already answered.' x22", lines[-1],
+            "2. the summary has to be written on close")
+
+        wrapper = py_ac.LoggerWrapper(self.logger, True,
+                                      sampling={"sample_rate": 10,
+                                                "level": logging.INFO})
+        wrapper.info("final score: %d/%d", 1, 2)
+        wrapper.info("final score: %d/%d", 2, 2)
+        wrapper.close()
+        self.assertEqual(1, self.path.read_text().count("final score: 2/2"),
+                         "3. the info messages sampled on demand")
+
+    def test_clear_rotation(self):
+        """Test the rotation of the log file on clear."""
+        wrapper = py_ac.LoggerWrapper(self.logger, True,
+                                      rotation={"max_bytes": 0,
+                                                "interval": 3600})
+        handler = self.logger.handlers[-1]
+        self.assertIsInstance(handler, py_ac.RotatingLogHandler,
+                              "1. the file handler has to be rotating")
+
+        wrapper.info(TEST_LOG)
+        wrapper.clear()
+        self.assertFalse(self.path.exists(),
+                         "2. the log file has to be rotated")
+        rotated_files = handler.get_rotated_files()
+        self.assertEqual(1, len(rotated_files), "3. a rotated file expected")
+        self.assertIn(TEST_LOG, Path(rotated_files[0]).read_text(),
+                      "4. the records have to be kept")
+
+    def test_batches(self):
+        """Test the flushes by batch."""
+        handler = CountingHandler(io.StringIO())
+        listener = py_ac.BatchQueueListener(queue.SimpleQueue(), handler,
+                                            batch_size=50)
+        records = [self.logger.makeRecord(self.logger.name, logging.INFO,
+                                          __file__, 1, f"{TEST_LOG} {index}",
+                                          None, None)
+                   for index in range(120)]
+        for record in records:
+            listener.queue.put(record)
+
+        listener.start()
+        listener.stop()
+
+        self.assertEqual(120, len(handler.stream.getvalue().splitlines()),
+                         "1. all the records have to be written")
+        self.assertEqual(3, handler.flushes,
+                         "2. the stream has to be flushed once by batch")
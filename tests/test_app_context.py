@@ -3,11 +3,17 @@
 """Test of the app_context module."""
 
 
+import asyncio
+import concurrent.futures
+import json
+import tempfile
+import time
 import unittest
 import logging
+from pathlib import Path
 from pynairus import config
 from pynairus.config import app_context as ac, app_config as ag
-from pynairus.errors.app_error import ConfigError
+from pynairus.errors.app_error import BadArgumentError, ConfigError
 from tests.config import TEST_CONFIG_FOLDER_PATH
 
 
@@ -22,10 +28,11 @@ class AppContextTest(unittest.TestCase):
     def tearDown(self):
         """Clean the tests."""
         ac.AppContext.clearContext()
+        ac.CONFIG_REGISTRY.clear()
         config.CONFIG_FOLDER = self.CONFIG_FOLDER_PATH
 
-    def test_app_context_singleton(self):
-        """Test the singleton creation of AppContext class."""
+    def test_app_context(self):
+        """Test the creation of AppContext class."""
 
         app_config = ag.AppConfig(logging.getLogger(), False)
         test_args = {
@@ -62,8 +69,169 @@ class AppContextTest(unittest.TestCase):
         self.assertEqual(2, len(app_context.options),
                          msg="7. 2 items musts remain in [options] property.")
 
-        self.assertIs(app_context, ac.AppContext(),
-                      msg="8. The instance musts be a singleton")
+        self.assertIsNone(ac.AppContext.get_instance(),
+                          msg="8. The instance musts not be shared")
+
+        token = ac.set_app_context(app_context)
+        self.assertIs(app_context, ac.get_app_context(),
+                      msg="9. The instance musts be the current context")
+        ac.reset_app_context(token)
+        self.assertIsNone(ac.get_app_context(),
+                          msg="10. The former context musts be restored")
+
+    def test_task_contexts(self):
+        """Test the contexts of concurrent asyncio tasks."""
+        app_config = ag.AppConfig(logging.getLogger(), False)
+        ac.CONFIG_REGISTRY.add(None, app_config)
+        ac.init_app_context(start=1, end=9, limit=1)
+
+        async def run_session(start):
+            app_context = ac.init_app_context(start=start, end=start + 9,
+                                              limit=1, operator="+")
+            # let the other tasks init their context
+            await asyncio.sleep(0)
+            return app_context is ac.get_app_context() \
+                and ac.get_app_context().start == start
+
+        async def run_sessions():
+            return await asyncio.gather(*(run_session(start)
+                                          for start in range(100)))
+
+        self.assertTrue(all(asyncio.run(run_sessions())),
+                        msg="1. Each task musts have its own context")
+        self.assertEqual(1, ac.get_app_context().start,
+                         msg="2. The context musts not be changed")
+
+        app_context = ac.init_app_context(start=2, end=4, limit=2)
+        self.assertIs(app_config, app_context.app_config,
+                      msg="3. The [AppConfig] musts be shared")
+
+    def test_config_registry(self):
+        """Test the cache of the app configs."""
+        parsed = []
+
+        def loader(config_name):
+            parsed.append(config_name)
+            return ag.AppConfig(logging.getLogger(config_name), False)
+
+        registry = ac.ConfigRegistry(max_size=2, loader=loader)
+        school_a = registry.get("a.ini")
+        self.assertIs(school_a, registry.get("a.ini"),
+                      msg="1. The config musts be cached")
+        registry.get("b.ini")
+        registry.get("a.ini")
+        registry.get("c.ini")
+        self.assertNotIn("b.ini", registry,
+                         msg="2. The least recently used config is evicted")
+        self.assertIn("a.ini", registry, msg="3. The config musts be kept")
+        self.assertEqual(2, len(registry), msg="4. Two configs expected")
+        self.assertListEqual(["a.ini", "b.ini", "c.ini"], parsed,
+                             msg="5. Each config musts be parsed once")
+
+        app_context = ac.init_app_context(registry, start=1, end=2, limit=2,
+                                          config="c.ini")
+        self.assertEqual(3, len(parsed), msg="6. The config musts be cached")
+        self.assertNotIn("registry", app_context.options,
+                         msg="7. The registry is not an option")
+
+        with self.assertRaises(BadArgumentError, msg="8. error expected"):
+            ac.ConfigRegistry(max_size=0)
+
+    def test_config_registry_threads(self):
+        """Test the configs parsed once by concurrent threads."""
+        parsed = []
+
+        def loader(config_name):
+            parsed.append(config_name)
+            # let the other threads ask the config meanwhile
+            time.sleep(0.05)
+            return ag.AppConfig(logging.getLogger(config_name), False)
+
+        registry = ac.ConfigRegistry(loader=loader)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=8) as pool:
+            configs = list(pool.map(registry.get,
+                                    ["a.ini", "b.ini"] * 20))
+
+        self.assertListEqual(["a.ini", "b.ini"], sorted(parsed),
+                             msg="1. Each config musts be parsed once")
+        self.assertEqual(2, len({id(app_config) for app_config in configs}),
+                         msg="2. The configs musts be shared")
+
+    def test_clear_once(self):
+        """Test the log cleared once for all the contexts of a config."""
+        cleared = []
+
+        def loader(config_name):
+            app_config = ag.AppConfig(logging.getLogger(config_name), False,
+                                      clear_onstart=True)
+            app_config.logger.clear = lambda: cleared.append(config_name)
+            return app_config
+
+        registry = ac.ConfigRegistry(loader=loader)
+        for _ in range(3):
+            ac.init_app_context(registry, start=1, end=2, limit=2,
+                                config="a.ini")
+
+        self.assertListEqual(["a.ini"], cleared,
+                             msg="The log musts be cleared once")
+
+    def test_config_registry_tenants(self):
+        """Test the loggers of two configs parsed one after the other."""
+        log_config = """[loggers]
+keys=root,{name}
+
+[handlers]
+keys=fileHandler
+
+[formatters]
+keys=fileFormatter
+
+[logger_root]
+level=WARNING
+handlers=
+
+[logger_{name}]
+level=DEBUG
+handlers=fileHandler
+qualname={name}
+propagate=0
+
+[handler_fileHandler]
+class=FileHandler
+level=DEBUG
+formatter=fileFormatter
+args=({path!r},)
+
+[formatter_fileFormatter]
+format=%(name)s - %(message)s
+"""
+        with tempfile.TemporaryDirectory() as folder:
+            for name in ("schoola", "schoolb"):
+                log_path = Path(folder, f"{name}.log")
+                Path(folder, f"{name}.conf").write_text(
+                    log_config.format(name=name, path=str(log_path)))
+                Path(folder, f"{name}.json").write_text(json.dumps(
+                    {"log": {"enabled": True, "logger_name": name,
+                             "config_name": str(Path(folder, f"{name}.conf")),
+                             "clear_onstart": False}}))
+
+            registry = ac.ConfigRegistry(
+                loader=lambda name: ag.parse_json(Path(folder, name)))
+            school_a = registry.get("schoola.json")
+            school_b = registry.get("schoolb.json")
+            school_a.logger.info("message of a")
+            school_b.logger.info("message of b")
+            school_a.logger.close()
+            school_b.logger.close()
+
+            self.assertFalse(school_a.logger.logger.disabled,
+                             msg="1. The first logger musts stay enabled")
+            self.assertEqual("schoola - message of a",
+                             Path(folder, "schoola.log").read_text().strip(),
+                             msg="2. The first logger musts write its log")
+            self.assertEqual("schoolb - message of b",
+                             Path(folder, "schoolb.log").read_text().strip(),
+                             msg="3. The second logger musts write its log")
 
     def test_app_context_bad_config(self):
         """Test with bad [app_config] property."""
@@ -225,15 +393,17 @@ class AppContextTest(unittest.TestCase):
         new_app_context = ac.init_app_context(
             start=1, end=9, limit=4, operator="*", config="config.ini")
 
-        self.assertIs(new_app_context, app_context,
-                      msg="2.1 The instances must be the same.")
-        self.assertEqual(1, app_context.start,
+        self.assertIsNot(new_app_context, app_context,
+                         msg="2.1 The instances must not be shared.")
+        self.assertEqual(1, new_app_context.start,
                          "2.2 [start] property musts be correct.")
-        self.assertEqual(9, app_context.end,
+        self.assertEqual(9, new_app_context.end,
                          "2.3 [end] property musts be correct.")
-        self.assertEqual(4, app_context.limit,
+        self.assertEqual(4, new_app_context.limit,
                          "2.4 [limit] property musts be correct.")
-        self.assertEqual("*", app_context.options.get("operator"),
+        self.assertEqual("*", new_app_context.options.get("operator"),
                          "2.5 The operator tuple musts be correct.")
-        self.assertIs(app_context.app_config, new_app_context.app_config,
-                      msg="2.6 The [AppConfig] instances must be the same")
+        self.assertEqual(2, app_context.start,
+                         "2.6 The former context musts not be changed.")
+        self.assertIs(new_app_context, ac.get_app_context(),
+                      msg="2.7 The new context musts be the current one")
@@ -25,3 +25,11 @@ class AppErrorTest(unittest.TestCase):
     def test_strategy_error(self):
         """Test the inheritance of StrategyError class."""
         self.assertIsInstance(py_ae.StrategyError(), Exception)
+
+    def test_store_error(self):
+        """Test the inheritance of StoreError class."""
+        self.assertIsInstance(py_ae.StoreError(), Exception)
+
+    def test_session_error(self):
+        """Test the inheritance of SessionError class."""
+        self.assertIsInstance(py_ae.SessionError(), Exception)
@@ -0,0 +1,145 @@
+# coding: utf-8
+
+"""Unit tests for Bloom filter module."""
+
+import sqlite3
+import tempfile
+import unittest
+from pathlib import Path
+from pynairus.errors.app_error import BadArgumentError
+from pynairus.stores.answer_store import MemoryAnswerStore
+from pynairus.stores.bloom_filter import BloomFilter, BloomAnswerStore
+from pynairus.stores.sqlite_store import SqliteAnswerStore
+
+
+class BloomFilterTest(unittest.TestCase):
+    """Unit tests of the Bloom filter."""
+
+    def setUp(self):
+        """Invoked before every tests."""
+        self.folder = tempfile.TemporaryDirectory()
+        self.path = Path(self.folder.name, "answers.bloom")
+
+    def tearDown(self):
+        """Invoked after every tests."""
+        self.folder.cleanup()
+
+    def test_filter(self):
+        """Test the keys of the filter."""
+        bloom_filter = BloomFilter(capacity=1000, error_rate=0.01)
+        self.assertEqual(9586, bloom_filter.size, "1. bad number of bits")
+        self.assertEqual(7, bloom_filter.hashes, "2. bad number of hashes")
+
+        keys = [first << 4 for first in range(1000)]
+        for key in keys:
+            bloom_filter.add(key)
+
+        self.assertTrue(all(key in bloom_filter for key in keys),
+                        "3. no false negative expected")
+        false_positives = sum((first << 4) | 1 in bloom_filter
+                              for first in range(10000))
+        self.assertLess(false_positives, 200,
+                        "4. the false positives have to be rare")
+
+        bloom_filter.clear()
+        self.assertEqual(0, len(bloom_filter), "5. the filter is empty")
+        self.assertNotIn(keys[0], bloom_filter, "6. the key is removed")
+
+        with self.assertRaises(BadArgumentError, msg="7. error expected"):
+            BloomFilter(capacity=0)
+
+        with self.assertRaises(BadArgumentError, msg="8. error expected"):
+            BloomFilter(error_rate=1)
+
+    def test_save_load(self):
+        """Test the persistence of the filter."""
+        bloom_filter = BloomFilter.from_keys([18, 2 ** 62 + 7], capacity=10)
+        bloom_filter.save(self.path)
+
+        loaded_filter = BloomFilter.load(self.path)
+        self.assertEqual(bloom_filter.bits, loaded_filter.bits,
+                         "1. the bits have to be loaded")
+        self.assertEqual(2, len(loaded_filter), "2. the count is loaded")
+        self.assertIn(2 ** 62 + 7, loaded_filter,
+                      "3. the key has to be loaded")
+
+        self.path.write_bytes(b"not a filter")
+        with self.assertRaises(BadArgumentError, msg="4. error expected"):
+            BloomFilter.load(self.path)
+
+    def test_bloom_store(self):
+        """Test the store filtered."""
+        store = BloomAnswerStore(MemoryAnswerStore(), BloomFilter(100))
+        store.set(18, True)
+        self.assertTrue(store.get(18), "1. answer expected")
+        self.assertIsNone(store.get(34), "2. no answer expected")
+        self.assertEqual(1, store.skipped, "3. the lookup has to be skipped")
+        self.assertEqual(1, len(store), "4. one answer expected")
+
+    def test_open(self):
+        """Test the filter saved with the history."""
+        history_path = Path(self.folder.name, "history.db")
+        with SqliteAnswerStore(history_path) as history:
+            history.set(18, True)
+
+        # the filter is built from the history
+        store = BloomAnswerStore.open(SqliteAnswerStore(history_path),
+                                      self.path)
+        self.assertIn(18, store.bloom_filter,
+                      "1. the filter has to be built from the history")
+        store.set(50, True)
+        store.close()
+
+        # the filter is loaded from the file
+        store = BloomAnswerStore.open(SqliteAnswerStore(history_path),
+                                      self.path)
+        self.assertEqual(2, len(store.bloom_filter),
+                         "2. the filter has to be loaded")
+        self.assertTrue(store.get(50), "3. answer expected")
+        store.close()
+
+    def test_bad_filter(self):
+        """Test the filter file which can't be loaded."""
+        history_path = Path(self.folder.name, "history.db")
+        with SqliteAnswerStore(history_path) as history:
+            history.set(18, True)
+
+        self.path.write_bytes(b"not a filter")
+        store = BloomAnswerStore.open(SqliteAnswerStore(history_path),
+                                      self.path)
+        self.assertIn(18, store.bloom_filter,
+                      "1. the filter has to be rebuilt from the history")
+        store.close()
+
+        history = SqliteAnswerStore(history_path)
+        with self.assertRaises(OSError, msg="2. error expected"):
+            BloomAnswerStore.open(history, self.folder.name)
+
+        with self.assertRaises(sqlite3.ProgrammingError,
+                               msg="3. the history has to be closed"):
+            history.get(18)
+
+    def test_stale_filter(self):
+        """Test the filter rebuilt after the history changed without it."""
+        history_path = Path(self.folder.name, "history.db")
+        store = BloomAnswerStore.open(SqliteAnswerStore(history_path),
+                                      self.path)
+        store.set(18, True)
+        store.close()
+
+        # the answers written without the filter (ex. by the server)
+        with SqliteAnswerStore(history_path) as history:
+            history.set(50, True)
+
+        store = BloomAnswerStore.open(SqliteAnswerStore(history_path),
+                                      self.path)
+        self.assertTrue(store.is_already_answered(50),
+                        "1. the filter has to be rebuilt")
+        store.close()
+
+        # the filter of another learner
+        store = BloomAnswerStore.open(
+            SqliteAnswerStore(history_path, learner="bob"), self.path)
+        self.assertEqual(0, len(store.bloom_filter),
+                         "2. the filter of the learner expected")
+        store.close()
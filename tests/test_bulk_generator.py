@@ -0,0 +1,118 @@
+# coding: utf-8
+
+"""Unit tests for bulk generator module."""
+
+import unittest
+from pynairus.bulk_generator import (generate_bank, generate_shard,
+                                     split_quota)
+from pynairus.errors.app_error import BadArgumentError
+from pynairus.strategies import operator_strategy as ns_os
+from pynairus.strategies.operation_batch import OperationBatch
+
+
+class BulkGeneratorTest(unittest.TestCase):
+    """Unit test of the bulk generator module."""
+
+    def test_generate_shard(self):
+        """Test the generation of a shard."""
+        import numpy
+        firsts, seconds = generate_shard("+", 1, 9, (9, 18), 9,
+                                         numpy.random.SeedSequence(1))
+
+        # the shard holds the canonical additions 4 + 4 to 6 + 3,
+        # their operands may be swapped
+        larger = numpy.maximum(firsts, seconds).tolist()
+        smaller = numpy.minimum(firsts, seconds).tolist()
+        self.assertListEqual([4, 5, 5, 5, 5, 5, 6, 6, 6], sorted(larger),
+                             "1. the operations have to be in the shard")
+        self.assertListEqual([1, 1, 2, 2, 3, 3, 4, 4, 5], sorted(smaller),
+                             "2. the operations have to be distinct")
+
+    def test_generate_bank(self):
+        """Test the generation of a bank over many processes."""
+        bank = generate_bank(1, 100, 1500, operators=("+", "-", "÷"),
+                             workers=2, seed=42)
+
+        self.assertIsInstance(bank, OperationBatch,
+                              "1. an OperationBatch is expected")
+
+        for operator in ("+", "-", "÷"):
+            batch = bank.select(operator)
+            keys = set(zip(batch.firsts.tolist(), batch.seconds.tolist()))
+            self.assertEqual(500, len(keys),
+                             f"2. {operator} operations have to be distinct")
+
+        batch = bank.select("÷")
+        self.assertTrue((batch.seconds <= batch.firsts).all(),
+                        "3. the divisions have to be valid")
+
+        same_bank = generate_bank(1, 100, 1500, operators=("+", "-", "÷"),
+                                  workers=2, seed=42)
+        self.assertListEqual(bank.firsts.tolist(), same_bank.firsts.tolist(),
+                             "4. the bank has to be seeded")
+        self.assertListEqual(bank.codes.tolist(), same_bank.codes.tolist(),
+                             "5. the bank has to be seeded")
+
+    def test_shared_questions(self):
+        """Test the questions of the operators sharing a validator."""
+        bank = generate_bank(1, 10, 50, operators=("×", "n×"), workers=2,
+                             seed=1)
+        keys = {ns_os.pack_operation(operation.to_operation())
+                for operation in bank}
+        self.assertEqual(50, len(keys),
+                         "1. the questions have to be distinct")
+        self.assertEqual(25, len(bank.select("n×")),
+                         "2. the quotas of the operators have to be kept")
+
+        # × and n× ask the same 55 questions from 1 to 10
+        with self.assertRaises(BadArgumentError,
+                               msg="3. not enough distinct questions"):
+            generate_bank(1, 10, 100, operators=("×", "n×"), workers=2,
+                          seed=1)
+
+    def test_swapped_operands(self):
+        """Test the order of the operands of the commutative operations."""
+        bank = generate_bank(1, 100, 4000, operators=("+", "-"), workers=2,
+                             seed=1)
+        additions = bank.select("+")
+        smaller_first = int((additions.firsts < additions.seconds).sum())
+        self.assertTrue(800 < smaller_first < 1200,
+                        "1. the operands have to be swapped at random")
+
+        subtractions = bank.select("-")
+        self.assertTrue((subtractions.seconds <= subtractions.firsts).all(),
+                        "2. the other operations can't be swapped")
+
+        bank = generate_bank(1, 100, 500, operators=("1×",), workers=2,
+                             seed=1)
+        self.assertTrue((bank.seconds <= 9).all(),
+                        "3. the swapped operations have to be in the range")
+
+    def test_large_range(self):
+        """Test the generation of a bank over a large range."""
+        # more than a billion canonical subtractions
+        bank = generate_bank(1, 50000, 10, operators=("-",), workers=2,
+                             seed=1)
+        keys = set(zip(bank.firsts.tolist(), bank.seconds.tolist()))
+        self.assertEqual(10, len(keys), "1. distinct operations expected")
+        self.assertTrue((bank.seconds <= bank.firsts).all(),
+                        "2. the subtractions have to be in the space")
+
+    def test_split_quota(self):
+        """Test the split of the quota between the shards."""
+        import numpy
+        rng = numpy.random.default_rng(1)
+        self.assertListEqual([10, 0, 10], split_quota([10, 0, 10], 20, rng),
+                             "1. the full shards expected")
+
+        sizes = [10, 2 * 10 ** 9, 10 ** 18]
+        counts = split_quota(sizes, 1000, rng)
+        self.assertEqual(1000, sum(counts), "2. the quota has to be kept")
+        self.assertTrue(all(count <= size
+                            for count, size in zip(counts, sizes)),
+                        "3. the counts are bounded by the shards")
+
+    def test_limit_exceeded(self):
+        """Test raise exception if the limit exceeds the operations."""
+        with self.assertRaisesRegex(BadArgumentError, "only 45 available"):
+            generate_bank(1, 9, 92, workers=1)
@@ -2,12 +2,22 @@
 
 """Test module for helpers module."""
 
+import re
+import tempfile
+import types
 import unittest
 from pynairus.helpers.file_helper import get_file_path, Path
 from pynairus.helpers import string_helper as sh
+from pynairus.helpers import time_codec as tc
+from pynairus.helpers import event_log as el
+from pynairus.helpers.time_helper import TimeValue
 from pynairus.config import CONFIG_FOLDER
 from pynairus.errors.app_error import BadArgumentError
 
+# regex of the former parsing of the time strings.
+TIME_PARSING_REGEX = re.compile(
+    r"((?P<hour>[\d]+)h)?((?P<minute>[\d]+)m)?(?P<second>[\d]+)s")
+
 
 class FileHelperTest(unittest.TestCase):
     """Unit test class for file helper module."""
@@ -92,3 +102,160 @@ class StringHelperTest(unittest.TestCase):
         # case timestamp < 1 second
         with self.assertRaises(BadArgumentError):
             sh.convert_seconds_to_time(0)
+
+
+class TimeCodecTest(unittest.TestCase):
+    """Unit test class for time codec module."""
+
+    def test_format_time(self):
+        """Test the [format_time] function against the reference format."""
+        for timestamp in range(1, tc.DAY_SECONDS + 1, 7):
+            secs = timestamp % 60
+            mins = timestamp // 60 % 60
+            hours = timestamp // 3600
+            expected = (f"{hours}h" if hours > 0 else "") \
+                + (f"{mins:02d}m" if mins > 0 else "") + f"{secs:02d}s"
+            self.assertEqual(expected, tc.format_time(timestamp),
+                             msg=f"1. bad format of {timestamp}")
+
+        with self.assertRaises(BadArgumentError, msg="2. error expected"):
+            tc.format_time(tc.DAY_SECONDS + 1)
+
+        with self.assertRaises(BadArgumentError, msg="3. error expected"):
+            tc.format_time(0)
+
+    def test_parse_time(self):
+        """Test the [parse_time] function against the regex."""
+        for time in ("1h24m03s", "54m25s", "45s", "1h05s", "25m1s", "007s",
+                     "23m", "h3s", "1hm3s", "3m1h4s", "1h2h3s", "1m2m3s",
+                     "s", "", "1h", "-1s", "1 s", "1h2m3ss", "+1s"):
+            match = TIME_PARSING_REGEX.fullmatch(time)
+            if match is None:
+                with self.assertRaisesRegex(BadArgumentError, "can't be parsed",
+                                            msg=f"1. [{time}] is invalid"):
+                    tc.parse_time(time)
+                continue
+
+            expected = tuple(int(match.group(name) or 0)
+                             for name in ("hour", "minute", "second"))
+            self.assertTupleEqual(expected, tc.parse_time(time),
+                                  msg=f"2. [{time}] bad parsing")
+
+        with self.assertRaises(TypeError, msg="3. a string is expected"):
+            tc.parse_time(None)
+
+    def test_parse_seconds(self):
+        """Test the [parse_seconds] function."""
+        self.assertEqual(1501, tc.parse_seconds("25m01s"),
+                         msg="1. bad seconds")
+        self.assertEqual(1501, tc.parse_seconds("25m1s"),
+                         msg="2. bad seconds")
+        self.assertEqual(5025, tc.parse_seconds("1h23m45s"),
+                         msg="3. bad seconds")
+
+    def test_batch(self):
+        """Test the batch functions."""
+        self.assertEqual(["25m01s", "1h00s", "01s"],
+                         tc.format_times([1501, 3600, 1]).tolist(),
+                         msg="1. bad formats")
+        self.assertEqual([], tc.format_times([]).tolist(),
+                         msg="2. empty batch expected")
+        self.assertEqual([1501, 1501, 3600],
+                         tc.parse_times(["25m01s", "25m1s", "1h00s"]).tolist(),
+                         msg="3. bad seconds")
+
+        with self.assertRaises(BadArgumentError, msg="4. error expected"):
+            tc.format_times([1, 0])
+
+        with self.assertRaises(BadArgumentError, msg="5. error expected"):
+            tc.parse_times(["1s", "2m"])
+
+
+class TimeHelperTest(unittest.TestCase):
+    """Unit test class for time helper module."""
+
+    def test_time_value(self):
+        """Test the [TimeValue] class."""
+        time = TimeValue(1501)
+        self.assertEqual(1501, time.seconds, msg="1. bad seconds")
+        self.assertEqual("25m01s", str(time), msg="2. bad display")
+        self.assertEqual("TimeValue(1501)", repr(time),
+                         msg="3. bad representation")
+        self.assertFalse(hasattr(time, "__dict__"),
+                         msg="4. the time must use slots")
+
+        self.assertEqual(TimeValue.parse("25m1s"), TimeValue.parse("25m01s"),
+                         msg="5. the parsed times must be equal")
+        self.assertEqual(time, TimeValue.parse("25m01s"),
+                         msg="6. the parsed time must be equal")
+        self.assertIs(time, TimeValue.convert(time),
+                      msg="7. the time must not be converted")
+        self.assertEqual(1, len({time, TimeValue(1501)}),
+                         msg="8. the equal times must have the same hash")
+
+        self.assertEqual(TimeValue(1561), time + TimeValue(60),
+                         msg="9. bad addition")
+        self.assertEqual(TimeValue(1441), time - TimeValue(60),
+                         msg="10. bad substraction")
+        self.assertTrue(TimeValue(60) < time, msg="11. bad comparison")
+        self.assertNotEqual(1501, time, msg="12. an int is not a time")
+
+        with self.assertRaisesRegex(BadArgumentError, "23m"):
+            TimeValue.parse("23m")
+
+
+class EventLogTest(unittest.TestCase):
+    """Unit test class for event log module."""
+
+    def setUp(self):
+        """Invoked before every tests."""
+        self.folder = tempfile.TemporaryDirectory()
+        self.path = Path(self.folder.name, "events.jsonl")
+
+    def tearDown(self):
+        """Invoked after every tests."""
+        self.folder.cleanup()
+
+    def test_sink(self):
+        """Test the [EventSink] class."""
+        with el.EventSink(self.path, clock=lambda: 12.3456) as sink:
+            sink.emit(el.ANSWER_EVENT, session="a", good=True, time=1.5)
+            sink.emit(el.SCORE_EVENT, session="a", score=1)
+
+        self.assertEqual(
+            '{"event":"answer","t":12.346,"session":"a","good":true,'
+            '"time":1.5}\n{"event":"score","t":12.346,"session":"a",'
+            '"score":1}\n', self.path.read_text(),
+            msg="1. one compact object by line expected")
+
+        with el.EventSink(self.path) as sink:
+            sink.emit(el.QUESTION_EVENT, operation="1 × 2 = ?")
+
+        self.assertEqual(3, len(self.path.read_text().splitlines()),
+                         msg="2. the events have to be appended")
+
+    def test_read_events(self):
+        """Test the [read_events] and [summarize_events] functions."""
+        with el.EventSink(self.path) as sink:
+            for index in range(10):
+                sink.emit(el.QUESTION_EVENT, session=index, key=index)
+                sink.emit(el.ANSWER_EVENT, session=index, good=index < 6,
+                          time=0.5)
+                sink.emit(el.SCORE_EVENT, session=index,
+                          score=int(index < 6))
+            sink.emit(el.ANSWER_EVENT, session=10, good=None, time=None,
+                      error="bad")
+
+        answers = el.read_events(self.path, el.ANSWER_EVENT)
+        self.assertIsInstance(answers, types.GeneratorType,
+                              msg="1. the events have to be streamed")
+        self.assertEqual(11, len(list(answers)),
+                         msg="2. only the answers expected")
+        self.assertEqual(31, len(list(el.read_events(self.path))),
+                         msg="3. all the events expected")
+
+        self.assertDictEqual(
+            {"sessions": 10, "questions": 10, "answers": 11, "good": 6,
+             "errors": 1, "response_time": 5, "timed": 10, "score": 6},
+            el.summarize_events(el.read_events(self.path)),
+            msg="4. bad summary")
@@ -0,0 +1,158 @@
+# coding: utf-8
+
+"""Unit tests for log_rotation module."""
+
+import gzip
+import logging
+import tempfile
+import unittest
+from pathlib import Path
+from pynairus.config import log_rotation as lr
+
+TEST_LOG = "0123456789"
+
+
+class LogRotationTest(unittest.TestCase):
+    """Unit test class for the rotation of the log files."""
+
+    def setUp(self):
+        """Invoked before every tests."""
+        self.folder = tempfile.TemporaryDirectory()
+        self.path = Path(self.folder.name, "rotation.log")
+        self.logger = logging.getLogger("pymath.test.rotation")
+        self.logger.setLevel(logging.INFO)
+        self.logger.propagate = False
+        self.now = 1000
+
+    def tearDown(self):
+        """Invoked after every tests."""
+        for handler in list(self.logger.handlers):
+            self.logger.removeHandler(handler)
+            handler.close()
+
+        self.folder.cleanup()
+
+    def clock(self):
+        """Return the fake time of the tests."""
+        return self.now
+
+    def add_handler(self, **kwargs):
+        """Add a rotating handler to the test logger."""
+        handler = lr.RotatingLogHandler(str(self.path), clock=self.clock,
+                                        **kwargs)
+        self.logger.addHandler(handler)
+        return handler
+
+    def test_size_rotation(self):
+        """Test the rotation by size."""
+        handler = self.add_handler(max_bytes=25, backup_count=2)
+        for _ in range(7):
+            # one second between two rotations to name the files in order
+            self.logger.info(TEST_LOG)
+            self.now += 1
+
+        self.assertEqual(f"{TEST_LOG}\n", self.path.read_text(),
+                         "1. the file holds the records below the size")
+        rotated_files = handler.get_rotated_files()
+        self.assertEqual(2, len(rotated_files),
+                         "2. the backups have to be bounded")
+        self.assertTrue(all(Path(path).read_text() == f"{TEST_LOG}\n" * 2
+                            for path in rotated_files),
+                        "3. the rotated files hold the records")
+        self.assertLess(rotated_files[0], rotated_files[1],
+                        "4. the rotated files sorted by time")
+
+    def test_time_rotation(self):
+        """Test the rotation by time with compression."""
+        handler = self.add_handler(interval=60, backup_count=3, compress=True)
+        self.logger.info(TEST_LOG)
+        self.now += 30
+        self.logger.info(TEST_LOG)
+        self.assertListEqual([], handler.get_rotated_files(),
+                             "1. no rotation before the interval")
+
+        self.now += 30
+        self.logger.info(TEST_LOG)
+        handler.close()
+
+        rotated_files = handler.get_rotated_files()
+        self.assertEqual(1, len(rotated_files), "2. a rotation expected")
+        self.assertTrue(rotated_files[0].endswith(".gz"),
+                        "3. the rotated file has to be compressed")
+        with gzip.open(rotated_files[0], "rt") as rotated:
+            self.assertEqual(f"{TEST_LOG}\n" * 2, rotated.read(),
+                             "4. the records before the rotation expected")
+
+        self.assertEqual(f"{TEST_LOG}\n", self.path.read_text(),
+                         "5. the records after the rotation expected")
+
+    def test_same_time_rotation(self):
+        """Test the names of the files rotated at the same time."""
+        handler = self.add_handler(max_bytes=5)
+        for _ in range(3):
+            self.logger.info(TEST_LOG)
+
+        rotated_files = handler.get_rotated_files()
+        self.assertEqual(2, len(set(rotated_files)),
+                         "the rotated files can't be overwritten")
+
+    def test_same_time_retention(self):
+        """Test the newest file kept when rotated many times in a second."""
+        handler = self.add_handler(max_bytes=1000, backup_count=1)
+        for message in ("one", "two", "three"):
+            self.logger.info(message)
+            handler.doRollover()
+
+        rotated_files = handler.get_rotated_files()
+        self.assertEqual(1, len(rotated_files), "1. one backup expected")
+        self.assertEqual("three\n", Path(rotated_files[0]).read_text(),
+                         "2. the newest rotated file has to be kept")
+
+    def test_read_rotation(self):
+        """Test the [read_rotation] function."""
+        self.assertIsNone(lr.read_rotation({}), "1. disabled by default")
+        self.assertIsNone(
+            lr.read_rotation({"rotate_size": "0", "rotate_interval": "0"}),
+            "2. disabled by the zero values")
+        self.assertDictEqual(
+            {"max_bytes": 1024, "interval": 0,
+             "backup_count": lr.DEFAULT_BACKUP_COUNT, "compress": True},
+            lr.read_rotation({"rotate_size": "1024",
+                              "rotate_compress": "yes"}),
+            "3. the str values have to be converted")
+        self.assertDictEqual(
+            {"max_bytes": 0, "interval": 3600, "backup_count": 2,
+             "compress": False},
+            lr.read_rotation({"rotate_interval": 3600, "rotate_backups": 2,
+                              "rotate_compress": False}),
+            "4. the typed values expected")
+
+    def test_install_rotation(self):
+        """Test the [install_rotation] function."""
+        file_handler = logging.FileHandler(self.path, delay=True)
+        file_handler.setLevel(logging.WARNING)
+        formatter = logging.Formatter("%(levelname)s %(message)s")
+        file_handler.setFormatter(formatter)
+        stream_handler = logging.StreamHandler()
+        self.logger.addHandler(file_handler)
+        self.logger.addHandler(stream_handler)
+
+        handlers = lr.install_rotation(
+            self.logger, lr.read_rotation({"rotate_size": 100}))
+        self.assertEqual(1, len(handlers), "1. one handler expected")
+        handler = handlers[0]
+        self.assertNotIn(file_handler, self.logger.handlers,
+                         "2. the file handler has to be replaced")
+        self.assertIn(stream_handler, self.logger.handlers,
+                      "3. the other handlers have to be kept")
+        self.assertEqual(str(self.path), handler.baseFilename,
+                         "4. the same file expected")
+        self.assertEqual(logging.WARNING, handler.level,
+                         "5. the level has to be kept")
+        self.assertIs(formatter, handler.formatter,
+                      "6. the formatter has to be kept")
+        self.assertEqual(100, handler.max_bytes, "7. the size expected")
+
+
+if __name__ == '__main__':
+    unittest.main()
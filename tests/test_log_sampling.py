@@ -0,0 +1,107 @@
+# coding: utf-8
+
+"""Unit tests for log_sampling module."""
+
+import logging
+import unittest
+from pynairus.config import log_sampling as ls
+from pynairus.errors.app_error import ConfigError
+
+TEST_KEY = "operation %s already answered."
+
+
+class LogSamplingTest(unittest.TestCase):
+    """Unit test class for the sampling of the log messages."""
+
+    def setUp(self):
+        """Invoked before every tests."""
+        self.now = 1000.0
+
+    def clock(self):
+        """Return the fake time of the tests."""
+        return self.now
+
+    def test_sample_rate(self):
+        """Test the sampling of one message in n."""
+        sampler = ls.LogSampler(sample_rate=3, clock=self.clock)
+        allowed = [sampler.allow(TEST_KEY) for _ in range(7)]
+        self.assertListEqual(
+            [True, False, False, True, False, False, True], allowed,
+            "1. one message in 3 expected")
+        self.assertTrue(sampler.allow("other"),
+                        "2. the keys have to be sampled apart")
+        self.assertDictEqual({TEST_KEY: 4}, sampler.pop_summary(),
+                             "3. the messages suppressed have to be counted")
+        self.assertDictEqual({}, sampler.pop_summary(),
+                             "4. the counts have to be reset")
+
+    def test_rate_limit(self):
+        """Test the rate limit by second."""
+        sampler = ls.LogSampler(rate_limit=2, clock=self.clock)
+        allowed = [sampler.allow(TEST_KEY) for _ in range(4)]
+        self.assertListEqual([True, True, False, False], allowed,
+                             "1. two messages by second expected")
+
+        self.now += 1
+        self.assertTrue(sampler.allow(TEST_KEY),
+                        "2. the messages are allowed the next second")
+        self.assertDictEqual({TEST_KEY: 2}, sampler.pop_summary(),
+                             "3. the messages suppressed have to be counted")
+
+    def test_summary_due(self):
+        """Test the interval of the summaries."""
+        sampler = ls.LogSampler(sample_rate=2, summary_interval=10,
+                                clock=self.clock)
+        self.assertFalse(sampler.summary_due(), "1. no summary expected")
+        self.now += 10
+        self.assertTrue(sampler.summary_due(), "2. summary expected")
+        sampler.pop_summary()
+        self.assertFalse(sampler.summary_due(),
+                         "3. the next summary has to be delayed")
+
+    def test_get_message_key(self):
+        """Test the [get_message_key] function."""
+        self.assertEqual(TEST_KEY, ls.get_message_key(TEST_KEY),
+                         "1. the template is the key")
+
+        def message():
+            return "message"
+
+        self.assertEqual(message.__qualname__, ls.get_message_key(message),
+                         "2. the name of the callable is the key")
+
+    def test_read_sampling(self):
+        """Test the [read_sampling] function."""
+        self.assertIsNone(ls.read_sampling({}), "1. disabled by default")
+        self.assertIsNone(
+            ls.read_sampling({"sample_rate": "1", "rate_limit": "0"}),
+            "2. disabled by the default values")
+        self.assertDictEqual(
+            {"sample_rate": 10, "rate_limit": 0,
+             "summary_interval": ls.DEFAULT_SUMMARY_INTERVAL,
+             "level": logging.DEBUG},
+            ls.read_sampling({"sample_rate": "10"}),
+            "3. the str values have to be converted")
+        self.assertDictEqual(
+            {"sample_rate": 1, "rate_limit": 5, "summary_interval": 30,
+             "level": logging.INFO},
+            ls.read_sampling({"rate_limit": 5, "summary_interval": 30,
+                              "sample_level": "info"}),
+            "4. the typed values expected")
+        with self.assertRaises(ConfigError, msg="5. unknown level"):
+            ls.read_sampling({"sample_rate": 2, "sample_level": "LOUD"})
+
+    def test_sample_level(self):
+        """Test the levels of the messages sampled."""
+        sampler = ls.LogSampler(sample_rate=2)
+        self.assertTrue(sampler.samples(logging.DEBUG),
+                        "1. the debug messages are sampled")
+        self.assertFalse(sampler.samples(logging.INFO),
+                         "2. the info messages are kept by default")
+        with self.assertRaises(ConfigError,
+                               msg="3. the warnings can't be sampled"):
+            ls.LogSampler(sample_rate=2, level=logging.WARNING)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,72 @@
+# coding: utf-8
+
+"""Unit tests for operation batch module."""
+
+import unittest
+from pynairus.strategies import operator_strategy as py_os
+from pynairus.strategies import operation_batch as py_ob
+from pynairus.errors import app_error as py_err
+
+
+class OperationBatchTest(unittest.TestCase):
+    """Unit test of the operation batch module."""
+
+    def test_operator_keys(self):
+        """Test the operator keys by code."""
+        self.assertEqual(len(py_os.STRATEGIES), len(py_ob.OPERATOR_KEYS),
+                         "1. each operator has to get a code")
+
+        for key, strategy in py_os.STRATEGIES.items():
+            self.assertEqual(key, strategy.key,
+                             f"2. {key} the strategy key has to be correct")
+            self.assertEqual(key,
+                             py_ob.OPERATOR_KEYS[py_os.OPERATOR_CODES[key]],
+                             f"3. {key} the code has to be reversible")
+
+    def test_batch(self):
+        """Test the columns of the batch."""
+        batch = py_ob.OperationBatch.concatenate([
+            py_ob.OperationBatch.from_operands("+", [1, 2], [3, 4]),
+            py_ob.OperationBatch.from_operands("t-", [4000], [61])
+        ])
+
+        self.assertEqual(3, len(batch), "1. the size has to be correct")
+        self.assertEqual(3 * 17, batch.nbytes,
+                         "2. an operation has to cost 17 bytes")
+
+        view = batch[1]
+        self.assertIsInstance(view, py_ob.OperationView,
+                              "3. an OperationView is expected")
+        self.assertEqual((2, 4, "+", "+"),
+                         (view.first, view.second, view.key, view.operator),
+                         "4. the view has to be correct")
+        self.assertEqual(6, view.get_good_result(),
+                         "5. the result has to be correct")
+        self.assertTrue(view.validate("6"), "6. the answer has to be valid")
+        self.assertEqual("2 + 4 = ?", repr(view),
+                         "7. the representation has to be correct")
+
+        view = batch[-1]
+        self.assertEqual("1h06m40s - 01m01s = ?", repr(view),
+                         "8. the time has to be rendered")
+        self.assertEqual("1h05m39s", str(view.get_good_result()),
+                         "9. the time result has to be correct")
+
+        sub_batch = batch[1:]
+        self.assertIsInstance(sub_batch, py_ob.OperationBatch,
+                              "10. a slice has to be a batch")
+        self.assertListEqual(["+", "t-"], [v.key for v in sub_batch],
+                             "11. the slice has to be correct")
+        self.assertEqual(2, len(batch.select("+")),
+                         "12. the operations have to be selected")
+
+        with self.assertRaises(AttributeError):
+            view.extra = 1
+
+    def test_bad_batch(self):
+        """Test raise exception in case of bad columns."""
+        with self.assertRaises(py_err.BadArgumentError):
+            py_ob.OperationBatch([1, 2], [3], [0, 0])
+
+        with self.assertRaises(py_err.BadArgumentError):
+            py_ob.OperationBatch.from_operands("x", [1], [1])
@@ -0,0 +1,165 @@
+# coding: utf-8
+
+"""Unit tests for operation layout module."""
+
+import unittest
+from pynairus.strategies import operation_layout as py_ol
+from pynairus.errors import app_error as py_err
+
+
+class OperationLayoutTest(unittest.TestCase):
+    """Unit test of the operation layout module."""
+
+    def test_base(self):
+        """Test of the BaseLayout."""
+
+        class LayoutTest(py_ol.BaseLayout):
+            """Test class for BaseLayout."""
+            size = 1
+
+        with self.assertRaisesRegex(py_err.StrategyError, 'LayoutTest'):
+            LayoutTest().get_operands(0)
+
+        with self.assertRaises(IndexError):
+            LayoutTest().get_operands(1)
+
+    def test_rectangle(self):
+        """Test of the RectangleLayout."""
+        layout = py_ol.RectangleLayout((3, 5), (1, 10))
+        expected = [(a, b) for a in range(3, 6) for b in range(1, 11)]
+
+        self.assertEqual(30, len(layout), "1. the size has to be correct")
+        self.assertListEqual(
+            expected, [layout.get_operands(i) for i in range(len(layout))],
+            "2. all the pairs have to be mapped in order")
+
+        self.assertEqual(0, len(py_ol.RectangleLayout((5, 3), (1, 10))),
+                         "3. a bad range has to be empty")
+
+    def test_rectangle_canonical(self):
+        """Test the canonical layout of the RectangleLayout."""
+        for first_range, second_range in (((1, 9), (1, 9)), ((3, 5), (1, 10)),
+                                          ((10, 20), (2, 5)),
+                                          ((2, 6), (4, 12))):
+            layout = py_ol.RectangleLayout(first_range, second_range)
+            canonical = layout.get_canonical()
+            expected = {(max(a, b), min(a, b)) for a, b in (
+                layout.get_operands(i) for i in range(len(layout)))}
+
+            pairs = [canonical.get_operands(i) for i in range(len(canonical))]
+            self.assertEqual(len(expected), len(pairs),
+                             f"1. {first_range} the size has to be correct")
+            self.assertSetEqual(expected,
+                                {(max(a, b), min(a, b)) for a, b in pairs},
+                                f"2. {first_range} one pair by swap expected")
+
+        layout = py_ol.TriangleLayout(1, 9)
+        self.assertIs(layout, layout.get_canonical(),
+                      "3. the other layouts are canonical")
+
+    def test_triangle(self):
+        """Test of the TriangleLayout."""
+        layout = py_ol.TriangleLayout(10, 99)
+        expected = [(a, b) for a in range(10, 100) for b in range(10, a + 1)]
+
+        self.assertEqual(len(expected), len(layout),
+                         "1. the size has to be correct")
+        self.assertListEqual(
+            expected, [layout.get_operands(i) for i in range(len(layout))],
+            "2. all the pairs have to be mapped in order")
+
+        layout = py_ol.TriangleLayout(10, 99, strict=True)
+        expected = [(a, b) for a in range(10, 100) for b in range(10, a)]
+
+        self.assertEqual(len(expected), len(layout),
+                         "3. the size has to be correct")
+        self.assertListEqual(
+            expected, [layout.get_operands(i) for i in range(len(layout))],
+            "4. all the pairs have to be mapped in order")
+
+        self.assertEqual(0, len(py_ol.TriangleLayout(5, 5, strict=True)),
+                         "5. a strict layout of one number has to be empty")
+
+    def test_segment(self):
+        """Test of the SegmentLayout."""
+        layout = py_ol.SegmentLayout(
+            (max(5, divisor), 8, divisor) for divisor in range(2, 10))
+        expected = [(a, d) for d in range(2, 10) for a in range(max(5, d), 9)]
+
+        self.assertEqual(len(expected), len(layout),
+                         "1. the size has to be correct")
+        self.assertListEqual(
+            expected, [layout.get_operands(i) for i in range(len(layout))],
+            "2. all the pairs have to be mapped in order")
+
+        with self.assertRaises(IndexError):
+            layout.get_operands(len(layout))
+
+    def test_concat(self):
+        """Test of the ConcatLayout."""
+        layout = py_ol.ConcatLayout([py_ol.RectangleLayout((1, 2), (1, 2)),
+                                     py_ol.TriangleLayout(5, 4),
+                                     py_ol.TriangleLayout(7, 8)])
+        expected = [(1, 1), (1, 2), (2, 1), (2, 2), (7, 7), (8, 7), (8, 8)]
+
+        self.assertEqual(7, len(layout), "1. the size has to be correct")
+        self.assertListEqual(
+            expected, [layout.get_operands(i) for i in range(len(layout))],
+            "2. all the pairs have to be mapped in order")
+
+        with self.assertRaises(IndexError):
+            layout.get_operands(len(layout))
+
+    def test_contains(self):
+        """Test the lookup of the pairs of the layouts."""
+        import numpy
+        layouts = (py_ol.RectangleLayout((1, 3), (2, 5)),
+                   py_ol.TriangleLayout(2, 5),
+                   py_ol.TriangleLayout(2, 5, strict=True),
+                   py_ol.SegmentLayout([(4, 6, 2), (5, 5, 3), (3, 7, 1)]),
+                   py_ol.RectangleLayout((1, 6), (2, 4)).get_canonical())
+        for layout in layouts:
+            pairs = {layout.get_operands(i) for i in range(len(layout))}
+            for first in range(0, 9):
+                for second in range(0, 9):
+                    self.assertEqual(
+                        (first, second) in pairs,
+                        layout.contains(first, second),
+                        f"{type(layout).__name__} ({first}, {second})")
+
+            grid = numpy.array([(first, second) for first in range(0, 9)
+                                for second in range(0, 9)])
+            self.assertListEqual(
+                [layout.contains(first, second) for first, second in grid],
+                layout.contains_array(grid[:, 0], grid[:, 1]).tolist(),
+                f"{type(layout).__name__} arrays")
+
+    def test_operands_array(self):
+        """Test the pairs of an array of indexes."""
+        import numpy
+        layouts = (py_ol.RectangleLayout((1, 3), (2, 5)),
+                   py_ol.TriangleLayout(2, 50),
+                   py_ol.TriangleLayout(2, 50, strict=True),
+                   py_ol.SegmentLayout([(4, 6, 2), (5, 5, 3), (3, 7, 1)]),
+                   py_ol.RectangleLayout((1, 60), (2, 40)).get_canonical())
+        for layout in layouts:
+            firsts, seconds = layout.get_operands_array(
+                numpy.arange(len(layout)))
+            self.assertListEqual(
+                [layout.get_operands(i) for i in range(len(layout))],
+                list(zip(firsts.tolist(), seconds.tolist())),
+                f"1. {type(layout).__name__} the pairs have to be mapped")
+
+        # the float square roots of the large triangles have to be fixed
+        layout = py_ol.TriangleLayout(1, 10 ** 9)
+        indexes = [0, 1, 2, len(layout) - 2, len(layout) - 1,
+                   (10 ** 8) * (10 ** 8 + 1) // 2 - 1,
+                   (10 ** 8) * (10 ** 8 + 1) // 2]
+        firsts, seconds = layout.get_operands_array(indexes)
+        self.assertListEqual(
+            [layout.get_operands(i) for i in indexes],
+            list(zip(firsts.tolist(), seconds.tolist())),
+            "2. the pairs of the large triangle have to be mapped")
+
+        with self.assertRaises(IndexError, msg="3. index out of range"):
+            layout.get_operands_array([len(layout)])
@@ -0,0 +1,103 @@
+# coding: utf-8
+
+"""Unit tests for operation space module."""
+
+import unittest
+from pynairus.strategies import operator_strategy as py_os
+from pynairus.strategies.operation_space import OperationSpace
+from pynairus.errors import app_error as py_err
+
+
+class OperationSpaceTest(unittest.TestCase):
+    """Unit test of the operation space module."""
+
+    def test_all_strategies(self):
+        """Test the spaces of all the strategies."""
+        for operator, (start, end) in (("+", (1, 9)), ("-", (1, 9)),
+                                       ("×", (2, 4)), ("1×", (10, 20)),
+                                       ("n×", (10, 20)), ("÷", (1, 20)),
+                                       ("2÷", (10, 120)), ("t+", (60, 70)),
+                                       ("t-", (60, 70))):
+            space = py_os.get_operation_space(operator, start, end)
+            self.assertIsInstance(space, OperationSpace,
+                                  f"{operator} an OperationSpace expected")
+
+            keys = {(numbers.first, numbers.second) for numbers in space}
+            self.assertEqual(len(space), len(keys),
+                             f"{operator} the operations have to be distinct")
+
+            for numbers in space:
+                # the operation has to be valid
+                numbers.get_good_result()
+
+    def test_canonical(self):
+        """Test the spaces of the distinct questions."""
+        space = py_os.get_operation_space("+", 1, 9, canonical=True)
+        self.assertTrue(space.canonical, "1. canonical space expected")
+        self.assertEqual(45, len(space), "2. the size has to be correct")
+
+        keys = {py_os.pack_operation(numbers) for numbers in space}
+        self.assertEqual(45, len(keys), "3. the questions have to be distinct")
+
+        space = py_os.get_operation_space("-", 1, 9, canonical=True)
+        self.assertEqual(45, len(space), "4. the substractions are kept")
+
+    def test_substraction(self):
+        """Test the swapped-order rule of the substraction spaces."""
+        space = py_os.get_operation_space("-", 10, 99)
+        self.assertEqual(90 * 91 // 2, len(space),
+                         "1. the size has to be correct")
+        self.assertTrue(all(n.first >= n.second for n in space),
+                        "2. the first number has to be >= the second")
+
+        space = py_os.get_operation_space("t-", 60, 120)
+        self.assertEqual(61 * 60 // 2, len(space),
+                         "3. the size has to be correct")
+        self.assertTrue(all(n.first > n.second for n in space),
+                        "4. the first time has to be > the second")
+
+    def test_division(self):
+        """Test the divisor rule of the division spaces."""
+        space = py_os.get_operation_space("2÷", 10, 50)
+        expected = sum(50 - divisor + 1 for divisor in range(10, 51))
+        self.assertEqual(expected, len(space),
+                         "1. the size has to be correct")
+        self.assertTrue(all(n.second <= n.first for n in space),
+                        "2. the divisor has to be <= the dividend")
+
+        self.assertEqual(0, len(py_os.get_operation_space("2÷", 1, 9)),
+                         "3. the space has to be empty")
+
+    def test_sequence(self):
+        """Test the index access and the slicing."""
+        space = py_os.get_operation_space("+", 10, 99)
+        self.assertEqual(8100, len(space), "1. the size has to be correct")
+
+        numbers = space[91]
+        self.assertEqual((11, 11), (numbers.first, numbers.second),
+                         "2. the operation has to be correct")
+        self.assertEqual((99, 99), space.get_operands(-1),
+                         "3. the negative index has to be supported")
+
+        with self.assertRaises(IndexError):
+            space[8100]
+
+        sub_space = space[90:180:2]
+        self.assertIsInstance(sub_space, OperationSpace,
+                              "4. a slice has to be a space")
+        self.assertEqual(45, len(sub_space), "5. the size has to be correct")
+        self.assertEqual((11, 12), sub_space.get_operands(1),
+                         "6. the slice indexes have to be correct")
+        self.assertEqual(space.get_operands(178), sub_space.get_operands(-1),
+                         "7. the slice indexes have to be correct")
+
+        firsts, seconds = sub_space.get_operands_array([0, 1, 44])
+        self.assertListEqual(
+            [sub_space.get_operands(i) for i in (0, 1, 44)],
+            list(zip(firsts.tolist(), seconds.tolist())),
+            "8. the slice indexes of the arrays have to be correct")
+
+    def test_bad_operator(self):
+        """Test raise exception in case of unknown operator."""
+        with self.assertRaises(py_err.BadArgumentError):
+            py_os.get_operation_space("x", 1, 9)
@@ -4,6 +4,7 @@
 
 import unittest
 from pynairus.helpers.string_helper import parse_time_string, convert_seconds_to_time
+from pynairus.helpers.time_helper import TimeValue
 from pynairus.strategies import operator_strategy as py_os
 from pynairus.validators import operator_validator as py_ov
 from pynairus.errors import app_error as py_err
@@ -42,6 +43,10 @@ class OperatorStrategyTest(unittest.TestCase):
             strategy_test = StrategyTest(py_ov.AdditionValidator())
             strategy_test.generate_random(1, 2)
 
+        with self.assertRaisesRegex(py_err.StrategyError, 'StrategyTest'):
+            strategy_test = StrategyTest(py_ov.AdditionValidator())
+            strategy_test.generate_batch(1, 2, 10)
+
         strategy_test = StrategyTest(py_ov.AdditionValidator())
         validator = strategy_test.get_validator()
         self.assertIsInstance(validator, py_ov.AdditionValidator)
@@ -256,6 +261,40 @@ class OperatorStrategyTest(unittest.TestCase):
             self.assertEqual(result, numbers.get_good_result(),
                              f"{test_num}.4 The result expected is not ok")
 
+    def test_divisor_range(self):
+        """Test the division strategies with ranges close to the divisors."""
+        single = py_os.SingleDivisorStrategy(py_ov.DivisionValidator())
+        double = py_os.DoubleDivisorStrategy(py_ov.DivisionValidator())
+
+        for i in range(100):
+            test_num = i + 1
+
+            numbers = double.generate_random(1, 10)
+            self.assertEqual((10, 10), (numbers.first, numbers.second),
+                             f"{test_num}.1 the only division is 10 ÷ 10")
+
+            numbers = single.generate_random(2, 3)
+            self.assertTrue(2 <= numbers.second <= numbers.first <= 3,
+                            f"{test_num}.2 the division has to be valid")
+
+        err_msg = "the end param has to be greater than equal 10: 9 given"
+        with self.assertRaisesRegex(py_err.BadArgumentError, err_msg):
+            double.generate_random(1, 9)
+
+        with self.assertRaisesRegex(py_err.BadArgumentError, err_msg):
+            double.generate_batch(1, 9, 10)
+
+        err_msg = "the end param has to be greater than equal 2: 1 given"
+        with self.assertRaisesRegex(py_err.BadArgumentError, err_msg):
+            single.generate_random(1, 1)
+
+        with self.assertRaisesRegex(py_err.BadArgumentError, "99 > 50 given"):
+            single.generate_random(99, 50)
+
+        dividends, divisors = double.generate_batch(1, 12, 1000)
+        self.assertTrue(((divisors <= dividends) & (dividends <= 12)).all(),
+                        "the batch divisions have to be valid")
+
     def test_time_addition_strategy(self):
         """Test of TimeAdditionStrategy."""
         strategy = py_os.TimeAdditionStrategy(py_ov.TimeAdditionValidator())
@@ -270,21 +309,21 @@ class OperatorStrategyTest(unittest.TestCase):
             # generate timestamp between 1 minute and one hour
             numbers = strategy.generate_random(60, 3600)
 
-            self.assertIs(type(numbers.first), str,
-                          f"{test_num}.1 The 1st num. has to be a string")
-            self.assertIs(type(numbers.second), str,
-                          f"{test_num}.2 The 2nd num. has to be a string")
+            self.assertIsInstance(numbers.first, TimeValue,
+                                  f"{test_num}.1 The 1st num. has to be a time")
+            self.assertIsInstance(numbers.second, TimeValue,
+                                  f"{test_num}.2 The 2nd num. has to be a time")
 
             # calculate the expected result
-            first_tuple = parse_time_string(numbers.first)
-            second_tuple = parse_time_string(numbers.second)
+            first_tuple = parse_time_string(str(numbers.first))
+            second_tuple = parse_time_string(str(numbers.second))
             hours = first_tuple[0] + second_tuple[0]
             mins = first_tuple[1] + second_tuple[1]
             secs = first_tuple[2] + second_tuple[2]
             timestamp = (hours * 60 * 60) + (mins * 60) + secs
             result_expected = convert_seconds_to_time(timestamp)
 
-            self.assertEqual(result_expected, numbers.get_good_result(),
+            self.assertEqual(result_expected, str(numbers.get_good_result()),
                              f"{test_num}.3 The result expected is not ok")
 
     def test_time_substraction_strategy(self):
@@ -302,14 +341,14 @@ class OperatorStrategyTest(unittest.TestCase):
             # generate timestamp between 1 minute and one hour
             numbers = strategy.generate_random(60, 3600)
 
-            self.assertIs(type(numbers.first), str,
-                          f"{test_num}.1 The 1st num. has to be a string")
-            self.assertIs(type(numbers.second), str,
-                          f"{test_num}.2 The 2nd num. has to be a string")
+            self.assertIsInstance(numbers.first, TimeValue,
+                                  f"{test_num}.1 The 1st num. has to be a time")
+            self.assertIsInstance(numbers.second, TimeValue,
+                                  f"{test_num}.2 The 2nd num. has to be a time")
 
             # calculate the expected result
-            first_tuple = parse_time_string(numbers.first)
-            second_tuple = parse_time_string(numbers.second)
+            first_tuple = parse_time_string(str(numbers.first))
+            second_tuple = parse_time_string(str(numbers.second))
             first_h, first_m, first_s = first_tuple
             second_h, second_m, second_s = second_tuple
 
@@ -319,7 +358,7 @@ class OperatorStrategyTest(unittest.TestCase):
             self.assertTrue(first_t > second_t,
                             f"{test_num}.3 The first number [{numbers.first}] has to be greater than the second [{numbers.second}].")
             result_expected = convert_seconds_to_time(first_t - second_t)
-            self.assertEqual(result_expected, numbers.get_good_result(),
+            self.assertEqual(result_expected, str(numbers.get_good_result()),
                              f"{test_num}.4 The result expected is not ok")
 
     def test_app_strategies(self):
@@ -396,3 +435,177 @@ class OperatorStrategyTest(unittest.TestCase):
                               py_os.TimeSubstractionStrategy)
         self.assertIsInstance(time_sub_strategy.get_validator(),
                               py_ov.TimeSubstractionValidator)
+
+    def test_generate_batch(self):
+        """Test the batch generation of all the strategies."""
+        size = 1000
+
+        firsts, seconds = py_os.STRATEGIES["+"].generate_batch(10, 99, size)
+        self.assertEqual(size, len(firsts), "1.1 the size has to be correct")
+        self.assertEqual(size, len(seconds), "1.2 the size has to be correct")
+        self.assertTrue(((10 <= firsts) & (firsts <= 99)).all(),
+                        "1.3 the left numbers have to be between 10 and 99")
+        self.assertTrue(((10 <= seconds) & (seconds <= 99)).all(),
+                        "1.4 the right numbers have to be between 10 and 99")
+
+        with self.assertRaises(ValueError):
+            py_os.STRATEGIES["+"].generate_batch(99, 50, size)
+
+        firsts, seconds = py_os.STRATEGIES["-"].generate_batch(10, 99, size)
+        self.assertTrue((firsts >= seconds).all(),
+                        "2.1 the left numbers have to be >= the right numbers")
+
+        firsts, seconds = py_os.STRATEGIES["×"].generate_batch(1, 4, size)
+        self.assertTrue(((1 <= firsts) & (firsts <= 4)).all(),
+                        "3.1 the first numbers have to be between 1 and 4")
+        self.assertTrue(((1 <= seconds) & (seconds <= 10)).all(),
+                        "3.2 the second numbers have to be between 1 and 10")
+
+        err_msg = "the end param has to be between 1 and 10 included: 11 given"
+        with self.assertRaisesRegex(py_err.BadArgumentError, err_msg):
+            py_os.STRATEGIES["×"].generate_batch(10, 11, size)
+
+        firsts, seconds = py_os.STRATEGIES["1×"].generate_batch(10, 99, size)
+        self.assertTrue(((1 <= seconds) & (seconds <= 9)).all(),
+                        "4.1 the second numbers have to be between 1 and 9")
+
+        firsts, seconds = py_os.STRATEGIES["n×"].generate_batch(10, 99, size)
+        self.assertTrue(((10 <= seconds) & (seconds <= 99)).all(),
+                        "5.1 the second numbers have to be between 10 and 99")
+
+        dividends, divisors = py_os.STRATEGIES["÷"].generate_batch(1, 99, size)
+        self.assertTrue(((2 <= divisors) & (divisors <= 9)).all(),
+                        "6.1 the divisors have to be between 2 and 9")
+        self.assertTrue(((dividends >= divisors) & (dividends <= 99)).all(),
+                        "6.2 the dividends have to be between the divisor and 99")
+
+        dividends, divisors = py_os.STRATEGIES["2÷"].generate_batch(
+            10, 999, size)
+        self.assertTrue(((10 <= divisors) & (divisors <= 99)).all(),
+                        "7.1 the divisors have to be between 10 and 99")
+        self.assertTrue(((dividends >= divisors) & (dividends <= 999)).all(),
+                        "7.2 the dividends have to be between the divisor and 999")
+
+        firsts, seconds = py_os.STRATEGIES["t+"].generate_batch(60, 3600, size)
+        self.assertTrue(((60 <= firsts) & (firsts <= 3600)).all(),
+                        "8.1 the first times have to be between 60 and 3600")
+
+        firsts, seconds = py_os.STRATEGIES["t-"].generate_batch(60, 3600, size)
+        self.assertTrue((firsts > seconds).all(),
+                        "9.1 the first times have to be greater than the second")
+        self.assertTrue((seconds >= 60).all(),
+                        "9.2 the second times have to be greater than 60")
+
+    def test_random_generators(self):
+        """Test the random generators of the strategies."""
+        import random
+        strategy = py_os.AdditionStrategy(py_ov.AdditionValidator(),
+                                          rng=random.Random(42))
+        same_strategy = py_os.AdditionStrategy(py_ov.AdditionValidator(),
+                                               rng=random.Random(42))
+
+        operations = [repr(strategy.generate_random(1, 999))
+                      for _ in range(20)]
+        self.assertListEqual(
+            operations,
+            [repr(same_strategy.generate_random(1, 999)) for _ in range(20)],
+            "1. the injected generator has to be used")
+
+        strategy.seed(7)
+        firsts, _ = strategy.generate_batch(1, 999, 20)
+        strategy.seed(7)
+        self.assertListEqual(firsts.tolist(),
+                             strategy.generate_batch(1, 999, 20)[0].tolist(),
+                             "2. the batch generator has to be reseeded")
+
+        spawned = strategy.spawn(3)
+        self.assertIsNot(strategy.rng, spawned.rng,
+                         "3. the spawned strategy has its own generator")
+        self.assertIs(strategy.validator, spawned.validator,
+                      "4. the validator has to be shared")
+
+    def test_create_strategies(self):
+        """Test the creation of seeded strategies."""
+        strategies = py_os.create_strategies(seed=12)
+        same_strategies = py_os.create_strategies(seed=12)
+
+        self.assertEqual(py_os.STRATEGIES.keys(), strategies.keys(),
+                         "1. all the strategies have to be created")
+
+        for key, strategy in strategies.items():
+            self.assertIsNot(py_os.STRATEGIES[key].rng, strategy.rng,
+                             f"2. {key} the generator has to be new")
+            self.assertEqual(strategy.rng.random(),
+                             same_strategies[key].rng.random(),
+                             f"3. {key} the generator has to be seeded")
+
+        self.assertNotEqual(strategies["+"].rng.random(),
+                            strategies["-"].rng.random(),
+                            "4. the streams of the strategies are distinct")
+
+
+    def test_pack_operation(self):
+        """Test the packed keys of the operations."""
+        keys = set()
+        for key, strategy in py_os.STRATEGIES.items():
+            numbers = strategy.build_operation(120, 7)
+            packed = py_os.pack_operation(numbers)
+            self.assertEqual(
+                (py_os.get_validator_code(numbers.validator), 120, 7),
+                py_os.unpack_operation(packed),
+                f"1. {key} the key has to be unpacked")
+            self.assertLess(packed, 2 ** 63, f"2. {key} the key is too large")
+            keys.add(packed)
+
+        # the multiplications and the divisions share their questions
+        self.assertEqual(6, len(keys), "3. one key by question expected")
+        self.assertEqual(py_os.OPERATOR_CODES["×"],
+                         py_os.get_validator_code(py_os.MULT_VALIDATOR),
+                         "4. the multiplication code is expected")
+
+        numbers = py_os.STRATEGIES["+"].build_operation(-5, 2 ** 27)
+        self.assertEqual((0, 2 ** 27, -5),
+                         py_os.unpack_operation(py_os.pack_operation(numbers)),
+                         "5. the negative operands have to be unpacked")
+
+        # 2 ** 28 - 1 is the largest operand of the 64 bits keys
+        for first in (2 ** 28 - 1, 2 ** 28, 10 ** 9, -10 ** 12):
+            numbers = py_os.STRATEGIES["-"].build_operation(first, 7)
+            packed = py_os.pack_operation(numbers)
+            self.assertEqual((1, first, 7), py_os.unpack_operation(packed),
+                             f"6. {first} the large operands have to be packed")
+            self.assertEqual(abs(first) < 2 ** 28, packed < 2 ** 63,
+                             f"7. {first} only the large operands are wider")
+
+        keys = {py_os.pack_operation(py_os.STRATEGIES["-"].build_operation(
+            first, second)) for first in (0, 1, 2 ** 28, 2 ** 29)
+            for second in (0, 1, 2 ** 28, 2 ** 29)}
+        self.assertEqual(16, len(keys), "8. the keys have to be distinct")
+
+        with self.assertRaises(py_err.BadArgumentError,
+                               msg="9. the validator has no opcode"):
+            py_os.get_validator_code(py_ov.BaseValidator())
+
+    def test_canonical_operations(self):
+        """Test the canonical keys of the commutative operations."""
+        for key in ("+", "×", "1×", "n×", "t+"):
+            strategy = py_os.STRATEGIES[key]
+            self.assertEqual(
+                py_os.pack_operation(strategy.build_operation(3, 40)),
+                py_os.pack_operation(strategy.build_operation(40, 3)),
+                f"1. {key} the swapped operations are the same question")
+
+        for key in ("-", "÷", "t-"):
+            strategy = py_os.STRATEGIES[key]
+            self.assertNotEqual(
+                py_os.pack_operation(strategy.build_operation(3, 40)),
+                py_os.pack_operation(strategy.build_operation(40, 3)),
+                f"2. {key} the swapped operations are distinct")
+
+        strategy = py_os.STRATEGIES["1×"]
+        self.assertEqual(99, len(strategy.get_layout(1, 11)),
+                         "3. all the operations are expected")
+        self.assertEqual(99 - 36, len(strategy.get_canonical_layout(1, 11)),
+                         "4. the swapped operations have to be removed")
+        self.assertEqual(45, len(py_os.STRATEGIES["-"].get_canonical_layout(
+            1, 9)), "5. the substraction layout is kept")
@@ -6,6 +6,7 @@ import unittest
 import pynairus.validators.operator_validator as ov
 from pynairus.errors.app_error import ValidateError
 from pynairus.errors.app_error import BadArgumentError
+from pynairus.helpers.time_helper import TimeValue
 
 
 class ValidatorsTest(unittest.TestCase):
@@ -71,6 +72,10 @@ class ValidatorsTest(unittest.TestCase):
         self.assertTrue(validator.validate("1h31m10s", "50m56s", "40m14s"))
         self.assertTrue(validator.validate("51m10s", "30m56s", "20m14s"))
         self.assertFalse(validator.validate("50m10s", "30m56s", "20m14s"))
+        self.assertTrue(validator.validate("51m1s", "30m50s", "20m11s"))
+        self.assertFalse(validator.validate("abc", "30m50s", "20m11s"))
+        self.assertEqual(TimeValue(3061),
+                         validator.get_result(TimeValue(2040), "17m01s"))
         with self.assertRaisesRegex(
             ValidateError,
             r"An error occured while validating: 50m \+ 40m14s"
@@ -105,3 +110,65 @@ class ValidatorsTest(unittest.TestCase):
             validator.validate(None, "50m10s", "1h10m14s")
 
         self.assertEqual(1, len(ctx2.exception.args))
+
+    def test_integer_validate_many(self):
+        """Test the validate_many method of the integer validators."""
+        firsts, seconds = [5, 7, 3, 9], [2, 1, 3, 4]
+        cases = (
+            (ov.AdditionValidator(), ["7", 8, "a", None], [7, 8, 6, 13],
+             [True, True, False, False]),
+            (ov.SubstractionValidator(), [3, "6", "0", "4"], [3, 6, 0, 5],
+             [True, True, True, False]),
+            (ov.MultiplicationValidator(), ["10", 7, "9", "9.5"],
+             [10, 7, 9, 36], [True, True, True, False]))
+        for validator, answers, results, validated in cases:
+            name = validator.__class__.__name__
+            self.assertIsInstance(validator, ov.BaseIntegerValidator,
+                                  f"1. {name} is not an integer validator")
+            self.assertEqual(results,
+                             validator.get_results(firsts, seconds).tolist(),
+                             f"2. {name}: bad results")
+            self.assertEqual(
+                validated,
+                validator.validate_many(answers, firsts, seconds).tolist(),
+                f"3. {name}: bad validation")
+
+    def test_division_validate_many(self):
+        """Test the DivisionValidator.validate_many method."""
+        validator = ov.DivisionValidator()
+        firsts, seconds = [65, 64, 9, 10], [8, 8, 9, 3]
+        self.assertEqual(["8r1", "8", "1", "3r1"],
+                         validator.get_results(firsts, seconds).tolist(),
+                         "1. bad results")
+        self.assertEqual(
+            [True, True, False, False],
+            validator.validate_many(["8r1", "8", 1, "3"],
+                                    firsts, seconds).tolist(),
+            "2. bad validation")
+
+        with self.assertRaisesRegex(
+            ValidateError,
+            r"The first number \(8\) isn't greater than 9"
+        ):
+            validator.get_results([10, 8], [2, 9])
+
+    def test_default_validate_many(self):
+        """Test the default validate_many of the time validators."""
+        validator = ov.TimeAdditionValidator()
+        self.assertEqual(
+            [True, False],
+            validator.validate_many(["1h31m10s", "50m10s"],
+                                    ["50m56s", "30m56s"],
+                                    ["40m14s", "20m14s"]).tolist(),
+            "1. bad validation")
+
+    def test_convert_int_answers(self):
+        """Test the convert_int_answers function."""
+        values, valids = ov.convert_int_answers(["12", 3, "-4"])
+        self.assertEqual([12, 3, -4], values.tolist(), "1. bad values")
+        self.assertEqual([True] * 3, valids.tolist(), "2. bad valids")
+
+        values, valids = ov.convert_int_answers(["12", "a", None, 10 ** 30])
+        self.assertEqual([12, 0, 0, 0], values.tolist(), "3. bad values")
+        self.assertEqual([True, False, False, False], valids.tolist(),
+                         "4. bad valids")
@@ -0,0 +1,31 @@
+# coding: utf-8
+
+"""Unit test module for pymath.generate_batch function."""
+
+import unittest
+from pynairus.pymath import generate_batch
+from pynairus.errors.app_error import BadArgumentError
+from pynairus.strategies.operation_batch import OperationBatch
+
+
+class TestPymathGenerateBatch(unittest.TestCase):
+    """Unit tests for pymath.generate_batch function."""
+
+    def test_batch_generation(self):
+        """Test the batch generation for all the operators."""
+        for operator in ('+', '-', '1×', 'n×', '÷', '2÷', 't+', 't-', '×'):
+            start, end = (1, 9) if operator == '×' else (10, 99)
+            batch = generate_batch(start, end, operator, 50)
+
+            self.assertIsInstance(batch, OperationBatch,
+                                  f"{operator} OperationBatch expected")
+            self.assertEqual(50, len(batch),
+                             f"{operator} 50 operations expected")
+            self.assertEqual({operator}, {view.key for view in batch},
+                             f"{operator} the operator has to be stored")
+
+    def test_bad_parameters(self):
+        """Test raise exception in case of unknown operator."""
+        with self.assertRaises(BadArgumentError,
+                               msg="BadArgumentError expected"):
+            generate_batch(10, 99, "x", 10)
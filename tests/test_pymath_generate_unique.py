@@ -0,0 +1,36 @@
+# coding: utf-8
+
+"""Unit test module for pymath.generate_unique function."""
+
+import unittest
+from pynairus.pymath import generate_unique
+from pynairus.errors.app_error import BadArgumentError
+
+
+class TestPymathGenerateUnique(unittest.TestCase):
+    """Unit tests for pymath.generate_unique function."""
+
+    def test_unique_generation(self):
+        """Test the generation of distinct operations."""
+        operations = generate_unique(1, 9, ('+', '-'), 90)
+        keys = {(numbers.first, numbers.second, numbers.operator)
+                for numbers in operations}
+
+        self.assertEqual(90, len(operations), "90 operations expected")
+        self.assertEqual(90, len(keys), "the operations have to be distinct")
+
+    def test_limit_exceeded(self):
+        """Test raise exception if the limit exceeds the operations."""
+        with self.assertRaises(BadArgumentError,
+                               msg="BadArgumentError expected"):
+            generate_unique(1, 9, ('+', '-'), 92)
+
+        with self.assertRaises(BadArgumentError,
+                               msg="BadArgumentError expected"):
+            generate_unique(1, 9, ('+', '+'), 82)
+
+    def test_bad_parameters(self):
+        """Test raise exception in case of unknown operator."""
+        with self.assertRaises(BadArgumentError,
+                               msg="BadArgumentError expected"):
+            generate_unique(10, 99, ("x", "x"), 10)
@@ -4,7 +4,7 @@
 
 import unittest
 from pynairus.pymath import is_already_answered
-from pynairus.pymath import ANSWERS
+from pynairus.stores.answer_store import MemoryAnswerStore
 
 GOOD_ANSWER = (1, 5, "*")
 BAD_ANSWER = (1, 3, "-")
@@ -15,25 +15,21 @@ class TestPymathIsAlreadyAnswered(unittest.TestCase):
 
     def setUp(self):
         """Invoked before every tests."""
-        ANSWERS[GOOD_ANSWER] = True
-        ANSWERS[BAD_ANSWER] = False
-
-    def tearDown(self):
-        """Invoked after every tests."""
-        # On vide le dictionnaire après chaque test.
-        ANSWERS.clear()
+        self.store = MemoryAnswerStore()
+        self.store.set(GOOD_ANSWER, True)
+        self.store.set(BAD_ANSWER, False)
 
     def test_not_exists(self):
         """Not exist test."""
-        self.assertFalse(is_already_answered((1, 2, '+')),
+        self.assertFalse(is_already_answered((1, 2, '+'), self.store),
                          msg="the tuple (1, 2, '+') musts not exist.")
 
     def test_exists_and_true(self):
         """Testing if the right anwser exists."""
-        self.assertTrue(is_already_answered(GOOD_ANSWER),
+        self.assertTrue(is_already_answered(GOOD_ANSWER, self.store),
                         f"the tuple {GOOD_ANSWER} musts exist and be True.")
 
     def test_exists_and_false(self):
         """Testing if the wrong answer exists."""
-        self.assertFalse(is_already_answered(BAD_ANSWER),
+        self.assertFalse(is_already_answered(BAD_ANSWER, self.store),
                          f"the tuple {BAD_ANSWER} musts exist and be False.")
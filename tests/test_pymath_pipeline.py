@@ -0,0 +1,147 @@
+# coding: utf-8
+
+"""Unit test module for the pymath generation pipeline."""
+
+import logging
+import types
+import unittest
+from pynairus.pymath import (iter_random, iter_unique, skip_answered,
+                             create_session, pymath)
+from pynairus.config import app_context as ns_ac
+from pynairus.config.app_config import AppConfig, LoggerWrapper
+from pynairus.errors.app_error import BadArgumentError
+from pynairus.sessions.io_adapter import QueueAdapter
+from pynairus.strategies import operator_strategy as ns_os
+from pynairus.stores.answer_store import MemoryAnswerStore
+
+
+class TestPymathPipeline(unittest.TestCase):
+    """Unit tests for the pymath generation pipeline."""
+
+    def test_iter_random(self):
+        """Test the lazy generation of random operations."""
+        operations = iter_random(10, 99, ('+', '-'), 10 ** 12)
+        self.assertIsInstance(operations, types.GeneratorType,
+                              "1. a generator is expected")
+
+        operator, numbers = next(operations)
+        self.assertEqual('+', operator, "2. the first operator is expected")
+        self.assertIsInstance(numbers, ns_os.ComputeNumbers,
+                              "3. instance of ComputeNumbers expected")
+
+        operator, numbers = next(operations)
+        self.assertEqual('-', operator, "4. the operators have to alternate")
+
+    def test_iter_unique(self):
+        """Test the lazy generation of distinct operations."""
+        operations = iter_unique(1, 9, ('+', '+'), 45)
+        keys = {ns_os.pack_operation(numbers) for _, numbers in operations}
+        self.assertEqual(45, len(keys), "all the questions are expected")
+
+        with self.assertRaises(BadArgumentError,
+                               msg="the capacity has to be checked eagerly"):
+            iter_unique(1, 9, ('+', '+'), 46)
+
+    def test_seeded_strategies(self):
+        """Test the generation with seeded strategies."""
+        operations = iter_random(10, 99, ('+', '-'), 20,
+                                 ns_os.create_strategies(seed=5))
+        same_operations = iter_random(10, 99, ('+', '-'), 20,
+                                      ns_os.create_strategies(seed=5))
+
+        self.assertListEqual([repr(numbers) for _, numbers in operations],
+                             [repr(numbers) for _, numbers in same_operations],
+                             "the operations have to be reproducible")
+
+    def test_skip_answered(self):
+        """Test the replacement of the operations already answered."""
+        logger = LoggerWrapper(logging.getLogger(), False)
+        store = MemoryAnswerStore()
+        strategy = ns_os.STRATEGIES['+']
+        for first in range(1, 4):
+            for second in range(1, 4):
+                if {first, second} != {2, 3}:
+                    store.set(ns_os.pack_operation(
+                        strategy.build_operation(first, second)), True)
+
+        operations = iter_random(1, 3, ('+', '+'), 5)
+        for answer_key, numbers in skip_answered(operations, 1, 3, logger,
+                                                 store):
+            self.assertEqual({2, 3}, {numbers.first, numbers.second},
+                             "only the operation not answered is expected")
+            self.assertEqual(ns_os.pack_operation(numbers), answer_key,
+                             "the packed key of the operation is expected")
+
+    def test_all_answered(self):
+        """Test the sessions of a learner who answered all the operations."""
+        logger = LoggerWrapper(logging.getLogger(), False)
+        store = MemoryAnswerStore()
+        space = ns_os.STRATEGIES['+'].get_operation_space(1, 2,
+                                                          canonical=True)
+        for numbers in space:
+            store.set(ns_os.pack_operation(numbers), True)
+
+        for unique in (True, False):
+            session = create_session(1, 2, 1, {"operator": '+',
+                                               "unique": unique,
+                                               "store": store}, logger)
+            with self.assertRaises(BadArgumentError,
+                                   msg=f"1. error expected (unique {unique})"):
+                session.next_question()
+
+            self.assertTrue(session.finished,
+                            f"2. the session is finished (unique {unique})")
+
+    def test_unique_replacements(self):
+        """Test the replacements of the unique mode never asked twice."""
+        logger = LoggerWrapper(logging.getLogger(), False)
+        store = MemoryAnswerStore()
+        space = ns_os.STRATEGIES['+'].get_operation_space(1, 9,
+                                                          canonical=True)
+        answered = {ns_os.pack_operation(space[index])
+                    for index in range(0, len(space), 2)}
+        for answer_key in answered:
+            store.set(answer_key, True)
+
+        samplers = {}
+        operations = iter_unique(1, 9, ('+', '+'), len(space) - len(answered),
+                                 samplers=samplers)
+        keys = [answer_key for answer_key, _
+                in skip_answered(operations, 1, 9, logger, store,
+                                 samplers=samplers)]
+        self.assertEqual(len(keys), len(set(keys)),
+                         "1. the operations are never asked twice")
+        self.assertTrue(answered.isdisjoint(keys),
+                        "2. the operations answered are replaced")
+        self.assertEqual(len(space), len(keys) + len(answered),
+                         "3. all the operations not answered expected")
+
+    def test_large_range(self):
+        """Test the sessions of the operands larger than 64 bits keys."""
+        logger = LoggerWrapper(logging.getLogger(), False)
+        for unique in (True, False):
+            session = create_session(1, 10 ** 9, 5, {"operator": '+',
+                                                     "unique": unique},
+                                     logger)
+            for _ in range(5):
+                numbers = session.next_question()
+                feedback = session.submit(str(numbers.get_good_result()))
+                self.assertTrue(
+                    feedback.good,
+                    f"the operation has to be answered (unique {unique})")
+
+    def test_pymath_error(self):
+        """Test the generation error sent through the adapter."""
+        registry = ns_ac.ConfigRegistry(
+            loader=lambda name: AppConfig(logging.getLogger(), False))
+        adapter = QueueAdapter()
+        try:
+            session = pymath(start=1, end=2, limit=10, operator='+',
+                             unique=True, adapter=adapter, registry=registry)
+        finally:
+            ns_ac.AppContext.clearContext()
+
+        self.assertIsNone(session, "1. no session expected")
+        self.assertRegex(adapter.lines.get_nowait(),
+                         "^Erreur de génération: 10 distinct operations",
+                         "2. the error has to be sent to the adapter")
@@ -0,0 +1,181 @@
+# coding: utf-8
+
+"""Unit tests for session module."""
+
+import asyncio
+import itertools
+import logging
+import tempfile
+import unittest
+from pathlib import Path
+from pynairus.config.app_config import LoggerWrapper
+from pynairus.errors.app_error import BadArgumentError, SessionError
+from pynairus.helpers.event_log import EventSink, read_events
+from pynairus.sessions import session as py_ss
+from pynairus.sessions.io_adapter import QueueAdapter
+from pynairus.strategies import operator_strategy as ns_os
+from pynairus.stores.answer_store import MemoryAnswerStore
+
+
+def build_operations(*operands):
+    """Build the (answer key, addition) tuples of the operands."""
+    strategy = ns_os.STRATEGIES['+']
+    for first, second in operands:
+        numbers = strategy.build_operation(first, second)
+        yield ns_os.pack_operation(numbers), numbers
+
+
+def failing_operations():
+    """Generate one operation then fail."""
+    yield from build_operations((1, 2))
+    raise BadArgumentError("no more operations")
+
+
+class SessionTest(unittest.TestCase):
+    """Unit tests of the session state machine."""
+
+    def setUp(self):
+        """Invoked before every tests."""
+        self.logger = LoggerWrapper(logging.getLogger(), False)
+        self.store = MemoryAnswerStore()
+
+    def test_session(self):
+        """Test the states of a session."""
+        clock = itertools.count(10, 2.5).__next__
+        session = py_ss.Session(build_operations((1, 2), (3, 4)), self.store,
+                                2, timer=True, logger=self.logger,
+                                clock=clock)
+        self.assertEqual(py_ss.WAITING, session.state, "1. waiting expected")
+        with self.assertRaises(SessionError, msg="2. no question asked"):
+            session.submit("3")
+
+        numbers = session.next_question()
+        self.assertEqual("1 + 2 = ?", str(numbers), "3. question expected")
+        self.assertEqual(py_ss.ASKING, session.state, "4. asking expected")
+        with self.assertRaises(SessionError, msg="5. the answer is awaited"):
+            session.next_question()
+
+        feedback = session.submit("3")
+        self.assertEqual(py_ss.Feedback(True, 3, 2.5, 1, None), feedback,
+                         "6. good answer expected")
+        self.assertTrue(self.store.is_already_answered(
+            ns_os.pack_operation(numbers)), "7. the answer has to be stored")
+
+        session.next_question()
+        feedback = session.submit("8")
+        self.assertEqual(py_ss.Feedback(False, 7, 2.5, 1, None), feedback,
+                         "8. bad answer expected")
+        self.assertEqual(5, session.total_time, "9. total time expected")
+
+        self.assertIsNone(session.next_question(), "10. no more question")
+        self.assertTrue(session.finished, "11. the session is finished")
+
+    def test_input_error(self):
+        """Test an answer which can't be validated."""
+        session = py_ss.Session(build_operations((1, 2)), self.store, 1,
+                                logger=self.logger)
+        session.next_question()
+        feedback = session.submit("three")
+        self.assertIsNotNone(feedback.error, "1. error expected")
+        self.assertIsNone(feedback.response_time, "2. no timer expected")
+        self.assertEqual(0, len(self.store), "3. no answer stored")
+        self.assertEqual(py_ss.WAITING, session.state,
+                         "4. the next question is expected")
+
+    def test_generation_error(self):
+        """Test the session finished on generation error."""
+        session = py_ss.Session(failing_operations(), self.store, 2)
+        session.next_question()
+        session.submit("3")
+        with self.assertRaises(BadArgumentError, msg="1. error expected"):
+            session.next_question()
+
+        self.assertTrue(session.finished, "2. the session is finished")
+
+
+    def test_events(self):
+        """Test the events of a session."""
+        with tempfile.TemporaryDirectory() as folder:
+            path = Path(folder, "events.jsonl")
+            with EventSink(path) as sink:
+                session = py_ss.Session(build_operations((1, 2), (3, 4)),
+                                        MemoryAnswerStore(), 2, timer=True,
+                                        events=sink, learner="alice")
+                session.next_question()
+                session.submit("3")
+                session.next_question()
+                session.submit("x")
+                session.finish()
+
+            events = list(read_events(path))
+
+        self.assertListEqual(
+            ["question", "answer", "question", "answer", "score",
+             "total_time"], [event["event"] for event in events],
+            "1. the events of the session expected")
+        self.assertTrue(all(event["session"] == session.session_id
+                            and event["learner"] == "alice"
+                            for event in events),
+                        "2. the events have to be identified")
+        self.assertEqual("1 + 2 = ?", events[0]["operation"],
+                         "3. the question expected")
+        self.assertTrue(events[1]["good"], "4. good answer expected")
+        self.assertIn("error", events[3], "5. input error expected")
+        self.assertEqual(1, events[4]["score"], "6. the score expected")
+
+class RunSessionTest(unittest.TestCase):
+    """Unit tests of the sessions run through an adapter."""
+
+    def run_session(self, operations, answers, limit=2):
+        """Run a session with the answers and return the lines sent."""
+        adapter = QueueAdapter()
+        for answer in answers:
+            adapter.answers.put_nowait(answer)
+
+        session = py_ss.Session(operations, MemoryAnswerStore(), limit)
+        asyncio.run(py_ss.run_session(session, adapter))
+        self.assertTrue(session.finished, "the session has to be finished")
+
+        lines = []
+        while not adapter.lines.empty():
+            lines.append(adapter.lines.get_nowait())
+
+        return lines
+
+    def test_run_session(self):
+        """Test the lines of a whole session."""
+        lines = self.run_session(build_operations((1, 2), (3, 4)),
+                                 ["3", "8"])
+        self.assertListEqual(
+            ["1 + 2 = ?", "Bonne réponse!", "Ton score est de 1 / 2",
+             "3 + 4 = ?", "Mauvaise réponse, le résulat attendue est: 7",
+             "Ton score est de 1 / 2"], lines, "1. bad lines")
+
+        lines = self.run_session(build_operations((1, 2), (3, 4)), [None])
+        self.assertListEqual(["1 + 2 = ?"], lines,
+                             "2. the learner can leave the session")
+
+        lines = self.run_session(failing_operations(), ["3"])
+        self.assertEqual("Erreur de génération: no more operations",
+                         lines[-1], "3. the error has to be sent")
+
+    def test_concurrent_sessions(self):
+        """Test many sessions on the same event loop."""
+
+        async def run_all():
+            adapters = [QueueAdapter() for _ in range(100)]
+            sessions = [py_ss.Session(build_operations((x, 1)),
+                                      MemoryAnswerStore(), 1)
+                        for x in range(100)]
+            tasks = [asyncio.create_task(py_ss.run_session(session, adapter))
+                     for session, adapter in zip(sessions, adapters)]
+
+            # the answers are given in the reverse order
+            for x, adapter in reversed(list(enumerate(adapters))):
+                await adapter.answers.put(str(x + 1))
+
+            return await asyncio.gather(*tasks)
+
+        sessions = asyncio.run(run_all())
+        self.assertTrue(all(session.score == 1 for session in sessions),
+                        "all the sessions have to be scored")
@@ -0,0 +1,97 @@
+# coding: utf-8
+
+"""Unit tests for session server module."""
+
+import asyncio
+import unittest
+from pynairus.errors.app_error import BadArgumentError
+from pynairus.sessions import session_server as py_ss
+from pynairus.sessions.session import Session
+from pynairus.strategies import operator_strategy as ns_os
+from pynairus.stores.answer_store import MemoryAnswerStore
+
+
+def create_session(learner):
+    """Create a session of two additions."""
+    if learner == "nobody":
+        raise BadArgumentError("bad learner")
+
+    strategy = ns_os.STRATEGIES['+']
+    operations = []
+    for first, second in ((1, 2), (3, 4)):
+        numbers = strategy.build_operation(first, second)
+        operations.append((ns_os.pack_operation(numbers), numbers))
+
+    return Session(operations, MemoryAnswerStore(), 2)
+
+
+async def talk(port, answers, count):
+    """Send the answers to the server and return the lines received."""
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write("".join(f"{answer}\n" for answer in answers).encode())
+    lines = []
+    for _ in range(count):
+        line = await reader.readline()
+        if not line:
+            break
+
+        lines.append(line.decode().rstrip("\n"))
+
+    writer.close()
+    await writer.wait_closed()
+    return lines
+
+
+class SessionServerTest(unittest.TestCase):
+    """Unit tests of the session server."""
+
+    def run_server(self, ask_learner, *conversations):
+        """Run the conversations on a server and return the lines."""
+
+        async def run_all():
+            server = py_ss.SessionServer(create_session, ask_learner)
+            tcp_server = await server.start_tcp()
+            port = tcp_server.sockets[0].getsockname()[1]
+            async with tcp_server:
+                results = await asyncio.gather(
+                    *(talk(port, answers, count)
+                      for answers, count in conversations))
+
+            return server, results
+
+        return asyncio.run(run_all())
+
+    def test_sessions(self):
+        """Test the sessions of many learners."""
+        server, results = self.run_server(
+            False, *((["3", "8"], 10) for _ in range(50)))
+
+        expected = ["1 + 2 = ?", "Bonne réponse!", "Ton score est de 1 / 2",
+                    "3 + 4 = ?",
+                    "Mauvaise réponse, le résulat attendue est: 7",
+                    "Ton score est de 1 / 2"]
+        for lines in results:
+            self.assertListEqual(expected, lines, "1. bad lines")
+
+        self.assertEqual(50, server.served, "2. all the sessions are served")
+        self.assertEqual(0, server.active, "3. no session is running")
+
+    def test_quit(self):
+        """Test the learners leaving and the bad sessions."""
+        _, results = self.run_server(True, (["alice", "QUIT"], 10),
+                                     (["nobody"], 10))
+
+        self.assertListEqual([py_ss.LEARNER_PROMPT, "1 + 2 = ?"], results[0],
+                             "1. the learner has to leave")
+        self.assertListEqual([py_ss.LEARNER_PROMPT,
+                              "Erreur de génération: bad learner"],
+                             results[1], "2. the error has to be sent")
+
+    def test_parse_answer(self):
+        """Test the answers parsed."""
+        self.assertEqual("12", py_ss.parse_answer(" 12\r\n"),
+                         "1. the spaces have to be stripped")
+        self.assertEqual("", py_ss.parse_answer("\n"),
+                         "2. an empty answer expected")
+        self.assertIsNone(py_ss.parse_answer("quit\n"),
+                          "3. the learner has to leave")
@@ -0,0 +1,95 @@
+# coding: utf-8
+
+"""Unit tests for SQLite answer store module."""
+
+import tempfile
+import unittest
+from pathlib import Path
+from pynairus.errors.app_error import BadArgumentError
+from pynairus.stores.answer_store import AnswerStore
+from pynairus.stores.sqlite_store import SqliteAnswerStore
+
+
+class SqliteAnswerStoreTest(unittest.TestCase):
+    """Unit tests of the SQLite answer history."""
+
+    def setUp(self):
+        """Invoked before every tests."""
+        self.folder = tempfile.TemporaryDirectory()
+        self.path = Path(self.folder.name, "history.db")
+
+    def tearDown(self):
+        """Invoked after every tests."""
+        self.folder.cleanup()
+
+    def test_store(self):
+        """Test the answers of a learner."""
+        with SqliteAnswerStore(self.path, "alice", batch_size=2) as store:
+            self.assertIsInstance(store, AnswerStore,
+                                  "1. instance of AnswerStore expected")
+            self.assertIsNone(store.get(18), "2. no answer expected")
+
+            store.set(18, True)
+            self.assertTrue(store.get(18),
+                            "3. the pending answer has to be found")
+
+            store.set(35, False)
+            self.assertFalse(store.get(35),
+                             "4. the written answer has to be found")
+            self.assertTrue(store.is_already_answered(18),
+                            "5. already answered expected")
+
+            store.set(35, True)
+            self.assertTrue(store.get(35),
+                            "6. the answer has to be replaced")
+            self.assertEqual(2, len(store), "7. two answers expected")
+
+        with self.assertRaises(BadArgumentError, msg="8. error expected"):
+            SqliteAnswerStore(self.path, batch_size=0)
+
+    def test_wide_keys(self):
+        """Test the keys wider than 64 bits."""
+        wide_key = 2 ** 70 + 5
+        with SqliteAnswerStore(self.path, "alice") as store:
+            store.set(wide_key, True)
+            store.set(2 ** 63 - 1, False)
+            store.flush()
+            self.assertTrue(store.get(wide_key),
+                            "1. the wide key has to be found")
+            self.assertSetEqual({wide_key, 2 ** 63 - 1},
+                                set(store.iter_keys()),
+                                "2. the keys have to be converted back")
+
+    def test_history(self):
+        """Test the history across the sessions and the learners."""
+        with SqliteAnswerStore(self.path, "alice") as store:
+            store.set_many([(18, True), (2 ** 62, True)])
+            store.set(66, True)
+
+        with SqliteAnswerStore(self.path, "alice") as store:
+            self.assertTrue(store.get(66),
+                            "1. the answers have to be kept on close")
+            self.assertTrue(store.get(2 ** 62),
+                            "2. the large key has to be kept")
+            self.assertIsNone(store.get(82), "3. no answer expected")
+            self.assertEqual(3, len(store), "4. three answers expected")
+
+        with SqliteAnswerStore(self.path, "bob") as store:
+            self.assertIsNone(store.get(18),
+                              "5. the learners have their own history")
+            store.set(18, False)
+            store.clear()
+            self.assertEqual(0, len(store), "6. the history has to be empty")
+
+        with SqliteAnswerStore(self.path, "alice") as store:
+            self.assertEqual(3, len(store),
+                             "7. the other learners are not cleared")
+
+    def test_indexes(self):
+        """Test that the lookups use the primary key."""
+        with SqliteAnswerStore(self.path) as store:
+            plan = store.connection.execute(
+                "EXPLAIN QUERY PLAN SELECT good FROM answers WHERE \
+learner = ? AND operation = ?", ("a", 18)).fetchall()
+
+        self.assertIn("PRIMARY KEY", str(plan), "the lookup has to be indexed")
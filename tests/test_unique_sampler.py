@@ -0,0 +1,66 @@
+# coding: utf-8
+
+"""Unit tests for unique sampler module."""
+
+import unittest
+from pynairus.strategies import operator_strategy as py_os
+from pynairus.strategies.unique_sampler import UniqueSampler
+from pynairus.errors import app_error as py_err
+
+
+class UniqueSamplerTest(unittest.TestCase):
+    """Unit test of the unique sampler module."""
+
+    def test_draw_all(self):
+        """Test that all the questions are drawn once."""
+        for operator, (start, end) in (("+", (1, 9)), ("-", (1, 9)),
+                                       ("×", (2, 4)), ("1×", (10, 20)),
+                                       ("n×", (10, 20)), ("÷", (1, 20)),
+                                       ("2÷", (10, 120)), ("t+", (60, 70)),
+                                       ("t-", (60, 70))):
+            strategy = py_os.STRATEGIES[operator]
+            sampler = UniqueSampler(strategy, start, end)
+            size = len(strategy.get_canonical_layout(start, end))
+
+            keys = set()
+            for _ in range(size):
+                numbers = sampler.draw()
+                keys.add(py_os.pack_operation(numbers))
+                # the operation has to be valid
+                numbers.get_good_result()
+
+            self.assertEqual(size, len(keys),
+                             f"{operator} all the questions have to be distinct")
+            self.assertEqual(0, len(sampler),
+                             f"{operator} no operation has to remain")
+
+            with self.assertRaises(py_err.BadArgumentError):
+                sampler.draw()
+
+    def test_swapped_operands(self):
+        """Test the order of the operands of the commutative operations."""
+        strategy = py_os.create_strategies(1)["+"]
+        sampler = UniqueSampler(strategy, 1, 20)
+        operations = [sampler.draw() for _ in range(150)]
+        smaller_first = sum(numbers.first < numbers.second
+                            for numbers in operations)
+        self.assertTrue(40 < smaller_first < 110,
+                        "1. the operands have to be in a random order")
+
+        # the tables of 2 to 8 multiply by 1 to 10
+        strategy = py_os.STRATEGIES["×"]
+        sampler = UniqueSampler(strategy, 2, 8)
+        layout = strategy.get_layout(2, 8)
+        self.assertTrue(all(layout.contains(numbers.first, numbers.second)
+                            for numbers
+                            in (sampler.draw() for _ in range(len(sampler)))),
+                        "2. the swapped operations have to be in the range")
+
+    def test_check_capacity(self):
+        """Test the capacity check."""
+        sampler = UniqueSampler(py_os.STRATEGIES["+"], 1, 3)
+        sampler.check_capacity(6)
+
+        with self.assertRaisesRegex(py_err.BadArgumentError,
+                                    "7 distinct operations requested"):
+            sampler.check_capacity(7)